@@ -64,6 +64,34 @@ def register_unregister_modules(module_names: list, register: bool):
 # icon dict to store.... something in
 preview_collections = {}
 
+# Cached result of is_dark_theme(). Cleared when the theme is edited or a
+# file is loaded, so the popover doesn't recompute it on every redraw.
+dark_theme_cache = None
+theme_msgbus_owner = object()
+
+
+def clear_theme_cache(*args):
+    global dark_theme_cache
+    dark_theme_cache = None
+
+
+def subscribe_theme_changes():
+    bpy.msgbus.clear_by_owner(theme_msgbus_owner)
+    for key in ((bpy.types.ThemeWidgetColors, "inner"), bpy.types.Theme):
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=theme_msgbus_owner,
+            args=(),
+            notify=clear_theme_cache,
+        )
+
+
+@bpy.app.handlers.persistent
+def on_load_post(*args):
+    # Loading a file clears all message bus subscriptions
+    clear_theme_cache()
+    subscribe_theme_changes()
+
 def register():
     # icon registration
     global preview_collections
@@ -85,6 +113,10 @@ def register():
     TOPBAR_MT_editor_menus.append(panels.draw_popover)
     VIEW3D_MT_editor_menus.append(panels.draw_popover)
 
+    clear_theme_cache()
+    subscribe_theme_changes()
+    bpy.app.handlers.load_post.append(on_load_post)
+
 
 def unregister():
     # icon removal
@@ -100,6 +132,10 @@ def unregister():
     TOPBAR_MT_editor_menus.remove(panels.draw_popover)
     VIEW3D_MT_editor_menus.remove(panels.draw_popover)
 
+    bpy.msgbus.clear_by_owner(theme_msgbus_owner)
+    if on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load_post)
+
     # Note: Scene.batch_export is intentionally NOT deleted on unregister.
     # Removing it would break access to the user's per-scene settings stored
     # in the .blend file if the addon is re-enabled in the same session.
@@ -116,12 +152,15 @@ def is_dark_theme():
 
 def get_icon_id(icon_name):
     """Helper function to get icon ID, switching based on theme luminance"""
+    global dark_theme_cache
     if "main" in preview_collections:
         pcoll = preview_collections["main"]
         
         # Determine if we need the light or dark version
         # Note: Your register() loads 'batchexport_icon_light' and 'batchexport_icon_dark'
-        suffix = "_dark" if is_dark_theme() else "_light"
+        if dark_theme_cache is None:
+            dark_theme_cache = is_dark_theme()
+        suffix = "_dark" if dark_theme_cache else "_light"
         theme_icon_name = f"{icon_name}{suffix}"
         
         if theme_icon_name in pcoll:
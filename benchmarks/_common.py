@@ -0,0 +1,23 @@
+"""
+Helpers shared by the benchmark scripts. The benchmarks run inside
+Blender, e.g.:
+
+    blender -b --factory-startup --python benchmarks/preset_loading.py -- --jobs 5000
+"""
+import importlib
+import sys
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).resolve().parents[1]
+
+
+def script_args():
+    """Returns the arguments after Blender's '--' separator."""
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+
+def import_addon():
+    """Imports the add-on package from this checkout (without registering it)."""
+    if str(ADDON_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(ADDON_DIR.parent))
+    return importlib.import_module(ADDON_DIR.name)
@@ -0,0 +1,257 @@
+"""
+Batch export throughput benchmark on synthetic scenes.
+
+Builds a scene of configurable size, then runs the batch export for every
+combination of export mode and file format, recording jobs per second,
+peak memory (RSS) and bytes written:
+
+    blender -b --factory-startup --python benchmarks/export_throughput.py -- \
+        --objects 500 --depth 3 --chain 2 --modifiers 2 --linked 0.25 --out before.json
+
+Compare two result files (this part also runs with a plain python):
+
+    python benchmarks/export_throughput.py --diff before.json after.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from _common import ADDON_DIR, script_args
+
+MODES = [
+    'OBJECTS',
+    'PARENT_OBJECTS',
+    'COLLECTIONS',
+    'COLLECTION_SUBDIRECTORIES',
+    'COLLECTION_SUBDIR_PARENTS',
+    'SCENE',
+]
+# SVG and PDF need Grease Pencil objects, which the synthetic scene doesn't have
+FORMATS = ['FBX', 'glTF', 'OBJ', 'PLY', 'STL', 'USD', 'ABC']
+
+MODIFIERS = [
+    ('BEVEL', {'width': 0.02, 'segments': 1}),
+    ('SUBSURF', {'levels': 1, 'render_levels': 1}),
+    ('TRIANGULATE', {}),
+    ('WEIGHTED_NORMAL', {}),
+]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="export_throughput.py")
+    parser.add_argument("--objects", type=int, default=200, help="Number of mesh objects")
+    parser.add_argument("--depth", type=int, default=2, help="Depth of the collection hierarchy")
+    parser.add_argument("--collections", type=int, default=4, help="Child collections per collection")
+    parser.add_argument("--chain", type=int, default=1, help="Length of parent chains (1 = no parenting)")
+    parser.add_argument("--modifiers", type=int, default=1, help=f"Modifiers per object (max {len(MODIFIERS)})")
+    parser.add_argument("--linked", type=float, default=0.0, help="Fraction of objects that are linked duplicates")
+    parser.add_argument("--subdivisions", type=int, default=8, help="Grid resolution of each mesh")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument("--out", help="Where to write the JSON results")
+    parser.add_argument("--diff", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two result files")
+    return parser.parse_args(argv)
+
+
+# ---------------------------------------------------------------------
+# Scene creation
+# ---------------------------------------------------------------------
+
+def grid_mesh(name, resolution):
+    import bpy
+    verts = [(x / resolution, y / resolution, ((x * y) % 3) * 0.01)
+             for y in range(resolution + 1) for x in range(resolution + 1)]
+    faces = [(y * (resolution + 1) + x, y * (resolution + 1) + x + 1,
+              (y + 1) * (resolution + 1) + x + 1, (y + 1) * (resolution + 1) + x)
+             for y in range(resolution) for x in range(resolution)]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    return mesh
+
+
+def build_collections(root, depth, per_level):
+    """Returns the leaf collections of a tree `depth` levels deep."""
+    import bpy
+    level = [root]
+    for d in range(depth):
+        next_level = []
+        for parent in level:
+            for i in range(per_level):
+                coll = bpy.data.collections.new(f"{parent.name}_{i}" if d else f"Coll_{i}")
+                parent.children.link(coll)
+                next_level.append(coll)
+        level = next_level
+    return level
+
+
+def build_scene(args):
+    import bpy
+    scene = bpy.context.scene
+    # Start from an empty scene (the factory startup has a cube, camera and light)
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    leaves = build_collections(scene.collection, args.depth, args.collections)
+    shared_mesh = grid_mesh("SharedMesh", args.subdivisions)
+    linked_every = int(1 / args.linked) if args.linked > 0 else 0
+
+    previous = None
+    for i in range(args.objects):
+        if linked_every and i % linked_every == 0:
+            mesh = shared_mesh
+        else:
+            mesh = grid_mesh(f"Mesh_{i}", args.subdivisions)
+        obj = bpy.data.objects.new(f"Obj_{i}", mesh)
+        obj.location = (i % 50 * 2.0, i // 50 * 2.0, 0.0)
+        leaves[i % len(leaves)].objects.link(obj)
+
+        for mod_type, props in MODIFIERS[:args.modifiers]:
+            mod = obj.modifiers.new(mod_type.title(), mod_type)
+            for key, value in props.items():
+                setattr(mod, key, value)
+
+        # Every `chain` objects form a parent chain
+        if args.chain > 1 and i % args.chain and previous is not None:
+            obj.parent = previous
+        previous = obj
+
+    bpy.context.view_layer.update()
+    return scene
+
+
+# ---------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------
+
+def peak_rss_mb():
+    """Peak memory of the process so far. It only ever grows, so later combinations include earlier peaks."""
+    import resource
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def directory_stats(directory):
+    files = 0
+    size = 0
+    for root, _dirs, names in os.walk(directory):
+        for name in names:
+            if name.startswith(".sdbe"):
+                continue
+            files += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return files, size
+
+
+def run_combination(scene, mode, file_format, out_dir):
+    import bpy
+    settings = scene.batch_export
+    settings.mode = mode
+    settings.file_format = file_format
+    settings.limit = 'VISIBLE'
+    settings.directory = str(out_dir) + os.sep
+    settings.object_types = {'MESH'}
+
+    start = time.perf_counter()
+    status = bpy.ops.export_mesh.batch()
+    seconds = time.perf_counter() - start
+
+    files, size = directory_stats(out_dir)
+    return {
+        'mode': mode,
+        'format': file_format,
+        'status': sorted(status)[0],
+        'jobs': files,
+        'seconds': seconds,
+        'jobs_per_second': files / seconds if seconds else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+        'bytes': size,
+    }
+
+
+def addon_version():
+    import tomllib
+    with open(ADDON_DIR / "blender_manifest.toml", 'rb') as f:
+        return tomllib.load(f).get('version', "")
+
+
+def run_benchmark(args):
+    import bpy
+    import addon_utils
+
+    if str(ADDON_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(ADDON_DIR.parent))
+    addon_utils.enable(ADDON_DIR.name, default_set=False)
+
+    start = time.perf_counter()
+    scene = build_scene(args)
+    print(f"Built scene with {len(scene.objects)} objects in {time.perf_counter() - start:.2f}s")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="sdbe_bench_") as tmp:
+        for mode in args.modes.split(","):
+            for file_format in args.formats.split(","):
+                out_dir = Path(tmp) / f"{mode}_{file_format}"
+                out_dir.mkdir()
+                result = run_combination(scene, mode, file_format, out_dir)
+                results.append(result)
+                print(f"{mode:26} {file_format:5} {result['jobs']:6} jobs  {result['seconds']:8.2f}s  "
+                      f"{result['jobs_per_second']:8.1f} jobs/s  {result['peak_rss_mb']:8.1f} MB  "
+                      f"{result['bytes'] / 1e6:8.2f} MB written")
+
+    return {
+        'meta': {
+            'blender': bpy.app.version_string,
+            'addon': addon_version(),
+            'params': {k: v for k, v in vars(args).items() if k not in ('out', 'diff')},
+        },
+        'results': results,
+    }
+
+
+# ---------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------
+
+def diff_results(before_path, after_path):
+    with open(before_path, 'r', encoding='utf-8') as f:
+        before = json.load(f)
+    with open(after_path, 'r', encoding='utf-8') as f:
+        after = json.load(f)
+
+    if before['meta']['params'] != after['meta']['params']:
+        print("Warning: the runs used different scene parameters")
+    print(f"before: add-on {before['meta']['addon']}, Blender {before['meta']['blender']}")
+    print(f"after:  add-on {after['meta']['addon']}, Blender {after['meta']['blender']}")
+
+    after_by_key = {(r['mode'], r['format']): r for r in after['results']}
+    print(f"{'mode':26} {'format':6} {'jobs/s before':>14} {'jobs/s after':>13} {'change':>8} {'RSS MB':>16}")
+    for old in before['results']:
+        new = after_by_key.get((old['mode'], old['format']))
+        if new is None:
+            continue
+        change = (new['jobs_per_second'] / old['jobs_per_second'] - 1.0) * 100 if old['jobs_per_second'] else 0.0
+        print(f"{old['mode']:26} {old['format']:6} {old['jobs_per_second']:14.1f} {new['jobs_per_second']:13.1f} "
+              f"{change:+7.1f}% {old['peak_rss_mb']:7.1f} > {new['peak_rss_mb']:7.1f}")
+
+
+def main():
+    argv = sys.argv[1:] if "bpy" not in sys.modules else script_args()
+    args = parse_args(argv)
+    if args.diff:
+        diff_results(*args.diff)
+        return
+
+    data = run_benchmark(args)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        print(f"Results written to {args.out}")
+
+
+main()
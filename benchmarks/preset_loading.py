@@ -0,0 +1,103 @@
+"""
+Measures the per-job cost of loading an export preset, comparing the
+original lookup (walk the script paths, re-read the file and eval() every
+value on each call) with the cached loader in utils.load_operator_preset.
+
+    blender -b --factory-startup --python benchmarks/preset_loading.py -- --jobs 5000
+
+A temporary FBX preset is written to the user presets directory and
+removed again afterwards.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(__file__))
+from _common import import_addon, script_args
+
+OPERATOR = "export_scene.fbx"
+PRESET = "sdbe_benchmark_preset"
+PRESET_BODY = """import bpy
+op = bpy.context.active_operator
+
+op.filepath = ''
+op.use_selection = True
+op.global_scale = 1.0
+op.apply_unit_scale = True
+op.apply_scale_options = 'FBX_SCALE_NONE'
+op.object_types = {'EMPTY', 'ARMATURE', 'MESH', 'OTHER'}
+op.use_mesh_modifiers = True
+op.mesh_smooth_type = 'OFF'
+op.use_tspace = False
+op.add_leaf_bones = True
+op.primary_bone_axis = 'Y'
+op.bake_anim = True
+op.bake_anim_step = 1.0
+op.bake_anim_simplify_factor = 1.0
+op.path_mode = 'AUTO'
+op.axis_forward = '-Z'
+op.axis_up = 'Y'
+"""
+
+
+def load_preset_uncached(operator, preset):
+    """The preset loader as it was before caching, kept for comparison."""
+    options = {}
+    for d in bpy.utils.script_paths(subdir="presets/operator/" + operator):
+        fp = "".join([d, "/", preset, ".py"])
+        if os.path.isfile(fp):
+            print("Using preset " + fp)
+            file = open(fp, 'r')
+            for line in file.readlines():
+                if line.startswith("op."):
+                    line = line.removeprefix("op.")
+                    split = line.split(" = ")
+                    options[split[0]] = eval(split[1])
+            file.close()
+            return options
+    return options
+
+
+def time_per_call(func, jobs):
+    # Both loaders print per (re)load; keep that out of the measurement output
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(jobs):
+            options = func(OPERATOR, PRESET)
+            options.update({"filepath": "/tmp/x.fbx"})
+        elapsed = time.perf_counter() - start
+    return elapsed / jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="preset_loading.py")
+    parser.add_argument("--jobs", type=int, default=5000, help="Number of simulated export jobs")
+    args = parser.parse_args(script_args())
+
+    utils = import_addon().utils
+    preset_dir = bpy.utils.user_resource('SCRIPTS', path="presets/operator/" + OPERATOR, create=True)
+    preset_path = os.path.join(preset_dir, PRESET + ".py")
+    with open(preset_path, 'w') as f:
+        f.write(PRESET_BODY)
+
+    try:
+        assert load_preset_uncached(OPERATOR, PRESET) == utils.load_operator_preset(OPERATOR, PRESET)
+        before = time_per_call(load_preset_uncached, args.jobs)
+        utils.preset_cache.clear()
+        after = time_per_call(utils.load_operator_preset, args.jobs)
+    finally:
+        os.remove(preset_path)
+        utils.preset_cache.clear()
+
+    print(f"Preset loading over {args.jobs} jobs:")
+    print(f"  before (uncached, eval): {before * 1e6:9.1f} us/job  {before * args.jobs:8.3f} s total")
+    print(f"  after  (cached, literal): {after * 1e6:8.1f} us/job  {after * args.jobs:8.3f} s total")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+main()
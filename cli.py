@@ -0,0 +1,209 @@
+"""
+Command line entry point for running a batch export without the UI.
+
+    blender -b scene.blend --python <add-on dir>/cli.py -- --config job.json
+
+or, with the add-on enabled, from its installed module:
+
+    blender -b scene.blend --python-expr "from bl_ext.user_default.SuperDuperBatchExporter import cli; cli.main()" -- --config job.json
+
+The config file is JSON. Every key is optional:
+
+    {
+        "scene": "Scene",
+        "settings": {"file_format": "FBX", "mode": "OBJECTS", "directory": "//export/", "object_types": ["MESH"]},
+        "preferences": {"project_dir": "/mnt/project", "worker_count": 8},
+        "result": "result.json"
+    }
+
+"settings" overrides the scene's Batch Export settings and "preferences"
+the add-on preferences, for this run only (nothing is saved). Export
+profiles are given as a list of option dicts, e.g.
+"profiles": [{"name": "Engine", "file_format": "FBX", "create_lod": true}]
+along with "use_profiles": true. The result
+file gets the status, file counts and messages of the run. With
+"continue_on_error": true a failing job doesn't stop the export; the
+other jobs are still exported, the failed ones are listed under
+"failures" in the result file and the status is "PARTIAL".
+
+Exit codes: 0 on success, 1 if the export failed, 2 for a bad command
+line or config file, 3 if the export finished but some jobs failed.
+"""
+import bpy
+import addon_utils
+import argparse
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_BAD_CONFIG = 2
+EXIT_PARTIAL = 3
+
+
+class ConfigError(Exception):
+    pass
+
+
+def parse_args(argv=None):
+    """Parses the arguments after Blender's '--' separator."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="blender -b file.blend --python cli.py --",
+        description="Run a Super Duper Batch Export without the UI.",
+    )
+    parser.add_argument("--config", help="JSON file with settings and preferences overrides")
+    parser.add_argument("--result", help="Where to write the JSON result (overrides 'result' in the config)")
+    parser.add_argument("--scene", help="Name of the scene to export (overrides 'scene' in the config)")
+    return parser.parse_args(argv)
+
+
+def load_config(path):
+    if not path:
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"Could not read config '{path}': {e}")
+    if not isinstance(config, dict):
+        raise ConfigError("The config must be a JSON object")
+    return config
+
+
+def find_addon_module():
+    """
+    Returns the module name of this add-on, enabling it if needed. When
+    run with --python this file isn't imported as part of its package, so
+    the add-on is found by its location on disk.
+    """
+    if __package__:
+        package = __package__
+    else:
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        package = None
+        for mod in addon_utils.modules():
+            if os.path.dirname(os.path.abspath(mod.__file__)) == this_dir:
+                package = mod.__name__
+                break
+        if package is None:
+            raise ConfigError(f"No installed add-on found at {this_dir}")
+
+    if package not in bpy.context.preferences.addons:
+        addon_utils.enable(package, default_set=False)
+        if package not in bpy.context.preferences.addons:
+            raise ConfigError(f"Could not enable the add-on '{package}'")
+    return package
+
+
+def apply_overrides(struct, overrides, label):
+    """Sets RNA properties on `struct` from a dict, checking names and types."""
+    if not isinstance(overrides, dict):
+        raise ConfigError(f"'{label}' must be a JSON object")
+    props = struct.bl_rna.properties
+    for key, value in overrides.items():
+        if key not in props or (props[key].is_readonly and props[key].type != 'COLLECTION'):
+            raise ConfigError(f"Unknown {label} option '{key}'")
+        prop = props[key]
+        try:
+            if key == 'export_list':
+                # A list of object names
+                struct.export_list.clear()
+                for name in value:
+                    obj = bpy.data.objects.get(name)
+                    if obj is None:
+                        raise ConfigError(f"Object '{name}' in 'export_list' not found")
+                    struct.export_list.add().object = obj
+            elif key == 'profiles':
+                # A list of export profiles, each a dict of profile options
+                struct.profiles.clear()
+                for profile_overrides in value:
+                    apply_overrides(struct.profiles.add(), profile_overrides, "profile")
+            elif prop.type == 'ENUM' and prop.is_enum_flag:
+                setattr(struct, key, set(value))
+            else:
+                setattr(struct, key, value)
+        except (TypeError, ValueError, AttributeError) as e:
+            raise ConfigError(f"Invalid value for {label} option '{key}': {e}")
+
+
+def write_result(path, result):
+    if not path:
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=1)
+
+
+def read_result(path):
+    """Returns the result the operator wrote to `path`, or an empty dict."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def exit_code(status, result):
+    """The exit code for the operator's return `status` and the `result` it wrote."""
+    if 'FINISHED' not in status:
+        return EXIT_FAILED
+    if result.get('failures'):
+        return EXIT_PARTIAL
+    return EXIT_OK
+
+
+def main(argv=None):
+    """Runs the export and exits Blender with the appropriate exit code."""
+    sys.exit(run(argv))
+
+
+def run(argv=None):
+    """Runs the export and returns the exit code."""
+    args = parse_args(argv)
+    result_path = None
+    try:
+        config = load_config(args.config)
+        result_path = args.result or config.get('result')
+        if result_path:
+            result_path = os.path.abspath(bpy.path.abspath(result_path))
+
+        package = find_addon_module()
+
+        scene_name = args.scene or config.get('scene')
+        if scene_name:
+            scene = bpy.data.scenes.get(scene_name)
+            if scene is None:
+                raise ConfigError(f"Scene '{scene_name}' not found")
+        else:
+            scene = bpy.context.scene
+
+        apply_overrides(scene.batch_export, config.get('settings', {}), "settings")
+        apply_overrides(bpy.context.preferences.addons[package].preferences,
+                        config.get('preferences', {}), "preferences")
+    except ConfigError as e:
+        print(f"Batch export config error: {e}")
+        write_result(result_path, {'status': 'CANCELLED', 'error': str(e)})
+        return EXIT_BAD_CONFIG
+
+    # The operator only returns its status, so the failed jobs are read
+    # back from its result file (a temporary one if none was asked for)
+    with tempfile.TemporaryDirectory(prefix="sdbe_cli_") as tmp_dir:
+        op_result_path = result_path or os.path.join(tmp_dir, "result.json")
+        try:
+            with bpy.context.temp_override(scene=scene, view_layer=scene.view_layers[0]):
+                status = bpy.ops.export_mesh.batch(result_path=op_result_path)
+        except Exception as e:
+            traceback.print_exc()
+            write_result(result_path, {'status': 'CANCELLED', 'error': str(e)})
+            return EXIT_FAILED
+        result = read_result(op_result_path)
+
+    return exit_code(status, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Copies run next to the export, so a slow destination share doesn't hold
+# up the next job. A few threads are enough to keep a network link busy.
+COPY_THREADS = 4
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# ioctl request number of FICLONE (copy-on-write clone) on Linux.
+FICLONE = 0x40049409
+
+COPIED = 'COPIED'
+UNCHANGED = 'UNCHANGED'
+
+
+def file_digest(path):
+    h = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.digest()
+
+
+def files_match(src, dst):
+    """True if `dst` exists with the same size and content as `src`."""
+    try:
+        if os.stat(src).st_size != os.stat(dst).st_size:
+            return False
+    except OSError:
+        return False
+    return file_digest(src) == file_digest(dst)
+
+
+def _reflink(src, dst):
+    """Clones `src` to `dst` as a copy-on-write reflink (Btrfs, XFS, ...)."""
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+
+def _copy_range(src, dst):
+    """Copies in the kernel with copy_file_range, avoiding a round trip through user space."""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+    return remaining == 0
+
+
+def copy_file(src, dst, use_hardlinks=False):
+    """
+    Copies `src` to `dst`, skipping the copy if `dst` already has the same
+    content. Hardlinks (if allowed), reflinks and copy_file_range are tried
+    before a plain copy. The file is written under a temporary name and
+    moved into place, so `dst` is never left half written.
+    Returns COPIED or UNCHANGED.
+    """
+    src, dst = Path(src), Path(dst)
+    if files_match(src, dst):
+        return UNCHANGED
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process and thread, so workers copying to the same
+    # destination don't write into each other's temporary file
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.{threading.get_ident()}.sdbe_tmp")
+    try:
+        same_device = os.stat(src).st_dev == os.stat(dst.parent).st_dev
+        linked = False
+        if same_device and use_hardlinks:
+            try:
+                if tmp.exists():
+                    tmp.unlink()
+                os.link(src, tmp)
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            if not ((same_device and _reflink(src, tmp)) or _copy_range(src, tmp)):
+                shutil.copyfile(src, tmp)
+            shutil.copymode(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+    return COPIED
+
+
+class CopyQueue:
+    """
+    Copies files on a background thread pool. Call wait() at the end of
+    the run to let the queue drain and collect the outcome.
+    """
+
+    def __init__(self, use_hardlinks=False, threads=COPY_THREADS):
+        self.use_hardlinks = use_hardlinks
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="sdbe_copy")
+        self.pending = []
+
+    def submit(self, src, dst):
+        future = self.executor.submit(copy_file, src, dst, self.use_hardlinks)
+        self.pending.append((Path(src), Path(dst), future))
+
+    def wait(self):
+        """
+        Waits for all queued copies. Returns (copied, unchanged, failures)
+        where failures is a list of (destination, error message).
+        """
+        copied = unchanged = 0
+        failures = []
+        for _src, dst, future in self.pending:
+            try:
+                outcome = future.result()
+            except Exception as e:
+                failures.append((str(dst), str(e)))
+                continue
+            if outcome == UNCHANGED:
+                unchanged += 1
+            else:
+                copied += 1
+                print(f"Copied to: {dst}")
+        self.pending.clear()
+        self.executor.shutdown()
+        return copied, unchanged, failures
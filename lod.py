@@ -0,0 +1,284 @@
+import bpy
+import hashlib
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from . import simplify
+
+# Bump when the stored arrays or the decimation change, so old entries are ignored.
+LOD_CACHE_VERSION = 2
+
+# Threads simplifying LOD meshes in the background. One core is left for
+# the main thread, which keeps exporting meanwhile.
+SIMPLIFY_THREADS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def cache_directory():
+    """
+    Where decimated LOD meshes are kept between runs: the extension's user
+    directory, or the temporary directory when installed as a legacy add-on.
+    """
+    try:
+        return Path(bpy.utils.extension_path_user(__package__, path="lod_cache", create=True))
+    except ValueError:
+        directory = Path(tempfile.gettempdir()) / "sdbe_lod_cache"
+        directory.mkdir(exist_ok=True)
+        return directory
+
+
+def clear_cache():
+    """Deletes every cached LOD mesh. Returns how many were deleted."""
+    directory = cache_directory()
+    count = 0
+    for path in directory.glob("*.npz"):
+        try:
+            path.unlink()
+            count += 1
+        except OSError:
+            pass
+    return count
+
+
+def level_key(source_digest, ratios, method='DECIMATE'):
+    """
+    Cache key of an LOD level: the source mesh, the simplifier, and the
+    chain of decimate ratios that leads to the level (each applied to the
+    previous level).
+    """
+    h = hashlib.sha1()
+    h.update(f"v{LOD_CACHE_VERSION} {bpy.app.version_string} {method} {source_digest}".encode())
+    for ratio in ratios:
+        h.update(f" {ratio:.6f}".encode())
+    return h.hexdigest()
+
+
+def _get(collection, attr, dtype, width=1):
+    arr = np.empty(len(collection) * width, dtype=dtype)
+    if len(arr):
+        collection.foreach_get(attr, arr)
+    return arr
+
+
+# Mesh attributes mesh_arrays() stores, besides the UV maps. Internal
+# attributes (starting with '.') are topology or editing state.
+STORED_ATTRIBUTES = {'position', 'material_index', 'sharp_face'}
+
+
+def is_cacheable(mesh):
+    """
+    True if mesh_arrays() stores everything the exporters write of the
+    mesh, so a cached LOD exports the same as a freshly decimated one.
+    Meshes with colors, creases, sharp edges, custom normals or other
+    attributes aren't cached.
+    """
+    if mesh.has_custom_normals:
+        return False
+    uv_names = {layer.name for layer in mesh.uv_layers}
+    return all(
+        attribute.name.startswith('.') or attribute.name in STORED_ATTRIBUTES or attribute.name in uv_names
+        for attribute in mesh.attributes
+    )
+
+
+def mesh_arrays(mesh):
+    """The parts of a mesh an LOD needs, as flat NumPy arrays."""
+    arrays = {
+        'co': _get(mesh.vertices, 'co', np.float32, 3),
+        'vertex_index': _get(mesh.loops, 'vertex_index', np.int32),
+        'loop_start': _get(mesh.polygons, 'loop_start', np.int32),
+        'material_index': _get(mesh.polygons, 'material_index', np.int32),
+        'use_smooth': _get(mesh.polygons, 'use_smooth', bool),
+        'uv_names': np.array([layer.name for layer in mesh.uv_layers], dtype=str),
+    }
+    for i, layer in enumerate(mesh.uv_layers):
+        arrays[f'uv{i}'] = _get(layer.uv, 'vector', np.float32, 2)
+    return arrays
+
+
+def mesh_from_arrays(name, arrays, materials=()):
+    """Builds a new mesh from mesh_arrays() output, with the given materials."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(arrays['co']) // 3)
+    mesh.loops.add(len(arrays['vertex_index']))
+    mesh.polygons.add(len(arrays['loop_start']))
+    mesh.vertices.foreach_set('co', arrays['co'])
+    mesh.loops.foreach_set('vertex_index', arrays['vertex_index'])
+    mesh.polygons.foreach_set('loop_start', arrays['loop_start'])
+    mesh.polygons.foreach_set('material_index', arrays['material_index'])
+    mesh.polygons.foreach_set('use_smooth', arrays['use_smooth'])
+    for i, uv_name in enumerate(arrays['uv_names']):
+        mesh.uv_layers.new(name=str(uv_name)).uv.foreach_set('vector', arrays[f'uv{i}'])
+    mesh.update(calc_edges=True)
+    for material in materials:
+        mesh.materials.append(material)
+    return mesh
+
+
+def triangle_arrays(mesh):
+    """
+    The mesh's triangles and the attributes an LOD keeps, as flat NumPy
+    arrays for simplify_levels(). Read on the main thread; the arrays can
+    then be simplified on any thread.
+    """
+    mesh.calc_loop_triangles()
+    arrays = {
+        'co': _get(mesh.vertices, 'co', np.float32, 3),
+        'tri_vertices': _get(mesh.loop_triangles, 'vertices', np.int32, 3),
+        'tri_loops': _get(mesh.loop_triangles, 'loops', np.int32, 3),
+        'tri_polygons': _get(mesh.loop_triangles, 'polygon_index', np.int32),
+        'material_index': _get(mesh.polygons, 'material_index', np.int32),
+        'use_smooth': _get(mesh.polygons, 'use_smooth', bool),
+        'uv_names': np.array([layer.name for layer in mesh.uv_layers], dtype=str),
+    }
+    for i, layer in enumerate(mesh.uv_layers):
+        arrays[f'uv{i}'] = _get(layer.uv, 'vector', np.float32, 2)
+    return arrays
+
+
+def _uv_wedges(arrays, loops):
+    """An id per triangle corner that's the same for corners with the same UVs, marking the UV seams."""
+    uvs = [arrays[f'uv{i}'].reshape(-1, 2)[loops.ravel()] for i in range(len(arrays['uv_names']))]
+    if not uvs:
+        return None
+    return np.unique(np.hstack(uvs), axis=0, return_inverse=True)[1].ravel()
+
+
+def simplify_levels(arrays, steps):
+    """
+    Simplifies triangle_arrays() output to each LOD level in `steps`, a
+    list of (parent, ratio): the level is `parent` (the index of an earlier
+    level, or -1 for the full mesh) reduced to `ratio` of its faces.
+    Returns a mesh_arrays() dict per level. Only uses NumPy, so it can run
+    on a background thread.
+    """
+    uv_count = len(arrays['uv_names'])
+    source = (
+        arrays['co'].reshape(-1, 3),
+        arrays['tri_vertices'].reshape(-1, 3),
+        arrays['tri_loops'].reshape(-1, 3),
+        arrays['tri_polygons'],
+    )
+    simplified = []
+    levels = []
+    for parent, ratio in steps:
+        co, tris, loops, polygons = source if parent < 0 else simplified[parent]
+        co, tris, corners, faces = simplify.simplify(co, tris, ratio, _uv_wedges(arrays, loops))
+        # Map the kept corners back to the source mesh's loops and polygons
+        loops = loops.ravel()[corners]
+        polygons = polygons[faces]
+        simplified.append((co, tris, loops, polygons))
+
+        level = {
+            'co': co.astype(np.float32).ravel(),
+            'vertex_index': tris.astype(np.int32).ravel(),
+            'loop_start': np.arange(0, tris.size, 3, dtype=np.int32),
+            'material_index': arrays['material_index'][polygons],
+            'use_smooth': arrays['use_smooth'][polygons],
+            'uv_names': arrays['uv_names'],
+        }
+        for i in range(uv_count):
+            level[f'uv{i}'] = arrays[f'uv{i}'].reshape(-1, 2)[loops.ravel()].ravel()
+        levels.append(level)
+    return levels
+
+
+def decimate(mesh, ratio, collection):
+    """
+    Returns a new mesh with `mesh` decimated to `ratio` of its faces by a
+    collapse DECIMATE modifier, evaluated on a temporary object in `collection`.
+    """
+    obj = bpy.data.objects.new("SDBE_Decimate", mesh)
+    collection.objects.link(obj)
+    try:
+        mod = obj.modifiers.new(name='DecimateLOD', type='DECIMATE')
+        mod.ratio = ratio
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        return bpy.data.meshes.new_from_object(
+            obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph,
+        )
+    finally:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+
+class LODCache:
+    """Decimated LOD meshes stored as compressed NumPy archives, one file per level."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else cache_directory()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return self.directory / f"{key}.npz"
+
+    def load(self, key):
+        """Returns the arrays stored for `key`, or None if there are none (or they can't be read)."""
+        path = self.path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arrays
+
+    def save(self, key, arrays):
+        """Stores arrays under `key`. Written to a temporary file first, as workers may share the cache."""
+        path = self.path(key)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Could not write LOD cache entry: {e}")
+            if tmp.exists():
+                tmp.unlink()
+
+
+class BackgroundSimplifier:
+    """
+    Runs simplify_levels() on a thread pool, so the LODs of upcoming jobs
+    are made while the main thread exports. NumPy releases the GIL for most
+    of the work. Results are looked up by object, LOD steps and frame (an
+    object's mesh differs per frame of a frame sequence), and only used if
+    the object's mesh still has the digest it was read with.
+    """
+
+    def __init__(self, threads=SIMPLIFY_THREADS):
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="sdbe_lod")
+        self.pending = {}  # (object session_uid, steps, frame) -> (job index, mesh digest, future)
+
+    def submit(self, obj, steps, digest, arrays, job_index, frame=None):
+        key = (obj.session_uid, steps, frame)
+        if key not in self.pending:
+            self.pending[key] = (job_index, digest, self.executor.submit(simplify_levels, arrays, steps))
+
+    def take(self, obj, steps, digest, frame=None):
+        """Waits for and returns the levels submitted for an object, or None if there are none for this mesh."""
+        entry = self.pending.pop((obj.session_uid, steps, frame), None)
+        if entry is None or entry[1] != digest:
+            if entry is not None:
+                entry[2].cancel()
+            return None
+        return entry[2].result()
+
+    def discard_before(self, job_index):
+        """Drops the results of jobs before `job_index` that were never taken (e.g. skipped jobs)."""
+        for key, (index, _digest, future) in list(self.pending.items()):
+            if index < job_index:
+                future.cancel()
+                del self.pending[key]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
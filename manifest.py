@@ -0,0 +1,480 @@
+import bpy
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Name of the manifest file written next to the exported files.
+MANIFEST_NAME = ".sdbe_manifest.json"
+MANIFEST_VERSION = 1
+
+# Name of the journal of the files written by a run that hasn't finished.
+JOURNAL_NAME = ".sdbe_journal.jsonl"
+
+# Settings that don't change what ends up in the exported files, so
+# changing them shouldn't invalidate every job.
+_UNHASHED_SETTINGS = {
+    'rna_type',
+    'name',
+    'export_list',
+    'export_list_index',
+    'profiles_index',
+    'incremental',
+    'use_journal',
+    'resume_export',
+    'continue_on_error',
+    'retry_failed',
+    'modal_export',
+    'write_profile',
+    'profile_top_n',
+    'prepare_once',
+    'use_sandbox',
+    'cache_evaluated',
+    'dedupe_outputs',
+    'lod_cache',
+    'copy_on_export',
+    'copy_directory',
+    'copy_use_hardlinks',
+}
+
+
+def _update_array(h, collection, attr, dtype, width=1):
+    """Feeds a bulk foreach_get() read of `attr` into the hash."""
+    arr = np.empty(len(collection) * width, dtype=dtype)
+    if len(arr):
+        collection.foreach_get(attr, arr)
+    h.update(arr.tobytes())
+
+
+def _update_value(h, value):
+    """Feeds a plain python / RNA value into the hash."""
+    if isinstance(value, bpy.types.ID):
+        value = value.name_full
+    elif isinstance(value, (set, frozenset)):
+        value = tuple(sorted(value))
+    elif hasattr(value, '__len__') and not isinstance(value, str):
+        try:
+            value = tuple(value)
+        except TypeError:
+            pass
+    h.update(repr(value).encode())
+
+
+def _update_rna_props(h, struct, skip=()):
+    """
+    Hashes the simple (non-collection) RNA properties of a struct.
+    Pointer properties are hashed by the name of the datablock they
+    point to, so a Boolean modifier notices when its cutter changes.
+    """
+    for prop in struct.bl_rna.properties:
+        ident = prop.identifier
+        if ident in skip or ident == 'rna_type' or prop.type == 'COLLECTION':
+            continue
+        if prop.is_skip_save:
+            continue
+        try:
+            value = getattr(struct, ident)
+        except Exception:
+            continue
+        if prop.type == 'POINTER' and value is not None and not isinstance(value, bpy.types.ID):
+            continue
+        h.update(ident.encode())
+        _update_value(h, value)
+
+
+def _update_id_props(h, struct):
+    """Hashes custom (ID) properties, e.g. Geometry Nodes modifier inputs."""
+    for key in sorted(struct.keys()):
+        h.update(key.encode())
+        try:
+            _update_value(h, struct[key])
+        except Exception:
+            pass
+
+
+def _update_mesh(h, mesh):
+    _update_array(h, mesh.vertices, 'co', np.float32, 3)
+    _update_array(h, mesh.loops, 'vertex_index', np.int32)
+    _update_array(h, mesh.polygons, 'loop_total', np.int32)
+    _update_array(h, mesh.polygons, 'material_index', np.int32)
+    _update_array(h, mesh.polygons, 'use_smooth', bool)
+    for uv_layer in mesh.uv_layers:
+        h.update(uv_layer.name.encode())
+        _update_array(h, uv_layer.uv, 'vector', np.float32, 2)
+    if mesh.shape_keys:
+        for key_block in mesh.shape_keys.key_blocks:
+            h.update(key_block.name.encode())
+            _update_array(h, key_block.data, 'co', np.float32, 3)
+
+
+def _update_curve(h, curve):
+    _update_rna_props(h, curve)
+    for spline in curve.splines:
+        h.update(spline.type.encode())
+        _update_array(h, spline.points, 'co', np.float32, 4)
+        _update_array(h, spline.bezier_points, 'co', np.float32, 3)
+        _update_array(h, spline.bezier_points, 'handle_left', np.float32, 3)
+        _update_array(h, spline.bezier_points, 'handle_right', np.float32, 3)
+
+
+def _update_material(h, material):
+    if material is None:
+        h.update(b'<none>')
+        return
+    h.update(material.name_full.encode())
+    _update_rna_props(h, material)
+    if material.node_tree:
+        for node in material.node_tree.nodes:
+            h.update(node.bl_idname.encode())
+            h.update(node.name.encode())
+            for socket in node.inputs:
+                if hasattr(socket, 'default_value'):
+                    _update_value(h, socket.default_value)
+            image = getattr(node, 'image', None)
+            if image is not None:
+                h.update(image.filepath.encode())
+        for link in material.node_tree.links:
+            h.update(f"{link.from_node.name}.{link.from_socket.identifier}"
+                     f">{link.to_node.name}.{link.to_socket.identifier}".encode())
+
+
+def data_digest(data):
+    """
+    Returns a hex digest of an object's data block (mesh, curve, ...).
+    Geometry is read with foreach_get() so large meshes hash quickly.
+    """
+    h = hashlib.sha1()
+    if data is None:
+        return h.hexdigest()
+    h.update(type(data).__name__.encode())
+    if isinstance(data, bpy.types.Mesh):
+        _update_mesh(h, data)
+    elif isinstance(data, bpy.types.Curve):
+        _update_curve(h, data)
+    else:
+        _update_rna_props(h, data)
+    return h.hexdigest()
+
+
+def _update_fcurve(h, fcurve):
+    h.update(f"{fcurve.data_path}[{fcurve.array_index}] {fcurve.extrapolation}".encode())
+    _update_array(h, fcurve.keyframe_points, 'co', np.float32, 2)
+    _update_array(h, fcurve.keyframe_points, 'handle_left', np.float32, 2)
+    _update_array(h, fcurve.keyframe_points, 'handle_right', np.float32, 2)
+    h.update(' '.join(point.interpolation for point in fcurve.keyframe_points).encode())
+    for mod in fcurve.modifiers:
+        h.update(mod.type.encode())
+        _update_rna_props(h, mod)
+
+
+def _action_fcurves(action):
+    # Layered actions (Blender 4.4+) keep their F-curves in channel bags
+    layers = getattr(action, 'layers', None)
+    if layers:
+        return [fcurve for layer in layers for strip in layer.strips
+                for bag in strip.channelbags for fcurve in bag.fcurves]
+    return list(action.fcurves)
+
+
+def animation_digest(id_data):
+    """
+    Returns a hex digest of the keyframes, NLA strips and drivers animating
+    an ID (an object, its data or its shape keys), or '' if it has none.
+    """
+    anim = getattr(id_data, 'animation_data', None) if id_data is not None else None
+    if anim is None:
+        return ''
+    h = hashlib.sha1()
+    actions = [anim.action]
+    for track in anim.nla_tracks:
+        if not track.mute:
+            for strip in track.strips:
+                _update_rna_props(h, strip)
+                actions.append(strip.action)
+    for action in actions:
+        if action is None:
+            continue
+        h.update(action.name_full.encode())
+        for fcurve in _action_fcurves(action):
+            _update_fcurve(h, fcurve)
+    for fcurve in anim.drivers:
+        _update_fcurve(h, fcurve)
+        h.update(fcurve.driver.expression.encode())
+        for variable in fcurve.driver.variables:
+            for target in variable.targets:
+                h.update(f"{variable.type} {target.id.name_full if target.id else ''} {target.data_path}".encode())
+    return h.hexdigest()
+
+
+def modifiers_digest(obj):
+    """Returns a hex digest of an object's modifier stack."""
+    h = hashlib.sha1()
+    for mod in obj.modifiers:
+        h.update(mod.type.encode())
+        _update_rna_props(h, mod)
+        _update_id_props(h, mod)
+    return h.hexdigest()
+
+
+def profile_digest(profile, preset_options):
+    """Digest of an export profile's options, for jobs exported once per profile."""
+    h = hashlib.sha1()
+    _update_rna_props(h, profile, skip={'name', 'enabled'})
+    h.update(json.dumps(preset_options, sort_keys=True, default=repr).encode())
+    return h.hexdigest()
+
+
+class JobFingerprinter:
+    """
+    Computes a fingerprint for each export job. Everything that is the
+    same for the whole run (settings, preset options, Blender version) is
+    hashed once up front; per-object digests are cached for the run.
+    """
+
+    def __init__(self, settings, preset_options):
+        h = hashlib.sha1()
+        h.update(f"v{MANIFEST_VERSION} {bpy.app.version_string}".encode())
+        _update_rna_props(h, settings, skip=_UNHASHED_SETTINGS)
+        h.update(json.dumps(preset_options, sort_keys=True, default=repr).encode())
+        self.run_digest = h.hexdigest()
+        self._object_digests = {}
+        self._data_digests = {}
+        self._animation_digests = {}
+
+    def _animation_digest(self, id_data):
+        key = (type(id_data).__name__, id_data.name_full)
+        if key not in self._animation_digests:
+            self._animation_digests[key] = animation_digest(id_data)
+        return self._animation_digests[key]
+
+    def object_digest(self, obj, frame=None):
+        """
+        Digest of an object as it is now. In a frame sequence the world
+        matrix differs per frame, so it's cached per frame.
+        """
+        key = (obj.name_full, frame)
+        if key not in self._object_digests:
+            h = hashlib.sha1()
+            h.update(obj.name_full.encode())
+            h.update(obj.type.encode())
+            h.update(obj.parent.name_full.encode() if obj.parent else b'')
+            for row in obj.matrix_world:
+                _update_value(h, row)
+            _update_value(h, obj.rotation_mode)
+            if obj.data is not None:
+                data_key = obj.data.name_full
+                if data_key not in self._data_digests:
+                    self._data_digests[data_key] = data_digest(obj.data)
+                h.update(self._data_digests[data_key].encode())
+            h.update(modifiers_digest(obj).encode())
+            # Keyframes change the export of animated objects (and every frame
+            # of a frame sequence), without changing the data or transforms
+            for id_data in (obj, obj.data, getattr(obj.data, 'shape_keys', None)):
+                if id_data is not None:
+                    h.update(self._animation_digest(id_data).encode())
+            for slot in obj.material_slots:
+                h.update(slot.link.encode())
+                _update_material(h, slot.material)
+            _update_id_props(h, obj)
+            self._object_digests[key] = h.hexdigest()
+        return self._object_digests[key]
+
+    def job(self, job, output_path, profile_digest=''):
+        """
+        Returns the fingerprint of a job that writes to `output_path`, with
+        the digest of the export profile it's exported with, if any.
+        """
+        h = hashlib.sha1()
+        h.update(self.run_digest.encode())
+        h.update(profile_digest.encode())
+        h.update(str(output_path).encode())
+        frame = job.get('frame')
+        if frame is not None:
+            h.update(f"frame {frame}".encode())
+        for obj in sorted(job['objects'], key=lambda o: o.name_full):
+            h.update(self.object_digest(obj, frame).encode())
+        return h.hexdigest()
+
+
+class ExportManifest:
+    """
+    A JSON record of the files written by previous runs, keyed by their
+    path relative to the manifest. Each entry stores the job fingerprint
+    along with the size and modification time of the file that was written.
+    """
+
+    def __init__(self, path, entries=None):
+        self.path = Path(path)
+        self.entries = entries or {}
+        # Entries written during this run
+        self.recorded = {}
+
+    @classmethod
+    def load(cls, directory):
+        path = Path(directory) / MANIFEST_NAME
+        entries = {}
+        if path.is_file():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    entries = data.get('entries', {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable export manifest {path}: {e}")
+        return cls(path, entries)
+
+    def _key(self, filepath):
+        filepath = Path(filepath)
+        try:
+            return filepath.relative_to(self.path.parent).as_posix()
+        except ValueError:
+            return filepath.as_posix()
+
+    def is_current(self, filepath, fingerprint):
+        """True if `filepath` was written by a job with the same fingerprint and hasn't changed since."""
+        entry = self.entries.get(self._key(filepath))
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+    def record(self, filepath, fingerprint, source=None, **extra):
+        """
+        Stores the fingerprint for a file that was just written, or made
+        from the identical output `source` by a copy or hardlink.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+        entry = {
+            'fingerprint': fingerprint,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        if source is not None:
+            entry['source'] = self._key(source)
+        entry.update(extra)
+        key = self._key(filepath)
+        self.entries[key] = entry
+        self.recorded[key] = entry
+
+    def save(self):
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class ExportJournal:
+    """
+    An append-only record of the files written during a run, one JSON line
+    per file, written to disk as soon as the file is. If Blender crashes
+    part way, the next run can resume: jobs whose files are in the journal,
+    with the same fingerprint and unchanged since, are skipped.
+    Parallel workers append to the same file; each line is a single write.
+    """
+
+    def __init__(self, path, entries=None):
+        self.path = Path(path)
+        self.entries = entries or {}
+        self._fd = None
+
+    @classmethod
+    def open(cls, directory, resume=False, truncate=True):
+        """
+        Opens the journal in `directory` for appending. With `resume` the
+        entries of the interrupted run are read first; otherwise, with
+        `truncate`, they are discarded. `truncate` is for the process that
+        starts the run; workers joining it pass False.
+        """
+        path = Path(directory) / JOURNAL_NAME
+        entries = cls._read(path) if resume else {}
+        journal = cls(path, entries)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if truncate and not resume:
+            flags |= os.O_TRUNC
+        journal._fd = os.open(path, flags, 0o644)
+        if resume and truncate and not cls._ends_with_newline(path):
+            # End the line a crash cut short, or the first new entry would be
+            # appended to it and lost too
+            os.write(journal._fd, b"\n")
+        return journal
+
+    @staticmethod
+    def _ends_with_newline(path):
+        try:
+            with open(path, 'rb') as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except OSError:
+            return True
+
+    @staticmethod
+    def _read(path):
+        entries = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entries[entry['path']] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # The last line is cut short if the crash came while writing it
+                        continue
+        except OSError:
+            pass
+        return entries
+
+    def _key(self, filepath):
+        filepath = Path(filepath)
+        try:
+            return filepath.relative_to(self.path.parent).as_posix()
+        except ValueError:
+            return filepath.as_posix()
+
+    def is_done(self, filepath, fingerprint):
+        """True if the interrupted run wrote `filepath` with the same fingerprint, and it hasn't changed since."""
+        entry = self.entries.get(self._key(filepath))
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+    def record(self, filepath, fingerprint):
+        """Appends a file that was just written and makes sure it reached the disk."""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+        entry = {
+            'path': self._key(filepath),
+            'fingerprint': fingerprint,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        os.write(self._fd, (json.dumps(entry) + "\n").encode('utf-8'))
+        os.fsync(self._fd)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def remove(self):
+        """Deletes the journal once the run has finished; there's nothing left to resume."""
+        self.close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,129 @@
+import bpy
+from collections import OrderedDict
+
+from .manifest import modifiers_digest
+
+# Modifiers that exporters handle themselves instead of applying them (an
+# armature is exported as a skin), so objects with them aren't baked.
+UNBAKED_MODIFIERS = {'ARMATURE'}
+
+# Formats that can export animated geometry over a frame range, which a
+# mesh baked at one frame would freeze.
+UNBAKED_FORMATS = {'ABC', 'USD'}
+
+
+def mesh_bytes(mesh):
+    """A rough estimate of the memory a mesh takes, from its element counts."""
+    return (
+        len(mesh.vertices) * 32
+        + len(mesh.edges) * 12
+        + len(mesh.loops) * 24
+        + len(mesh.polygons) * 16
+    )
+
+
+def can_bake(obj):
+    """
+    True for mesh objects whose modifiers can be baked into a mesh ahead of
+    the export. Instancers are left alone, as their instances would be lost.
+    """
+    if obj.type != 'MESH' or obj.data is None:
+        return False
+    # Linked objects can't have their data swapped
+    if obj.library or (obj.override_library and obj.override_library.is_system_override):
+        return False
+    if obj.is_instancer or obj.particle_systems:
+        return False
+    enabled = [mod for mod in obj.modifiers if mod.show_viewport]
+    if not enabled:
+        return False
+    return not any(mod.type in UNBAKED_MODIFIERS for mod in enabled)
+
+
+class EvaluatedMeshCache:
+    """
+    Meshes with an object's modifiers applied, shared by every job, format
+    and LOD of a run that exports the object, so a modifier stack (e.g.
+    a Geometry Nodes scatter) is only evaluated once. Least recently used
+    meshes are freed once the total size goes over `limit` bytes.
+    Call clear() at the end of the run to free them all.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.size = 0
+        self.entries = OrderedDict()  # key -> (mesh, size)
+        self.in_use = set()           # keys of meshes swapped into objects right now
+        self.modifier_digests = {}    # object session_uid -> digest of its modifier stack
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, obj, depsgraph, data=None, baked_matrix=None):
+        """
+        Identifies an object's evaluated state by what it's made from, so
+        linked duplicates and later jobs share it: the original data block
+        `data` and the matrix transform baking applied to its per-job copy
+        (if any), the modifier stack and vertex groups, the frame, and the
+        world matrix for modifiers that work in world space.
+        """
+        if obj.session_uid not in self.modifier_digests:
+            self.modifier_digests[obj.session_uid] = modifiers_digest(obj)
+        return (
+            (data or obj.data).session_uid,
+            tuple(tuple(row) for row in baked_matrix) if baked_matrix is not None else None,
+            self.modifier_digests[obj.session_uid],
+            tuple(group.name for group in obj.vertex_groups),
+            depsgraph.scene.frame_current,
+            tuple(tuple(row) for row in obj.matrix_world),
+        )
+
+    def acquire(self, obj, depsgraph, data=None, baked_matrix=None):
+        """
+        Returns (key, mesh) for an object, evaluating it only if it isn't
+        cached. For an object with baked transforms, `data` and
+        `baked_matrix` are its original data and the matrix baked into it.
+        """
+        key = self.key(obj, depsgraph, data, baked_matrix)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0].name in bpy.data.meshes:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        else:
+            if entry is not None:
+                # The cached mesh was removed from outside; drop it from the total
+                del self.entries[key]
+                self.size -= entry[1]
+            self.misses += 1
+            mesh = bpy.data.meshes.new_from_object(
+                obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph,
+            )
+            entry = (mesh, mesh_bytes(mesh))
+            self.entries[key] = entry
+            self.size += entry[1]
+        self.in_use.add(key)
+        self._evict()
+        return key, entry[0]
+
+    def release(self, key):
+        self.in_use.discard(key)
+        self._evict()
+
+    def _evict(self):
+        for key in list(self.entries):
+            if self.size <= self.limit:
+                break
+            if key in self.in_use:
+                continue
+            mesh, size = self.entries.pop(key)
+            self.size -= size
+            if mesh.name in bpy.data.meshes and mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+    def clear(self):
+        for mesh, _size in self.entries.values():
+            if mesh.name in bpy.data.meshes:
+                bpy.data.meshes.remove(mesh)
+        self.entries.clear()
+        self.in_use.clear()
+        self.modifier_digests.clear()
+        self.size = 0
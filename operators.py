@@ -1,10 +1,88 @@
 import bpy
-import shutil
+import tempfile
+import time
 from pathlib import Path
-from contextlib import contextmanager
+from collections import deque
+from contextlib import contextmanager, ExitStack
 
 from bpy.types import Operator
-from . import utils
+from bpy.props import BoolProperty, IntProperty, StringProperty
+from mathutils import Matrix, Vector
+from . import utils, manifest, workers, copying, profiling, planning, properties, meshcache, lod, writers
+
+# Format: (preset operator, BatchExportSettings preset property).
+# Formats without preset support aren't listed.
+FORMAT_PRESETS = {
+    'FBX': ('export_scene.fbx', 'fbx_preset'),
+    'glTF': ('export_scene.gltf', 'gltf_preset'),
+    'ABC': ('wm.alembic_export', 'abc_preset'),
+    'USD': ('wm.usd_export', 'usd_preset'),
+    'OBJ': ('wm.obj_export', 'obj_preset'),
+}
+
+# Format: (export operator, its "only selected objects" option). These
+# exporters can also export a collection by name (Blender 4.2+), which
+# COLLECTIONS mode uses instead of selecting the objects.
+COLLECTION_EXPORT_OPERATORS = {
+    'FBX': ('export_scene.fbx', 'use_selection'),
+    'glTF': ('export_scene.gltf', 'use_selection'),
+    'ABC': ('wm.alembic_export', 'selected'),
+    'USD': ('wm.usd_export', 'selected_objects_only'),
+    'OBJ': ('wm.obj_export', 'export_selected_objects'),
+    'PLY': ('wm.ply_export', 'export_selected_objects'),
+    'STL': ('wm.stl_export', 'export_selected_objects'),
+}
+
+# Formats whose files don't store object names (or anything else of the
+# object besides its geometry), so linked duplicates give identical files.
+DEDUPLICATED_FORMATS = {'PLY', 'STL'}
+
+# Modal export: how often the timer fires, and how long each tick may export for.
+MODAL_TIMER_INTERVAL = 0.01
+MODAL_TIME_SLICE = 0.1
+
+# Object types whose data is baked with its own transform() when applying
+# transforms. Others (metaballs, armatures, text, ...) go through transform_apply.
+DATA_API_BAKE_TYPES = {'MESH', 'CURVE', 'SURFACE'}
+
+# How many jobs ahead the background simplifier reads LOD meshes.
+LOD_PREFETCH_JOBS = lod.SIMPLIFY_THREADS * 2
+
+FORMAT_EXTENSIONS = {
+    'FBX': '.fbx',
+    'glTF': '.glb',
+    'ABC': '.abc',
+    'OBJ': '.obj',
+    'PLY': '.ply',
+    'STL': '.stl',
+    'SVG': '.svg',
+    'PDF': '.pdf',
+}
+
+
+class ProfileSettings:
+    """
+    The scene's Batch Export settings with an export profile's options on
+    top, so everything that takes the settings can export a profile too.
+    Assignments (like the LOD setup forcing Apply Modifiers) only last for
+    the run and don't touch the scene's settings.
+    """
+
+    def __init__(self, settings, profile):
+        object.__setattr__(self, '_settings', settings)
+        object.__setattr__(self, '_overrides', {})
+        object.__setattr__(self, 'profile', profile)
+        object.__setattr__(self, 'profile_digest', '')
+
+    def __getattr__(self, name):
+        if name in self._overrides:
+            return self._overrides[name]
+        if name in properties.PROFILE_OPTIONS:
+            return getattr(self.profile, name)
+        return getattr(self._settings, name)
+
+    def __setattr__(self, name, value):
+        self._overrides[name] = value
 
 
 class EXPORT_MESH_OT_batch(Operator):
@@ -12,52 +90,422 @@ class EXPORT_MESH_OT_batch(Operator):
     bl_idname = "export_mesh.batch"
     bl_label = "Batch Export"
 
+    # Set by the parent Blender when running as a parallel export worker
+    shard_index: IntProperty(default=0, options={'HIDDEN', 'SKIP_SAVE'})
+    shard_count: IntProperty(default=1, options={'HIDDEN', 'SKIP_SAVE'})
+    directory_override: StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    copy_directory_override: StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    # Workers load the preferences saved on disk, so the parent passes on its own
+    mesh_cache_limit_override: IntProperty(default=-1, options={'HIDDEN', 'SKIP_SAVE'})
+    result_path: StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+    plan_only: BoolProperty(
+        name="Plan Only",
+        description="List the files the export would write, without exporting",
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+    use_plan: BoolProperty(
+        name="Use Plan",
+        description="Export the jobs of the last plan, without gathering the objects again",
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
     def execute(self, context):
         """
         Main entry point. Orchestrates validation, job creation,
         and execution of the batch export process.
         """
+        self._init_run(context)
+        result = self._run_batch(context)
+        self._write_result(result)
+        return result
+
+    def invoke(self, context, event):
+        """Runs the export modally when enabled, otherwise the same as execute()."""
+        settings = context.scene.batch_export
+        if not settings.modal_export or self._is_headless(context):
+            return self.execute(context)
+
+        self._init_run(context)
+        status, jobs = self._prepare_run(context)
+        if status is not None:
+            self._write_result(status)
+            return status
+
+        self.jobs = jobs
+        self.job_index = 0
+        self.modal_start = time.perf_counter()
+        # The state is restored when the modal run finishes, fails or is cancelled
+        self.modal_state = ExitStack()
+        self.modal_state.enter_context(self._preserve_blender_state(context, settings.use_sandbox))
+        # The prepared state can be undone and prepared again for retries
+        self.modal_prepared = self.modal_state.enter_context(ExitStack())
+        try:
+            self._prepare_run_state(context, settings, jobs, self.modal_prepared)
+        except Exception as e:
+            self.modal_state.close()
+            self._finish_processing()
+            self._report_failure(e)
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(jobs))
+        self.timer = wm.event_timer_add(MODAL_TIMER_INTERVAL, window=context.window)
+        # The progress goes where the export was started; in modal() the
+        # context's area is whichever one is under the cursor
+        self.header_area = context.area
+        self.status_workspace = context.workspace
+        wm.modal_handler_add(self)
+        self._update_progress(context)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        """Processes jobs for a short time slice per timer tick, until done or cancelled with Esc."""
+        if event.type == 'ESC':
+            self._end_modal(context)
+            self._report({'WARNING'}, f"Batch export cancelled after {self.job_index} of {len(self.jobs)} "
+                                      f"jobs ({self.file_count} file(s) exported).")
+            return {'CANCELLED'}
+
+        # Block other input while the scene is being changed underneath the user
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        settings = context.scene.batch_export
+        # Process as many jobs as fit in the time slice (at least one), so
+        # throughput stays close to the blocking export while the UI redraws
+        slice_end = time.perf_counter() + MODAL_TIME_SLICE
+        try:
+            while self.job_index < len(self.jobs):
+                self._run_job(context, settings, self.jobs[self.job_index])
+                self.job_index += 1
+                if time.perf_counter() >= slice_end:
+                    break
+            if self.job_index == len(self.jobs) and self.retry_queue and not self.retrying:
+                self.jobs = self._retry_jobs(context, settings, self.modal_prepared)
+                self.job_index = 0
+                self.modal_start = time.perf_counter()
+                context.window_manager.progress_begin(0, len(self.jobs))
+        except Exception as e:
+            self._end_modal(context)
+            self._report_failure(e)
+            return {'CANCELLED'}
+
+        if self.job_index < len(self.jobs):
+            self._update_progress(context)
+            return {'RUNNING_MODAL'}
+
+        self._end_modal(context)
+        self._report_results(context, settings)
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        """Called by Blender when the modal run is stopped from outside (e.g. loading a file)."""
+        self._end_modal(context)
+
+    def _update_progress(self, context):
+        done = self.job_index
+        total = len(self.jobs)
+        context.window_manager.progress_update(done)
+
+        text = f"Batch Export: {done}/{total} {'failed jobs retried' if self.retrying else 'jobs'}"
+        if done:
+            elapsed = time.perf_counter() - self.modal_start
+            remaining = elapsed / done * (total - done)
+            text += f", about {int(remaining // 60)}:{int(remaining % 60):02d} remaining"
+        text += "  (Esc to cancel)"
+        self._set_progress_text(text)
+
+    def _set_progress_text(self, text):
+        """Shows (or with None, clears) the progress in the header and status bar the export was started from."""
+        area = getattr(self, 'header_area', None)
+        workspace = getattr(self, 'status_workspace', None)
+        try:
+            if area is not None:
+                area.header_text_set(text)
+            if workspace is not None:
+                workspace.status_text_set(text)
+        except ReferenceError:
+            # Closed (e.g. the screen layout changed) since the export started
+            pass
+
+    def _end_modal(self, context):
+        """Removes the timer and progress display, and restores the scene state."""
+        wm = context.window_manager
+        if getattr(self, 'timer', None) is not None:
+            wm.event_timer_remove(self.timer)
+            self.timer = None
+        wm.progress_end()
+        self._set_progress_text(None)
+        try:
+            self._finish_processing()
+        finally:
+            self.modal_state.close()
+
+    def _init_run(self, context):
+        """Resets the counters and per-run caches."""
         self.file_count = 0
         self.copy_count = 0
+        self.copy_unchanged = 0
+        self.copy_failures = []
+        self.copy_queue = None
+        self.skipped_count = 0
         self.skipped_lods = []
+        self.messages = []
+        self.manifest = None
+        self.fingerprinter = None
+        self.journal = None
+        self.resumed_count = 0
+        self.presets = {}
+        self.run_state = False
+        self.run_baked = False
+        self.run_transforms = False
+        self.selected = set()
+        self.scene_graph = None
+        self.targets = []
+        self.export_collection = None
+        self.sandbox = None
+        self.mesh_cache = None
+        self.baked_data = {}
+        self.dedupe_sources = {}
+        self.dedupe_digests = {}
+        self.deduplicated_count = 0
+        self.lod_cache = None
+        self.lod_simplifier = None
+        self.lod_prefetch = deque()
+        self.job_position = 0
+        self.current_frame = None
+        self.retry_queue = []
+        self.retrying = False
+        self.retried_count = 0
+        self.failures = []
         settings = context.scene.batch_export
-        prefs = context.preferences.addons[__package__].preferences
+        self.profiler = profiling.ExportProfiler() if settings.write_profile else profiling.NullProfiler()
 
-        # 1. Resolve base directory
-        try:
-            base_dir = self._resolve_base_dir(settings, prefs)
-        except ValueError as e:
-            self.report({'ERROR'}, str(e))
-            return {'CANCELLED'}
+    def _write_result(self, result):
+        # Workers (and command line runs) hand their results back through a file
+        if self.result_path:
+            workers.write_result(self.result_path, self._result_dict(result))
 
-        # 2. Validate that the directory actually exists
-        if not base_dir.is_dir():
-            self.report({'ERROR'}, f"Export directory does not exist:\n{base_dir}")
-            return {'CANCELLED'}
+    def _run_batch(self, context):
+        """Runs the whole export in one go."""
+        status, jobs = self._prepare_run(context)
+        if status is not None:
+            return status
 
-        # 3. Get the master list of objects to consider
-        filtered_objects = self._get_filtered_objects(context, settings)
-        if not filtered_objects:
-            self.report({'WARNING'}, "No objects matched the filter settings.")
-            return {'FINISHED'}
+        settings = context.scene.batch_export
 
         # 4. Run the entire export inside a state-preservation context manager
-        with self._preserve_blender_state(context):
+        with ExitStack() as run_state:
+            run_state.enter_context(self._preserve_blender_state(context, settings.use_sandbox))
 
-            # 5. Generate and process each export job
+            # 5. Process each export job
             try:
-                for job in self._generate_export_jobs(settings, filtered_objects, base_dir):
-                    self._process_export_job(context, settings, job)
+                # The prepared state can be undone and prepared again for retries
+                prepared = run_state.enter_context(ExitStack())
+                self._prepare_run_state(context, settings, jobs, prepared)
+                for job in jobs:
+                    self._run_job(context, settings, job)
+                if self.retry_queue:
+                    for job in self._retry_jobs(context, settings, prepared):
+                        self._run_job(context, settings, job)
             except Exception as e:
-                self.report({'ERROR'}, f"Operation failed: {e}")
-                import traceback
-                traceback.print_exc()
+                self._report_failure(e)
                 return {'CANCELLED'}
+            finally:
+                self._finish_processing()
 
         # 6. Report final results
         self._report_results(context, settings)
         return {'FINISHED'}
 
+    def _prepare_run(self, context):
+        """
+        Validates the settings and builds the list of jobs.
+        Returns (status, jobs). If status isn't None the run is already
+        over (nothing to do, an error, or the jobs were run by parallel workers).
+        """
+        settings = context.scene.batch_export
+        prefs = context.preferences.addons[__package__].preferences
+
+        # 1. Resolve base directory
+        try:
+            base_dir = self._resolve_base_dir(settings, prefs)
+        except ValueError as e:
+            self._report({'ERROR'}, str(e))
+            return {'CANCELLED'}, []
+
+        # 2. Validate that the directory actually exists
+        if not base_dir.is_dir():
+            self._report({'ERROR'}, f"Export directory does not exist:\n{base_dir}")
+            return {'CANCELLED'}, []
+        self.base_dir = base_dir
+
+        self.targets = self._export_targets(settings)
+        if not self.targets:
+            self._report({'ERROR'}, "Export Profiles are on, but no profile is enabled.")
+            return {'CANCELLED'}, []
+
+        if settings.frame_sequence:
+            if settings.frame_end < settings.frame_start:
+                self._report({'ERROR'}, "Frame Sequence: Frame End is before Frame Start.")
+                return {'CANCELLED'}, []
+            if any(target.file_format in {'ABC', 'USD'} for target in self.targets):
+                self._report({'ERROR'}, "Frame Sequence can't export Alembic or USD, "
+                                        "which export the frame range into one file.")
+                return {'CANCELLED'}, []
+
+        plan_digest = None
+        if self.plan_only or self.use_plan:
+            plan_digest = manifest.JobFingerprinter(settings, self._preset_options(settings)).run_digest
+            plan_digest += "".join(self._target_digest(target) for target in self.targets)
+
+        if self.use_plan:
+            # Export a cached plan, skipping the gathering work
+            plan = planning.cached_plans.get(context.scene.name_full)
+            if plan is None or plan.digest != plan_digest or plan.base_dir != base_dir:
+                self._report({'ERROR'}, "No up to date export plan. The settings changed, make a new plan.")
+                return {'CANCELLED'}, []
+            try:
+                jobs = plan.jobs()
+            except KeyError as e:
+                self._report({'ERROR'}, f"Object {e} in the export plan no longer exists. Make a new plan.")
+                return {'CANCELLED'}, []
+        else:
+            # 3. Get the master list of objects to consider
+            filtered_objects = self._get_filtered_objects(context, settings)
+            if not filtered_objects:
+                self._report({'WARNING'}, "No objects matched the filter settings.")
+                return {'FINISHED'}, []
+            jobs = list(self._generate_export_jobs(settings, filtered_objects, base_dir))
+
+        frame_count = 0
+        if settings.frame_sequence:
+            frames = range(settings.frame_start, settings.frame_end + 1)
+            frame_count = len(frames)
+            if self.shard_count > 1:
+                # Each worker exports a chunk of consecutive frames, so it sets every frame only once
+                frames = frames[frame_count * self.shard_index // self.shard_count:
+                                frame_count * (self.shard_index + 1) // self.shard_count]
+            # Frame-major: all the jobs of a frame are exported before moving to the next one
+            jobs = [dict(job, frame=frame) for frame in frames for job in jobs]
+
+        if self.plan_only:
+            return self._make_plan(context, settings, jobs, plan_digest), []
+
+        # Incremental exports compare each job against the manifest of the last run
+        if settings.incremental:
+            self.manifest = manifest.ExportManifest.load(base_dir)
+        # The journal lists the files written so far, so an interrupted run can be resumed
+        if settings.use_journal:
+            try:
+                # Workers append to the journal the parent started
+                self.journal = manifest.ExportJournal.open(
+                    base_dir, resume=settings.resume_export, truncate=self.shard_count <= 1,
+                )
+            except OSError as e:
+                self._report({'ERROR'}, f"Could not open the export journal: {e}")
+                return {'CANCELLED'}, []
+        if self.manifest is not None or self.journal is not None:
+            self.fingerprinter = manifest.JobFingerprinter(settings, self._preset_options(settings))
+
+        # Frame sequences are split between workers by frame, other exports by job
+        parallel_units = frame_count if settings.frame_sequence else len(jobs)
+        if self.shard_count > 1:
+            # Running as a worker: only export this worker's share of the jobs
+            if not settings.frame_sequence:
+                jobs = jobs[self.shard_index::self.shard_count]
+        elif prefs.worker_count > 1 and parallel_units > 1:
+            return self._run_parallel(context, settings, prefs, parallel_units), []
+
+        # Copies are made in the background while the export carries on
+        if self._copies_enabled(settings, prefs):
+            self.copy_root = self._resolve_copy_dir(settings)
+            self.copy_queue = copying.CopyQueue(use_hardlinks=settings.copy_use_hardlinks)
+
+        return None, jobs
+
+    def _finish_processing(self):
+        """Waits for copies and saves the manifest, also after a failure."""
+        # Jobs still waiting for a retry (e.g. the run was cancelled) stay failed
+        self._fail_queued_jobs()
+        self._finish_copies()
+        # The journal is kept until the run completes, so a failed run can be resumed
+        if self.journal is not None:
+            self.journal.close()
+        # Keep whatever was exported before a failure, so it's skipped next time.
+        # Workers pass their entries to the parent instead.
+        if self.shard_count <= 1:
+            self._save_manifest()
+
+    def _run_job(self, context, settings, job):
+        """
+        Exports a job. With 'Continue on Error', an exception is caught and
+        the job queued for a retry, so the rest of the batch carries on.
+        The job's scene changes are undone by then, as they're all context
+        managers.
+        """
+        if not settings.continue_on_error:
+            self._process_export_job(context, settings, job)
+            return
+        try:
+            self._process_export_job(context, settings, job)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            print(f"Export job failed, continuing: {self._job_label(job)}")
+            self.retry_queue.append((job, f"{type(e).__name__}: {e}"))
+            # Don't trust what the failed job left selected or evaluated
+            if self.sandbox is None:
+                self._deselect_all(context)
+            self.selected = set()
+            self.current_frame = None
+
+    def _retry_jobs(self, context, settings, prepared):
+        """
+        Takes the failed jobs off the retry queue and returns them to be
+        exported again. For a fresh state, the run state prepared on
+        `prepared` is undone first and prepared again for only these jobs.
+        """
+        if settings.retry_failed == 'NONE':
+            self._fail_queued_jobs()
+            return []
+        jobs = [job for job, _error in self.retry_queue]
+        self.retrying = True
+        self.retried_count = len(jobs)
+        # Failed again, they're put back on the queue
+        self.retry_queue = []
+        print(f"Retrying {len(jobs)} failed job(s)")
+        if settings.retry_failed == 'RESET':
+            prepared.close()
+            self.run_state = False
+            self.run_baked = False
+            self.run_transforms = False
+            self.sandbox = None
+            self.selected = set()
+            self.current_frame = None
+            self.job_position = 0
+            self._prepare_run_state(context, settings, jobs, prepared)
+        return jobs
+
+    def _fail_queued_jobs(self):
+        """Moves the jobs left on the retry queue to the failures of the run."""
+        self.failures.extend((self._job_label(job), error) for job, error in self.retry_queue)
+        self.retry_queue = []
+
+    def _job_label(self, job):
+        return job['name'] if 'frame' not in job else f"{job['name']} (frame {job['frame']})"
+
+    def _report_failure(self, error):
+        self._report({'ERROR'}, f"Operation failed: {error}")
+        import traceback
+        traceback.print_exc()
+
+    def _report(self, level, message):
+        """Reports a message and keeps it, so workers can pass it on to the parent."""
+        self.messages.append((sorted(level)[0], message))
+        self.report(level, message)
+
     # =================================================================
     # 1. VALIDATION AND SETUP
     # =================================================================
@@ -70,6 +518,9 @@ class EXPORT_MESH_OT_batch(Operator):
         Raises ValueError if the path cannot be resolved (e.g. unsaved .blend
         with a relative output directory and no project dir set).
         """
+        if self.directory_override:
+            return Path(self.directory_override)
+
         project_dir_raw = getattr(prefs, 'project_dir', '')
 
         if project_dir_raw:
@@ -93,25 +544,94 @@ class EXPORT_MESH_OT_batch(Operator):
                 )
             return Path(bpy.path.abspath(settings.directory)).resolve()
 
+    def _export_targets(self, settings):
+        """
+        The settings every job is exported with: the scene's settings, or
+        with Export Profiles on, a ProfileSettings per enabled profile.
+        """
+        if not settings.use_profiles:
+            return [settings]
+        targets = []
+        for profile in settings.profiles:
+            if profile.enabled:
+                target = ProfileSettings(settings, profile)
+                # The digest covers the preset, which is looked up through the target itself
+                object.__setattr__(target, 'profile_digest',
+                                   manifest.profile_digest(profile, self._preset_options(target)))
+                targets.append(target)
+        return targets
+
+    def _resolve_copy_dir(self, settings):
+        """Calculates the absolute directory exported files are copied to."""
+        if self.copy_directory_override:
+            return Path(self.copy_directory_override)
+        return Path(bpy.path.abspath(settings.copy_directory)).resolve()
+
+    def _copies_enabled(self, settings, prefs):
+        """
+        True if exported files should be copied. Workers go by the copy
+        directory the parent passed on, since their preferences are the
+        ones saved on disk, not the parent's.
+        """
+        if self.shard_count > 1:
+            return bool(self.copy_directory_override)
+        return prefs.copy_on_export and settings.copy_on_export
+
+    def _mesh_cache_limit(self, prefs):
+        """The evaluated mesh cache limit in MB, as passed on by the parent for workers."""
+        if self.mesh_cache_limit_override >= 0:
+            return self.mesh_cache_limit_override
+        return prefs.mesh_cache_limit
+
     # =================================================================
     # 2. STATE MANAGEMENT (CONTEXT MANAGERS)
     # =================================================================
 
+    def _is_headless(self, context):
+        """True when running without a UI (e.g. 'blender --background')."""
+        return bpy.app.background or context.window is None
+
+    def _deselect_all(self, context):
+        """
+        Deselects every object in the view layer. Without a UI the
+        select_all operator's context isn't guaranteed, so objects are
+        deselected directly instead.
+        """
+        if self._is_headless(context):
+            for obj in context.view_layer.objects:
+                obj.select_set(False)
+        else:
+            bpy.ops.object.select_all(action='DESELECT')
+
     @contextmanager
-    def _preserve_blender_state(self, context):
-        """Saves and restores selection, active object, and interaction mode."""
+    def _preserve_blender_state(self, context, keep_selection=False):
+        """
+        Saves and restores selection, active object, and interaction mode.
+        With `keep_selection` (exporting from a sandbox scene) the selection
+        isn't changed, so it's left alone.
+        """
+        if keep_selection:
+            original_active = context.view_layer.objects.active
+            if original_active is None or original_active.mode == 'OBJECT':
+                yield
+                return
         view_layer = context.view_layer
         original_selection = context.selected_objects[:]
         original_active = view_layer.objects.active
         original_mode = original_active.mode if original_active else 'OBJECT'
+        # Without a UI there's no interaction mode worth restoring afterwards
+        restore_mode = original_mode != 'OBJECT' and not self._is_headless(context)
 
         try:
             if original_mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-            bpy.ops.object.select_all(action='DESELECT')
+                try:
+                    bpy.ops.object.mode_set(mode='OBJECT')
+                except RuntimeError as e:
+                    print(f"Could not switch to Object Mode: {e}")
+            self._deselect_all(context)
             yield
         finally:
-            bpy.ops.object.select_all(action='DESELECT')
+            self._deselect_all(context)
             for obj in original_selection:
                 try:
                     if obj.name in context.view_layer.objects:
@@ -122,7 +642,7 @@ class EXPORT_MESH_OT_batch(Operator):
             if original_active and original_active.name in context.view_layer.objects:
                 view_layer.objects.active = original_active
 
-                if original_mode != 'OBJECT':
+                if restore_mode:
                     is_editable = (
                         not original_active.library
                         and not (
@@ -136,6 +656,188 @@ class EXPORT_MESH_OT_batch(Operator):
                         except RuntimeError:
                             pass
 
+    def _prepare_run_state(self, context, settings, jobs, stack):
+        """
+        When 'Prepare Scene Once' is on, unhides and bakes transforms for
+        every object of the run up front (entering the context managers on
+        `stack`), instead of once per job.
+        Set-transforms are also applied once, unless an object they move is
+        parented under another one they move, or is a child in another
+        job; those depend on which job is exporting, so stay per job.
+        In a frame sequence, every frame change evaluates the animated
+        transforms again, so baking and set-transforms stay per job.
+        """
+        applies_transforms = settings.apply_location or settings.apply_rotation or settings.apply_scale
+        bakes_per_job = settings.frame_sequence and applies_transforms
+        if settings.use_sandbox:
+            self.sandbox = stack.enter_context(self._sandbox_scene(context.scene))
+        # The sandbox is deleted afterwards, so only the scene's frame needs restoring
+        if settings.frame_sequence and self.sandbox is None:
+            stack.callback(context.scene.frame_set, context.scene.frame_current, subframe=context.scene.frame_subframe)
+        if settings.cache_evaluated:
+            prefs = context.preferences.addons[__package__].preferences
+            self.mesh_cache = meshcache.EvaluatedMeshCache(self._mesh_cache_limit(prefs) * 1024 * 1024)
+            stack.callback(self._release_mesh_cache)
+        if any(target.create_lod and target.lod_method == 'NUMPY' for target in self.targets):
+            self.lod_simplifier = lod.BackgroundSimplifier()
+            stack.callback(self._release_lod_simplifier)
+            # Meshes can only be read ahead when they aren't changed per job
+            if settings.prepare_once and not bakes_per_job:
+                self.lod_prefetch.extend(
+                    (index, job, target)
+                    for index, job in enumerate(jobs)
+                    for target in self.targets
+                    if target.lod_method == 'NUMPY' and self._is_lod_job(target, job)
+                )
+
+        if not settings.prepare_once:
+            return
+
+        all_objects = list(dict.fromkeys(obj for job in jobs for obj in job['objects']))
+        # Objects are always visible in the sandbox
+        if self.sandbox is None:
+            stack.enter_context(self._temporary_visibility(all_objects))
+        if not bakes_per_job:
+            stack.enter_context(self._temporary_apply_transform(settings, all_objects))
+            self.run_baked = True
+
+        if settings.frame_sequence:
+            self.run_transforms = not (settings.set_location or settings.set_rotation or settings.set_scale)
+        elif settings.set_location or settings.set_rotation or settings.set_scale:
+            roots = set()
+            children = set()
+            for job in jobs:
+                job_objects = set(job['objects'])
+                for obj in job['objects']:
+                    (children if obj.parent in job_objects else roots).add(obj)
+
+            def has_moved_ancestor(obj):
+                parent = obj.parent
+                while parent:
+                    if parent in roots:
+                        return True
+                    parent = parent.parent
+                return False
+
+            if not (roots & children) and not any(has_moved_ancestor(obj) for obj in roots):
+                stack.enter_context(self._temporary_transform(settings, roots))
+                self.run_transforms = True
+        else:
+            self.run_transforms = True
+
+        if self.sandbox is None:
+            self._deselect_all(context)
+        self.selected = set()
+        self.run_state = True
+
+    def _set_frame(self, context, frame):
+        """
+        Moves the scene (or the sandbox) to a frame of a frame sequence. The
+        frame is evaluated once here, for all of its jobs.
+        """
+        if self.sandbox is not None:
+            with context.temp_override(scene=self.sandbox, view_layer=self.sandbox.view_layers[0]):
+                self.sandbox.frame_set(frame)
+        else:
+            context.scene.frame_set(frame)
+        self.current_frame = frame
+
+    def _release_lod_simplifier(self):
+        self.lod_simplifier.shutdown()
+        self.lod_simplifier = None
+        self.lod_prefetch.clear()
+
+    def _release_mesh_cache(self):
+        cache = self.mesh_cache
+        print(f"Evaluated mesh cache: {cache.misses} evaluated, {cache.hits} reused")
+        cache.clear()
+        self.mesh_cache = None
+
+    @contextmanager
+    def _evaluated_meshes(self, settings, objects):
+        """
+        Swaps a cached copy of each object's evaluated mesh in as its data,
+        with the modifiers turned off, so the exporter doesn't evaluate the
+        modifier stack again. Everything is swapped back afterwards.
+        """
+        cache = self.mesh_cache
+        if cache is None or not settings.apply_mods or settings.file_format in meshcache.UNBAKED_FORMATS:
+            yield
+            return
+        bakeable = [obj for obj in objects if meshcache.can_bake(obj)]
+        if not bakeable:
+            yield
+            return
+
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        # Evaluate everything before swapping, as objects can depend on each other
+        meshes = [cache.acquire(obj, depsgraph, *self.baked_data.get(obj.data, (None, None))) for obj in bakeable]
+        swapped = []  # (obj, original data, [(modifier, show_viewport, show_render)])
+        try:
+            for obj, (_key, mesh) in zip(bakeable, meshes):
+                states = [(mod, mod.show_viewport, mod.show_render) for mod in obj.modifiers]
+                swapped.append((obj, obj.data, states))
+                obj.data = mesh
+                for mod, _viewport, _render in states:
+                    mod.show_viewport = False
+                    mod.show_render = False
+            yield
+        finally:
+            for obj, data, states in reversed(swapped):
+                if obj.name not in bpy.data.objects:
+                    continue
+                obj.data = data
+                for mod, viewport, render in states:
+                    mod.show_viewport = viewport
+                    mod.show_render = render
+            for key, _mesh in meshes:
+                cache.release(key)
+
+    @contextmanager
+    def _sandbox_scene(self, source_scene):
+        """
+        Creates the empty scene jobs are exported from when 'Sandbox Scene'
+        is on, with the units and frame settings of `source_scene`, and
+        deletes it afterwards.
+        """
+        sandbox = bpy.data.scenes.new(f"{source_scene.name} (Batch Export)")
+        try:
+            for prop in ('system', 'system_rotation', 'scale_length', 'length_unit',
+                         'mass_unit', 'time_unit', 'temperature_unit'):
+                setattr(sandbox.unit_settings, prop, getattr(source_scene.unit_settings, prop))
+            sandbox.render.fps = source_scene.render.fps
+            sandbox.render.fps_base = source_scene.render.fps_base
+            sandbox.frame_start = source_scene.frame_start
+            sandbox.frame_end = source_scene.frame_end
+            sandbox.frame_current = source_scene.frame_current
+            yield sandbox
+        finally:
+            if sandbox.name in bpy.data.scenes:
+                bpy.data.scenes.remove(sandbox)
+
+    @contextmanager
+    def _sandboxed(self, objects):
+        """
+        Links a job's objects, and their parents so transforms evaluate the
+        same, into the sandbox scene and makes it the context scene. The
+        objects start out visible and unselected there, so there's nothing
+        to unhide or deselect, and they're unlinked again afterwards.
+        """
+        sandbox_objects = self.sandbox.collection.objects
+        linked = []
+        for obj in objects:
+            while obj is not None and obj.name not in sandbox_objects:
+                sandbox_objects.link(obj)
+                linked.append(obj)
+                obj = obj.parent
+        try:
+            with bpy.context.temp_override(scene=self.sandbox, view_layer=self.sandbox.view_layers[0]):
+                yield
+        finally:
+            for obj in linked:
+                if obj.name in sandbox_objects:
+                    sandbox_objects.unlink(obj)
+
     @contextmanager
     def _temporary_visibility(self, objects):
         """Temporarily makes objects (and their parents) visible for export."""
@@ -159,6 +861,7 @@ class EXPORT_MESH_OT_batch(Operator):
     @contextmanager
     def _temporary_transform(self, settings, objects_to_transform):
         """Applies and then restores object transforms around an export."""
+        objects_to_transform = set(objects_to_transform)
         original_transforms = {
             obj: (obj.location.copy(), obj.rotation_euler.copy(), obj.scale.copy())
             for obj in objects_to_transform
@@ -187,52 +890,52 @@ class EXPORT_MESH_OT_batch(Operator):
         """
         Bakes object transforms into a temporary copy of each object's data
         so the export reflects the apply, but the scene is left untouched.
+        Meshes and curves are baked directly through the data API; other
+        types fall back to the transform_apply operator.
         """
         if not (settings.apply_location or settings.apply_rotation or settings.apply_scale):
             yield
             return
 
         data_backups = {}       # obj -> original data
-        transform_backups = {}  # obj -> (location, rotation_euler, rotation_quaternion, scale)
-        flip_targets = []       # mesh objects with negative-determinant scale
-
-        for obj in objects_to_apply:
-            if obj is None or obj.data is None or not hasattr(obj.data, 'copy'):
-                continue
-            # Skip linked / system-overridden objects — we can't edit their data.
-            if obj.library or (obj.override_library and obj.override_library.is_system_override):
-                continue
-            data_backups[obj] = obj.data
-            # transform_apply resets the object's loc/rot/scale — back them up so
-            # we can restore the scene state after export.
-            transform_backups[obj] = (
-                obj.location.copy(),
-                obj.rotation_euler.copy(),
-                obj.rotation_quaternion.copy(),
-                obj.scale.copy(),
-            )
-            obj.data = obj.data.copy()
-            """
-            if (
-                settings.apply_scale
-                and settings.corrective_flip_normals
-                and obj.type == 'MESH'
-                and (obj.scale.x * obj.scale.y * obj.scale.z) < 0.0
-            ):
-                flip_targets.append(obj)
-            """
+        transform_backups = {}  # obj -> (location, rotation_euler, rotation_quaternion, rotation_axis_angle, scale)
+        parent_inverse_backups = {}  # child -> matrix_parent_inverse
+        operator_targets = []   # objects whose data has no transform() to bake with
 
+        # Filled as the objects are changed, so a failure part way through is undone too
         try:
-            if data_backups:
-                bpy.ops.object.select_all(action='DESELECT')
-                for obj in data_backups:
+            for obj in objects_to_apply:
+                if obj is None or obj.data is None or not hasattr(obj.data, 'copy'):
+                    continue
+                # Skip linked / system-overridden objects — we can't edit their data.
+                if obj.library or (obj.override_library and obj.override_library.is_system_override):
+                    continue
+                data_backups[obj] = obj.data
+                # Applying resets the object's loc/rot/scale — back them up so
+                # we can restore the scene state after export.
+                transform_backups[obj] = (
+                    obj.location.copy(),
+                    obj.rotation_euler.copy(),
+                    obj.rotation_quaternion.copy(),
+                    tuple(obj.rotation_axis_angle),
+                    obj.scale.copy(),
+                )
+                obj.data = obj.data.copy()
+                if obj.type in DATA_API_BAKE_TYPES:
+                    matrix = self._bake_transform(settings, obj, parent_inverse_backups)
+                    self.baked_data[obj.data] = (data_backups[obj], matrix)
+                else:
+                    operator_targets.append(obj)
+
+            if operator_targets:
+                self._deselect_all(bpy.context)
+                for obj in operator_targets:
                     try:
                         obj.select_set(True)
                     except RuntimeError:
                         pass
                 # Active must be set for transform_apply.
-                first = next(iter(data_backups))
-                bpy.context.view_layer.objects.active = first
+                bpy.context.view_layer.objects.active = operator_targets[0]
 
                 try:
                     bpy.ops.object.transform_apply(
@@ -245,29 +948,26 @@ class EXPORT_MESH_OT_batch(Operator):
                 except RuntimeError as e:
                     print(f"transform_apply failed: {e}")
 
-                #for obj in flip_targets:
-                #    mesh = obj.data
-                #    for poly in mesh.polygons:
-                #        poly.flip()
-                #    mesh.update()
-
-                # Force the depsgraph to refresh so exporters (notably glTF, which
-                # reads evaluated data through the depsgraph) pick up the swapped,
-                # baked mesh instead of a stale evaluation of the original.
-                bpy.context.view_layer.update()
-
+            # No view_layer.update() for the baked data: the exporters, the mesh
+            # cache and the LOD setup read through evaluated_depsgraph_get(),
+            # which evaluates the pending changes only when they're needed
             yield
         finally:
+            for child, matrix in parent_inverse_backups.items():
+                if child.name in bpy.data.objects:
+                    child.matrix_parent_inverse = matrix
             for obj, original in data_backups.items():
                 if obj is None or obj.name not in bpy.data.objects:
                     continue
                 temp = obj.data
+                self.baked_data.pop(temp, None)
                 obj.data = original
                 # Restore the object's transforms (transform_apply reset them).
-                loc, rot_e, rot_q, scl = transform_backups[obj]
+                loc, rot_e, rot_q, rot_aa, scl = transform_backups[obj]
                 obj.location = loc
                 obj.rotation_euler = rot_e
                 obj.rotation_quaternion = rot_q
+                obj.rotation_axis_angle = rot_aa
                 obj.scale = scl
                 if temp is None or temp == original:
                     continue
@@ -285,11 +985,54 @@ class EXPORT_MESH_OT_batch(Operator):
                 except Exception as e:
                     print(f"Could not free temporary data for {obj.name}: {e}")
 
+    def _bake_transform(self, settings, obj, parent_inverse_backups):
+        """
+        Applies the selected parts of an object's transform to its (already
+        copied) data, the way transform_apply does, without the operator.
+        Children get their parent inverse adjusted so they stay in place;
+        the original matrices are stored in `parent_inverse_backups`.
+        Returns the matrix that was applied to the data.
+        """
+        old_basis = obj.matrix_basis.copy()
+        if settings.apply_location:
+            obj.location = (0.0, 0.0, 0.0)
+        if settings.apply_rotation:
+            obj.rotation_euler = (0.0, 0.0, 0.0)
+            obj.rotation_quaternion = (1.0, 0.0, 0.0, 0.0)
+            obj.rotation_axis_angle = (0.0, 0.0, 1.0, 0.0)
+        if settings.apply_scale:
+            obj.scale = (1.0, 1.0, 1.0)
+        # The part of the transform that moves into the data
+        matrix = obj.matrix_basis.inverted_safe() @ old_basis
+
+        data = obj.data
+        data.transform(matrix, shape_keys=True)
+        if obj.type == 'MESH':
+            # A mirroring transform turns the faces inside out
+            if settings.corrective_flip_normals and matrix.determinant() < 0.0:
+                data.flip_normals()
+            data.update()
+        elif settings.apply_scale:
+            # Curves keep bevel and extrude sizes separately from the points
+            scale = (matrix.to_3x3() @ Vector((1.0, 1.0, 1.0)).normalized()).length
+            data.bevel_depth *= scale
+            data.extrude *= scale
+            data.offset *= scale
+
+        if self.scene_graph is None:
+            self.scene_graph = utils.SceneGraph(bpy.context.scene)
+        for child in self.scene_graph.object_children.get(obj, ()):
+            if child not in parent_inverse_backups:
+                parent_inverse_backups[child] = child.matrix_parent_inverse.copy()
+            child.matrix_parent_inverse = matrix @ child.matrix_parent_inverse
+        return matrix
+
     @contextmanager
-    def _managed_lods(self, settings, obj):
+    def _managed_lods(self, settings, obj, collection=None):
         """
         Creates temporary LOD hierarchy objects for FBX export and guarantees
-        their removal afterwards, even if an exception occurs.
+        their removal afterwards, even if an exception occurs. They're linked
+        into `collection`, or the object's first collection.
         Yields the list of objects that should be selected for export.
         """
         is_editable = (
@@ -305,7 +1048,7 @@ class EXPORT_MESH_OT_batch(Operator):
         # If they want LODs but the object is linked, warn the user and just export the base mesh.
         if wants_lods and not is_editable:
             self.skipped_lods.append(obj.name)
-            self.report({'WARNING'}, f"Skipped LODs for '{obj.name}' (Linked Object, cannot edit). Exporting base mesh only.")
+            self._report({'WARNING'}, f"Skipped LODs for '{obj.name}' (Linked Object, cannot edit). Exporting base mesh only.")
             yield [obj]
             return
 
@@ -315,9 +1058,11 @@ class EXPORT_MESH_OT_batch(Operator):
             return
 
         lod_objects = []
+        lod_meshes = []
         original_name = obj.name
         original_parent = obj.parent
-        collection = obj.users_collection[0]
+        if collection is None:
+            collection = obj.users_collection[0]
 
         try:
             # Rename original so it won't conflict with the new LOD parent name.
@@ -338,26 +1083,35 @@ class EXPORT_MESH_OT_batch(Operator):
             # LOD0 — full-resolution copy
             lod0 = obj.copy()
             lod0.data = lod0.data.copy()
+            lod_meshes.append(lod0.data)
             lod0.name = f"{original_name}_LOD0"
             collection.objects.link(lod0)
             lod0.parent = lod_parent
             lod0.matrix_local.identity()
             lod_objects.append(lod0)
 
-            # Additional decimated LODs
-            for i in range(settings.lod_count):
-                lod_ratio = getattr(settings, f"lod{i + 1}_ratio")
-                if lod_ratio >= 1.0:
-                    continue  # No reduction needed for this level
-                lod = lod0.copy()
-                lod.data = lod0.data.copy()
-                lod.name = f"{original_name}_LOD{i + 1}"
-                collection.objects.link(lod)
-                lod.parent = lod_parent
-                lod.matrix_local.identity()
-                mod = lod.modifiers.new(name='DecimateLOD', type='DECIMATE')
-                mod.ratio = lod_ratio
-                lod_objects.append(lod)
+            # Additional decimated LODs. Skinned meshes keep the modifier,
+            # as baking the decimated mesh would lose the skinning.
+            bake = settings.lod_cache or settings.lod_method == 'NUMPY'
+            if bake and not any(mod.type == 'ARMATURE' for mod in obj.modifiers):
+                lod_objects.extend(self._baked_lods(settings, obj, lod0, original_name, collection, lod_meshes))
+            else:
+                triangles = 0
+                if settings.lod_mode == 'BUDGET':
+                    triangles = planning.object_stats(obj, bpy.context.evaluated_depsgraph_get())[1]
+                for i, lod_ratio in enumerate(self._lod_ratios(settings, triangles)):
+                    if lod_ratio is None:
+                        continue  # No (worthwhile) reduction for this level
+                    lod = lod0.copy()
+                    lod.data = lod0.data.copy()
+                    lod_meshes.append(lod.data)
+                    lod.name = f"{original_name}_LOD{i + 1}"
+                    collection.objects.link(lod)
+                    lod.parent = lod_parent
+                    lod.matrix_local.identity()
+                    mod = lod.modifiers.new(name='DecimateLOD', type='DECIMATE')
+                    mod.ratio = lod_ratio
+                    lod_objects.append(lod)
 
             # Ensure modifiers are applied during export
             settings.apply_mods = True
@@ -368,10 +1122,163 @@ class EXPORT_MESH_OT_batch(Operator):
             for lod_obj in lod_objects:
                 if lod_obj and lod_obj.name in bpy.data.objects:
                     bpy.data.objects.remove(lod_obj, do_unlink=True)
+            for mesh in lod_meshes:
+                if mesh.name in bpy.data.meshes and mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
             # Restore original name
             if obj and obj.name.endswith('_preLOD'):
                 obj.name = original_name
 
+    def _lod_ratios(self, settings, triangles):
+        """
+        The decimate ratio of each LOD level, relative to the full mesh of
+        `triangles` triangles, or None for levels that are skipped.
+        With triangle budgets, the ratio decimates the mesh to the level's
+        budget, and levels that don't take off at least the minimum
+        reduction of the previous level are skipped.
+        """
+        ratios = []
+        previous_ratio = 1.0
+        for i in range(settings.lod_count):
+            if settings.lod_mode == 'BUDGET':
+                budget = getattr(settings, f"lod{i + 1}_budget")
+                lod_ratio = min(1.0, budget / triangles) if triangles else 1.0
+                if lod_ratio >= 1.0 or lod_ratio > previous_ratio * (1.0 - settings.lod_min_reduction):
+                    ratios.append(None)
+                    continue
+            else:
+                lod_ratio = getattr(settings, f"lod{i + 1}_ratio")
+                if lod_ratio >= 1.0:
+                    ratios.append(None)
+                    continue
+            ratios.append(lod_ratio)
+            previous_ratio = lod_ratio
+        return ratios
+
+    def _lod_levels(self, settings, triangles):
+        """
+        The decimated LOD levels as (level, parent, ratio, chain). Each level
+        is decimated from the previous one: `parent` is its index in the
+        list, or -1 for the full mesh, and `ratio` is relative to it. `chain`
+        holds the ratios leading from the full mesh to the level.
+        """
+        levels = []
+        previous_ratio, parent, chain = 1.0, -1, ()
+        for i, lod_ratio in enumerate(self._lod_ratios(settings, triangles)):
+            if lod_ratio is None:
+                continue
+            if lod_ratio > previous_ratio:
+                # Levels out of order are decimated from the full mesh
+                previous_ratio, parent, chain = 1.0, -1, ()
+            step = lod_ratio / previous_ratio
+            chain += (step,)
+            levels.append((i + 1, parent, step, chain))
+            previous_ratio, parent = lod_ratio, len(levels) - 1
+        return levels
+
+    def _baked_lods(self, settings, obj, lod0, name, collection, lod_meshes):
+        """
+        Creates the decimated LOD objects as plain meshes: loaded from the
+        on-disk LOD cache, simplified with NumPy (usually already done in
+        the background), or decimated by the modifier. LOD0 gets its
+        modifiers applied, as the levels are made from its evaluated mesh.
+        Created meshes are added to `lod_meshes`.
+        """
+        method = settings.lod_method
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        source = bpy.data.meshes.new_from_object(
+            lod0.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph,
+        )
+        lod_meshes.append(source)
+        lod0.modifiers.clear()
+        lod0.data = source
+        materials = list(source.materials)
+        digest = manifest.data_digest(source)
+
+        # Decimated meshes are only cached if the cache keeps everything the
+        # exporter writes of them, so a run exports the same with or without
+        # cache hits. NumPy LODs only ever have what the cache stores.
+        cache = None
+        if settings.lod_cache and (method == 'NUMPY' or (lod.is_cacheable(source) and not lod0.vertex_groups)):
+            if self.lod_cache is None:
+                self.lod_cache = lod.LODCache()
+            cache = self.lod_cache
+
+        levels = self._lod_levels(settings, utils.mesh_triangle_count(source))
+        level_arrays = [None] * len(levels)
+        if cache is not None:
+            level_arrays = [cache.load(lod.level_key(digest, chain, method)) for _, _, _, chain in levels]
+        cached = [arrays is not None for arrays in level_arrays]
+
+        if method == 'NUMPY' and not all(cached):
+            steps = tuple((parent, step) for _, parent, step, _ in levels)
+            simplified = None
+            if self.lod_simplifier is not None:
+                simplified = self.lod_simplifier.take(obj, steps, digest, self.current_frame)
+            if simplified is None:
+                simplified = lod.simplify_levels(lod.triangle_arrays(source), steps)
+            level_arrays = [arrays if arrays is not None else level for arrays, level in zip(level_arrays, simplified)]
+
+        lod_objects = []
+        level_meshes = []
+        for (level, parent, step, chain), arrays, was_cached in zip(levels, level_arrays, cached):
+            lod_name = f"{name}_LOD{level}"
+            if arrays is not None:
+                mesh = lod.mesh_from_arrays(lod_name, arrays, materials)
+            else:
+                mesh = lod.decimate(source if parent < 0 else level_meshes[parent], step, collection)
+            lod_meshes.append(mesh)
+            level_meshes.append(mesh)
+            if cache is not None and not was_cached:
+                cache.save(lod.level_key(digest, chain, method), arrays if arrays is not None else lod.mesh_arrays(mesh))
+
+            lod_obj = bpy.data.objects.new(lod_name, mesh)
+            collection.objects.link(lod_obj)
+            lod_obj.parent = lod0.parent
+            for slot, source_slot in zip(lod_obj.material_slots, lod0.material_slots):
+                slot.link = source_slot.link
+                slot.material = source_slot.material
+            lod_objects.append(lod_obj)
+        return lod_objects
+
+    def _prefetch_lods(self, job_index):
+        """
+        Reads the meshes of the LOD jobs up to LOD_PREFETCH_JOBS ahead and
+        hands them to the background simplifier, so their LODs are ready
+        by the time the jobs are exported.
+        """
+        simplifier = self.lod_simplifier
+        if simplifier is None:
+            return
+        simplifier.discard_before(job_index)
+        queue = self.lod_prefetch
+        while queue and queue[0][0] < job_index:
+            queue.popleft()
+
+        depsgraph = None
+        while queue and queue[0][0] <= job_index + LOD_PREFETCH_JOBS:
+            # Meshes are read at the current frame, so a frame sequence's next
+            # frame is read ahead once the scene is at that frame
+            if queue[0][1].get('frame') != self.current_frame:
+                break
+            index, job, target = queue.popleft()
+            obj = job['objects'][0]
+            if obj.library or any(mod.type == 'ARMATURE' for mod in obj.modifiers):
+                continue
+            if depsgraph is None:
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+            mesh = bpy.data.meshes.new_from_object(
+                obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph,
+            )
+            try:
+                levels = self._lod_levels(target, utils.mesh_triangle_count(mesh))
+                steps = tuple((parent, step) for _, parent, step, _ in levels)
+                if steps:
+                    simplifier.submit(obj, steps, manifest.data_digest(mesh), lod.triangle_arrays(mesh), index,
+                                      job.get('frame'))
+            finally:
+                bpy.data.meshes.remove(mesh)
+
     # =================================================================
     # 3. OBJECT GATHERING AND JOB CREATION
     # =================================================================
@@ -418,6 +1325,8 @@ class EXPORT_MESH_OT_batch(Operator):
         """
         mode = settings.mode
         object_set = set(objects)
+        # Collections and parenting are looked up once for the whole run
+        self.scene_graph = utils.SceneGraph(bpy.context.scene)
 
         if mode == 'OBJECTS':
             for obj in objects:
@@ -427,17 +1336,19 @@ class EXPORT_MESH_OT_batch(Operator):
             for obj in objects:
                 if obj.parent in object_set:
                     continue  # Will be included when its parent is processed
-                children = [c for c in obj.children_recursive if c in object_set]
+                children = self.scene_graph.descendants(obj, object_set)
                 yield self._build_job(settings, obj.name, [obj] + children, base_dir, source_obj=obj)
 
         elif mode == 'COLLECTIONS':
             collections_map = {}
             for obj in objects:
-                if obj.users_collection:
-                    primary = obj.users_collection[0]
+                primary = self.scene_graph.primary_collection(obj)
+                if primary is not None:
                     collections_map.setdefault(primary, []).append(obj)
             for coll, coll_objects in collections_map.items():
-                yield self._build_job(settings, coll.name, coll_objects, base_dir)
+                job = self._build_job(settings, coll.name, coll_objects, base_dir)
+                job['collection'] = coll
+                yield job
 
         elif mode == 'COLLECTION_SUBDIRECTORIES':
             for obj in objects:
@@ -447,7 +1358,7 @@ class EXPORT_MESH_OT_batch(Operator):
             for obj in objects:
                 if obj.parent in object_set:
                     continue
-                children = [c for c in obj.children_recursive if c in object_set]
+                children = self.scene_graph.descendants(obj, object_set)
                 yield self._build_job(settings, obj.name, [obj] + children, base_dir, source_obj=obj)
 
         elif mode == 'SCENE':
@@ -466,23 +1377,20 @@ class EXPORT_MESH_OT_batch(Operator):
         """
         job_dir = base_dir
         item_name = name
+        collection = self.scene_graph.primary_collection(source_obj) if source_obj else None
 
         # Resolve collection subdirectory if the mode calls for it
-        if 'COLLECTION_SUBDIR' in settings.mode and source_obj and source_obj.users_collection:
-            collection = source_obj.users_collection[0]
+        if 'COLLECTION_SUBDIR' in settings.mode and collection is not None:
             if collection.name != "Scene Collection":
                 if settings.full_hierarchy:
-                    hierarchy = utils.get_collection_hierarchy(collection.name)
-                    job_dir = base_dir / hierarchy
+                    job_dir = base_dir / self.scene_graph.hierarchy_path(collection)
                 else:
                     job_dir = base_dir / collection.name
-                job_dir.mkdir(parents=True, exist_ok=True)
 
         # Prepend collection name to the file stem if enabled for OBJECTS mode
-        if settings.prefix_collection and 'OBJECT' in settings.mode and source_obj and source_obj.users_collection:
-            collection_name = source_obj.users_collection[0].name
-            if collection_name != 'Scene Collection':
-                item_name = f"{collection_name}_{item_name}"
+        if settings.prefix_collection and 'OBJECT' in settings.mode and collection is not None:
+            if collection.name != 'Scene Collection':
+                item_name = f"{collection.name}_{item_name}"
 
         return {'name': item_name, 'objects': objects, 'directory': job_dir}
 
@@ -491,56 +1399,314 @@ class EXPORT_MESH_OT_batch(Operator):
     # =================================================================
 
     def _process_export_job(self, context, settings, job):
-        """Executes a single export job with full state management."""
+        """
+        Executes a single export job with full state management. The scene
+        state is set up once, then the job is exported for every target
+        (the settings, or each enabled export profile).
+        """
+        job_index = self.job_position
+        self.job_position += 1
         if not job['objects']:
             return
 
-        bpy.ops.object.select_all(action='DESELECT')
-
+        prof = self.profiler
+        if prof.enabled:
+            prof.start_job(job, sum(utils.triangle_count(obj) for obj in job['objects']))
         try:
-            with self._temporary_visibility(job['objects']):
-                with self._temporary_apply_transform(settings, job['objects']):
-                    with self._temporary_transform(settings, job['objects']):
-
-                        is_lod_job = (
-                            settings.create_lod
-                            and settings.file_format == 'FBX'
-                            and len(job['objects']) == 1
-                            and job['objects'][0].type == 'MESH'
-                        )
+            frame = job.get('frame')
+            if frame is not None and frame != self.current_frame:
+                with prof.phase('frame'):
+                    self._set_frame(context, frame)
+            if self.lod_simplifier is not None:
+                with prof.phase('lods'):
+                    self._prefetch_lods(job_index)
+
+            targets = []
+            with prof.phase('fingerprint'):
+                for target in self.targets:
+                    target_job = self._target_job(target, job)
+                    if self._is_job_unchanged(target, target_job):
+                        self.skipped_count += 1
+                        print(f"Unchanged, skipped: {self._job_output_path(target, target_job)}")
+                    elif self._is_job_journaled(target, target_job):
+                        self.resumed_count += 1
+                        print(f"Already exported, skipped: {self._job_output_path(target, target_job)}")
+                    else:
+                        targets.append((target, target_job))
+                        continue
+                    # The copy settings aren't fingerprinted, so skipped files
+                    # are still copied (copy_file leaves current copies alone)
+                    self._copy_exported_file(target, self._job_output_path(target, target_job))
+            if not targets:
+                return
+
+            # Jobs exported by collection don't need any selection or visibility changes,
+            # and jobs written by the built-in writers don't need any selection
+            by_collection = all(self._collection_export(target, target_job) for target, target_job in targets)
+            no_selection = all(
+                self._collection_export(target, target_job) or self._direct_writer(target, target_job['objects'])
+                for target, target_job in targets
+            )
+            # Baking per job can select objects for transform_apply
+            manage_selection = not (self.run_baked or no_selection or self.sandbox)
 
-                        if is_lod_job:
-                            with self._managed_lods(settings, job['objects'][0]) as lod_objects:
-                                self._select_and_export(settings, job, lod_objects)
-                        else:
-                            self._select_and_export(settings, job, job['objects'])
+            if manage_selection:
+                with prof.phase('select'):
+                    self._deselect_all(context)
+            if manage_selection or self.sandbox:
+                # Nothing is selected at the start of the job
+                self.selected = set()
+
+            try:
+                with ExitStack() as job_state:
+                    if self.sandbox is not None:
+                        # Linking into the sandbox takes the place of unhiding
+                        job_state.enter_context(prof.timed('visibility', self._sandboxed(job['objects'])))
+                    # Steps already done for the whole run are skipped here
+                    if not self.run_state and not by_collection and self.sandbox is None:
+                        job_state.enter_context(prof.timed(
+                            'visibility', self._temporary_visibility(job['objects'])))
+                    if not self.run_baked:
+                        job_state.enter_context(prof.timed(
+                            'apply_transform', self._temporary_apply_transform(settings, job['objects'])))
+                    if not self.run_transforms:
+                        job_state.enter_context(prof.timed(
+                            'transform', self._temporary_transform(settings, job['objects'])))
+
+                    for target, target_job in targets:
+                        self._export_target(target, target_job)
+            finally:
+                if manage_selection:
+                    with prof.phase('select'):
+                        self._deselect_all(context)
         finally:
-            bpy.ops.object.select_all(action='DESELECT')
+            prof.end_job()
+
+    def _export_target(self, settings, job):
+        """
+        Exports a prepared job with one target's settings, creating LODs if
+        they're wanted. A job identical to one exported before is copied
+        from that job's file instead.
+        """
+        dedupe_key = self._dedupe_key(settings, job)
+        if dedupe_key is not None and dedupe_key in self.dedupe_sources:
+            self._reuse_export(settings, job, self.dedupe_sources[dedupe_key])
+            return
+
+        with self.profiler.timed('evaluate', self._evaluated_meshes(settings, job['objects'])):
+            filepath = self._export_target_objects(settings, job)
+        if dedupe_key is not None and filepath:
+            self.dedupe_sources[dedupe_key] = filepath
+
+    def _export_target_objects(self, settings, job):
+        """Selects the job's objects, or its LOD objects, and exports them. Returns the file written."""
+        if self._is_lod_job(settings, job):
+            collection = self.sandbox.collection if self.sandbox is not None else None
+            lods = self._managed_lods(settings, job['objects'][0], collection)
+            with self.profiler.timed('lods', lods) as lod_objects:
+                filepath = self._select_and_export(settings, job, lod_objects)
+                # The LOD objects are deleted when the block ends
+                self.selected.difference_update(lod_objects)
+            return filepath
+        collection = self._collection_export(settings, job)
+        return self._select_and_export(settings, job, job['objects'], collection)
+
+    def _dedupe_key(self, settings, job):
+        """
+        With 'Reuse Identical Exports' on, returns a key that's the same for
+        jobs giving identical files: the same mesh data (before transform
+        baking), modifiers and materials, at the same effective world
+        transform, exported with the same settings. Returns None for jobs
+        that can't be compared, which are always exported.
+        """
+        if settings.dedupe_outputs == 'OFF' or settings.file_format not in DEDUPLICATED_FORMATS:
+            return None
+        if self._is_lod_job(settings, job):
+            return None
+        object_keys = []
+        for obj in job['objects']:
+            key = self._object_dedupe_key(obj)
+            if key is None:
+                return None
+            object_keys.append(key)
+        ascii_format = settings.ply_ascii if settings.file_format == 'PLY' else settings.stl_ascii
+        # Deformed meshes differ between frames of a frame sequence
+        return (
+            settings.file_format, ascii_format, settings.apply_mods, self._target_digest(settings),
+            job.get('frame'), tuple(sorted(object_keys)),
+        )
+
+    def _object_dedupe_key(self, obj):
+        if obj.type != 'MESH' or obj.data is None:
+            return None
+        data, baked_matrix = self.baked_data.get(obj.data, (obj.data, None))
+
+        # The world matrix from the current (possibly just set) transforms,
+        # without waiting for a depsgraph update. Constraints and bone or
+        # vertex parents would need one, so those objects aren't compared.
+        world = Matrix.Identity(4)
+        node = obj
+        while node is not None:
+            if node.constraints or node.parent_type != 'OBJECT':
+                return None
+            world = node.matrix_parent_inverse @ node.matrix_basis @ world if node.parent else node.matrix_basis @ world
+            node = node.parent
+        if baked_matrix is not None:
+            world = world @ baked_matrix
+
+        if obj not in self.dedupe_digests:
+            materials = tuple((slot.link, slot.material.name_full if slot.material else '') for slot in obj.material_slots)
+            self.dedupe_digests[obj] = (manifest.modifiers_digest(obj), materials)
+        modifiers, materials = self.dedupe_digests[obj]
+        return (
+            data.session_uid, modifiers, materials,
+            tuple(round(value, 6) for row in world for value in row),
+        )
+
+    def _reuse_export(self, settings, job, source):
+        """Makes a job's file from the identical file of an earlier job, by copy or hardlink."""
+        filepath = self._job_output_path(settings, job)
+        with self.profiler.phase('export'):
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            copying.copy_file(source, filepath, use_hardlinks=settings.dedupe_outputs == 'HARDLINK')
+        filepath = str(filepath)
+        self.file_count += 1
+        self.deduplicated_count += 1
+        print(f"Exported (same as {Path(source).name}): {filepath}")
+        self.profiler.add_output(filepath)
+        if self.manifest is not None and 'fingerprint' in job:
+            self.manifest.record(filepath, job['fingerprint'], source=source)
+        if self.journal is not None and 'fingerprint' in job:
+            self.journal.record(filepath, job['fingerprint'])
+        with self.profiler.phase('copy'):
+            self._copy_exported_file(settings, filepath)
+
+    def _is_lod_job(self, settings, job):
+        return (
+            settings.create_lod
+            and settings.file_format == 'FBX'
+            and len(job['objects']) == 1
+            and job['objects'][0].type == 'MESH'
+        )
+
+    def _collection_export(self, settings, job):
+        """
+        Returns the name of the collection a COLLECTIONS mode job can be
+        exported by, through the exporter's collection option. Returns None
+        when it has to be exported through the selection: the exporter
+        has no collection option, LODs are created, or the collection
+        (with its children) holds objects the job leaves out, or hidden ones.
+        """
+        collection = job.get('collection')
+        # The collection is in the user's scene, not the sandbox
+        if collection is None or self.sandbox is not None or collection.library or settings.file_format not in COLLECTION_EXPORT_OPERATORS:
+            return None
+        if self._is_lod_job(settings, job):
+            return None
+        operator, _selection_option = COLLECTION_EXPORT_OPERATORS[settings.file_format]
+        if not utils.operator_has_property(operator, 'collection'):
+            return None
+
+        if 'collection_exportable' not in job:
+            exportable = set(collection.all_objects) == set(job['objects'])
+            if exportable:
+                for obj in job['objects']:
+                    while obj is not None and exportable:
+                        exportable = not obj.hide_get()
+                        obj = obj.parent
+            job['collection_exportable'] = exportable
+        return collection.name if job['collection_exportable'] else None
+
+    def _target_job(self, settings, job):
+        """
+        The job as exported with a target's settings. Profiles with a
+        sub-directory export into it, keeping any collection sub-directories.
+        """
+        if not isinstance(settings, ProfileSettings):
+            return job
+        subdir = settings.profile.directory.strip('/\\')
+        if not subdir:
+            # A copy all the same, as the fingerprint stored on it is the target's
+            return dict(job)
+        try:
+            relative = job['directory'].relative_to(self.base_dir)
+        except ValueError:
+            relative = Path()
+        return dict(job, directory=self.base_dir / subdir / relative)
 
-    def _select_and_export(self, settings, job, objects_to_export):
-        """Selects the given objects and dispatches the appropriate export operator."""
-        for obj in objects_to_export:
-            if obj and obj.name in bpy.data.objects:
-                obj.select_set(True)
+    def _target_digest(self, settings):
+        return settings.profile_digest if isinstance(settings, ProfileSettings) else ''
 
-        filepath = self._dispatch_export(settings, job)
+    def _select_and_export(self, settings, job, objects_to_export, collection=None):
+        """
+        Selects the given objects and dispatches the appropriate export
+        operator. Given a collection name, the exporter is pointed at the
+        collection instead and the selection is left alone.
+        Returns the file written, or None.
+        """
+        prof = self.profiler
+        direct = collection is None and self._direct_writer(settings, objects_to_export)
+        if collection is None and not direct:
+            with prof.phase('select'):
+                self._select_objects(objects_to_export)
+
+        self.export_collection = collection
+        try:
+            with prof.phase('export'):
+                if direct:
+                    filepath = self._write_directly(settings, job, objects_to_export)
+                else:
+                    filepath = self._dispatch_export(settings, job)
+        finally:
+            self.export_collection = None
 
         if filepath:
             self.file_count += 1
             print(f"Exported: {filepath}")
-            self._copy_exported_file(settings, filepath)
+            prof.add_output(filepath)
+            if self.manifest is not None and 'fingerprint' in job:
+                self.manifest.record(filepath, job['fingerprint'])
+            if self.journal is not None and 'fingerprint' in job:
+                self.journal.record(filepath, job['fingerprint'])
+            with prof.phase('copy'):
+                self._copy_exported_file(settings, filepath)
+        return filepath
+
+    def _select_objects(self, objects):
+        """
+        Selects the objects to export, changing only those that differ from
+        the current selection (`self.selected`). That way a job exported for
+        several profiles, or jobs in a scene prepared once per run, don't
+        need everything deselected in between.
+        """
+        wanted = {obj for obj in objects if obj and obj.name in bpy.data.objects}
+        for obj in self.selected - wanted:
+            obj.select_set(False)
+        for obj in wanted - self.selected:
+            obj.select_set(True)
+        self.selected = wanted
+
+    def _job_fp_no_ext(self, settings, job):
+        """Returns the job's output path without a file extension."""
+        clean_name = settings.prefix + bpy.path.clean_name(job['name']) + settings.suffix
+        if 'frame' in job:
+            clean_name += f"_{job['frame']:04d}"
+        return job['directory'] / clean_name
+
+    def _job_output_path(self, settings, job):
+        """Returns the full output path (with extension) a job will be exported to."""
+        fp_no_ext = self._job_fp_no_ext(settings, job)
+        if settings.file_format == 'USD':
+            return Path(str(fp_no_ext) + settings.usd_format)
+        return Path(str(fp_no_ext) + FORMAT_EXTENSIONS[settings.file_format])
 
     def _dispatch_export(self, settings, job):
         """
         Builds the output filepath and calls the correct Blender export operator.
         Returns the full filepath string on success, or None.
         """
-        prefix = settings.prefix
-        suffix = settings.suffix
-        clean_name = prefix + bpy.path.clean_name(job['name']) + suffix
-
         # Ensure any prefix subdirectory exists
-        fp_no_ext = job['directory'] / clean_name
+        fp_no_ext = self._job_fp_no_ext(settings, job)
         fp_no_ext.parent.mkdir(parents=True, exist_ok=True)
 
         fmt = settings.file_format
@@ -566,14 +1732,231 @@ class EXPORT_MESH_OT_batch(Operator):
 
         return None
 
+    def _direct_writer(self, settings, objects):
+        """True if the objects can be written by the built-in writers instead of the exporter."""
+        file_format = settings.file_format
+        if not settings.use_direct_writer or file_format not in writers.WRITTEN_FORMATS:
+            return False
+        # The OBJ writer only knows the exporter's default options
+        if file_format == 'OBJ' and self._preset_options(settings):
+            return False
+        return all(writers.supports(obj, file_format) for obj in objects)
+
+    def _write_directly(self, settings, job, objects):
+        """
+        Writes a job's objects with the built-in writers, straight from the
+        evaluated mesh data. Returns the full filepath string.
+        """
+        filepath = self._job_output_path(settings, job)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath = str(filepath)
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+        file_format = settings.file_format
+        if file_format == 'STL':
+            writers.write_stl(filepath, objects, depsgraph, settings.apply_mods, settings.stl_ascii)
+        elif file_format == 'PLY':
+            writers.write_ply(filepath, objects, depsgraph, settings.apply_mods, settings.ply_ascii)
+        elif file_format == 'OBJ':
+            writers.write_obj(filepath, objects, depsgraph, settings.apply_mods)
+        return filepath
+
+    # =================================================================
+    # 4b. EXPORT PLAN
+    # =================================================================
+
+    def _make_plan(self, context, settings, jobs, digest):
+        """
+        Lists every output path the jobs would write, with vertex/triangle
+        counts and an estimated file size, and flags jobs that would
+        overwrite each other. The plan is cached so it can be exported
+        directly afterwards.
+        """
+        plan = planning.ExportPlan(context.scene.name_full, digest, self.base_dir)
+        depsgraph = None
+        if any(target.apply_mods for target in self.targets):
+            depsgraph = context.evaluated_depsgraph_get()
+        for job in jobs:
+            stats = {}
+            for target in self.targets:
+                # Counted with or without modifiers, whichever the target exports
+                if target.apply_mods not in stats:
+                    vertices = triangles = 0
+                    for obj in job['objects']:
+                        v, t = planning.object_stats(obj, depsgraph if target.apply_mods else None)
+                        vertices += v
+                        triangles += t
+                    stats[target.apply_mods] = (vertices, triangles)
+                vertices, triangles = stats[target.apply_mods]
+                ascii_format = (
+                    (target.file_format == 'PLY' and target.ply_ascii)
+                    or (target.file_format == 'STL' and target.stl_ascii)
+                )
+                size = planning.estimate_size(target.file_format, vertices, triangles, ascii_format)
+                output_path = self._job_output_path(target, self._target_job(target, job))
+                plan.add(job, output_path, vertices, triangles, size)
+
+        planning.cached_plans[plan.scene_name] = plan
+        plan.print_summary()
+        try:
+            print(f"Export plan written to {plan.write()}")
+        except OSError as e:
+            print(f"Could not write export plan: {e}")
+
+        collisions = plan.collisions()
+        msg = f"Plan: {len(plan.entries)} file(s), about {plan.total_bytes() / 1e6:.1f} MB"
+        if collisions:
+            self._report({'WARNING'}, msg + f". {len(collisions)} name collision(s), see the console.")
+        else:
+            self._report({'INFO'}, msg + ". No name collisions.")
+        return {'FINISHED'}
+
+    # =================================================================
+    # 4c. PARALLEL EXPORT
+    # =================================================================
+
+    def _run_parallel(self, context, settings, prefs, job_count):
+        """
+        Saves a snapshot of the current file and splits the jobs between
+        several background Blender processes, each exporting every Nth job
+        (or a chunk of the frames of a frame sequence). Their results are
+        merged back into this operator's counters.
+        """
+        worker_count = min(prefs.worker_count, job_count)
+        shared = {
+            'shard_count': worker_count,
+            'directory_override': str(self.base_dir),
+            'mesh_cache_limit_override': self._mesh_cache_limit(prefs),
+        }
+        # Relative paths would resolve against the snapshot, so pass them on
+        # absolute. Workers only make copies when given a copy directory.
+        if self._copies_enabled(settings, prefs):
+            shared['copy_directory_override'] = str(self._resolve_copy_dir(settings))
+
+        with tempfile.TemporaryDirectory(prefix="sdbe_workers_") as tmp_dir:
+            snapshot = workers.save_snapshot(tmp_dir)
+            shard_kwargs = [dict(shared, shard_index=i) for i in range(worker_count)]
+            results = workers.run_workers(snapshot, __package__, shard_kwargs, tmp_dir)
+
+        failed = 0
+        for i, result in enumerate(results):
+            self.file_count += result.get('file_count', 0)
+            self.copy_count += result.get('copy_count', 0)
+            self.copy_unchanged += result.get('copy_unchanged', 0)
+            self.copy_failures.extend(tuple(f) for f in result.get('copy_failures', []))
+            self.skipped_count += result.get('skipped_count', 0)
+            self.deduplicated_count += result.get('deduplicated_count', 0)
+            self.resumed_count += result.get('resumed_count', 0)
+            self.retried_count += result.get('retried_count', 0)
+            self.failures.extend(tuple(f) for f in result.get('failures', []))
+            self.skipped_lods.extend(result.get('skipped_lods', []))
+            if settings.write_profile:
+                self.profiler.rows.extend(result.get('profile', []))
+            for level, message in result.get('messages', []):
+                if level != 'INFO':
+                    self.report({level}, message)
+            if self.manifest is not None:
+                self.manifest.entries.update(result.get('manifest', {}))
+            if result.get('error') or result.get('status') == 'CANCELLED':
+                failed += 1
+                print(f"Export worker {i + 1} failed: {result.get('error', 'see messages above')}")
+
+        self._save_manifest()
+
+        if failed:
+            # Keep the workers' journal, so the export can be resumed
+            if self.journal is not None:
+                self.journal.close()
+            self.report({'ERROR'}, f"{failed} of {worker_count} export workers failed "
+                                   f"({self.file_count} file(s) exported). Check the console for details.")
+            return {'CANCELLED'}
+
+        self._report_results(context, settings)
+        return {'FINISHED'}
+
+    def _result_dict(self, result):
+        """Summary of this run, written to `result_path` for the parent process."""
+        status = sorted(result)[0]
+        # A run that carried on past failed jobs isn't reported as a clean one
+        if status == 'FINISHED' and self.failures:
+            status = 'PARTIAL'
+        return {
+            'status': status,
+            'file_count': self.file_count,
+            'copy_count': self.copy_count,
+            'copy_unchanged': self.copy_unchanged,
+            'copy_failures': self.copy_failures,
+            'skipped_count': self.skipped_count,
+            'deduplicated_count': self.deduplicated_count,
+            'resumed_count': self.resumed_count,
+            'retried_count': self.retried_count,
+            'failures': self.failures,
+            'skipped_lods': self.skipped_lods,
+            'profile': list(self.profiler.rows),
+            'messages': self.messages,
+            'manifest': self.manifest.recorded if self.manifest is not None else {},
+        }
+
     # =================================================================
     # 5. POST-PROCESSING AND REPORTING
     # =================================================================
 
+    def _load_preset(self, operator, preset):
+        """
+        Returns a copy of a preset's options. Presets are resolved once per
+        run, so the preset file isn't looked up again for every job.
+        """
+        key = (operator, preset)
+        if key not in self.presets:
+            self.presets[key] = utils.load_operator_preset(operator, preset)
+        return dict(self.presets[key])
+
+    def _preset_options(self, settings):
+        """Returns the preset options used by the current file format."""
+        if settings.file_format not in FORMAT_PRESETS:
+            return {}
+        operator, preset_attr = FORMAT_PRESETS[settings.file_format]
+        return self._load_preset(operator, getattr(settings, preset_attr))
+
+    def _job_fingerprint(self, settings, job):
+        """
+        Fingerprints the job, storing it on the job for the manifest and the
+        journal. Done before the scene is changed for the job.
+        """
+        if 'fingerprint' not in job:
+            output_path = self._job_output_path(settings, job)
+            job['fingerprint'] = self.fingerprinter.job(job, output_path, self._target_digest(settings))
+        return job['fingerprint']
+
+    def _is_job_unchanged(self, settings, job):
+        """
+        For incremental exports: fingerprints the job and checks whether
+        its output is still up to date.
+        """
+        if self.fingerprinter is None:
+            return False
+        fingerprint = self._job_fingerprint(settings, job)
+        if self.manifest is None:
+            return False
+        return self.manifest.is_current(self._job_output_path(settings, job), fingerprint)
+
+    def _is_job_journaled(self, settings, job):
+        """When resuming: true if the interrupted run already exported the job, and its file is unchanged."""
+        if self.journal is None or not self.journal.entries:
+            return False
+        return self.journal.is_done(self._job_output_path(settings, job), self._job_fingerprint(settings, job))
+
+    def _save_manifest(self):
+        if self.manifest is None:
+            return
+        try:
+            self.manifest.save()
+        except OSError as e:
+            print(f"Could not write export manifest: {e}")
+
     def _copy_exported_file(self, settings, exported_file_path):
-        """Copies the exported file to the secondary copy directory if enabled."""
-        prefs = bpy.context.preferences.addons[__package__].preferences
-        if not (prefs.copy_on_export and settings.copy_on_export):
+        """Queues a copy of the exported file into the secondary copy directory, if enabled."""
+        if self.copy_queue is None:
             return
 
         exported_path = Path(exported_file_path)
@@ -581,28 +1964,49 @@ class EXPORT_MESH_OT_batch(Operator):
             return
 
         try:
-            main_export_root = self._resolve_base_dir(settings, prefs)
-            try:
-                relative_path = exported_path.relative_to(main_export_root)
-            except ValueError:
-                relative_path = exported_path.name
-
-            dest_root = Path(bpy.path.abspath(settings.copy_directory)).resolve()
-            copy_path = dest_root / relative_path
-            copy_path.parent.mkdir(parents=True, exist_ok=True)
-
-            shutil.copy(exported_path, copy_path)
-            self.copy_count += 1
-            print(f"Copied to: {copy_path}")
-        except Exception as e:
-            print(f"Copy failed: {e}")
+            relative_path = exported_path.relative_to(self.base_dir)
+        except ValueError:
+            relative_path = exported_path.name
+        self.copy_queue.submit(exported_path, self.copy_root / relative_path)
+
+    def _finish_copies(self):
+        """Waits for the queued copies to finish and collects their outcome."""
+        if self.copy_queue is None:
+            return
+        copied, unchanged, failures = self.copy_queue.wait()
+        self.copy_count += copied
+        self.copy_unchanged += unchanged
+        self.copy_failures.extend(failures)
+        self.copy_queue = None
 
     def _report_results(self, context, settings):
         """Reports the final export summary to the user."""
         prefs = context.preferences.addons[__package__].preferences
-        copies_enabled = prefs.copy_on_export and settings.copy_on_export
+        copies_enabled = self._copies_enabled(settings, prefs)
 
-        if self.file_count == 0:
+        # Workers hand their rows to the parent, which writes the merged profile
+        if settings.write_profile and self.profiler.rows and self.shard_count <= 1:
+            self.profiler.print_slowest(settings.profile_top_n)
+            try:
+                print(f"Export profile written to {self.profiler.write(self.base_dir)}")
+            except OSError as e:
+                print(f"Could not write export profile: {e}")
+
+        if self.lod_cache is not None:
+            print(f"LOD cache: {self.lod_cache.misses} decimated, {self.lod_cache.hits} loaded")
+
+        # The run is complete, so there's nothing left to resume, unless jobs
+        # failed. Workers leave the shared journal to the parent.
+        if self.journal is not None and self.shard_count <= 1:
+            if self.failures:
+                self.journal.close()
+            else:
+                self.journal.remove()
+
+        if self.file_count == 0 and not self.failures:
+            if self.skipped_count or self.resumed_count:
+                self.report({'INFO'}, f"All {self.skipped_count + self.resumed_count} file(s) are up to date. Nothing was exported.")
+                return
             self.report({'WARNING'}, "Operation complete. No files were exported.")
             return
 
@@ -610,17 +2014,47 @@ class EXPORT_MESH_OT_batch(Operator):
         msg = f"Exported {self.file_count} file(s)"
         if copies_enabled and self.copy_count > 0:
             msg += f" (with {self.copy_count} copies)"
-
-        # If we skipped any LODs, change the final report to a warning
-        if hasattr(self, 'skipped_lods') and self.skipped_lods:
-            msg += f". WARNING: Skipped LOD generation for {len(self.skipped_lods)} linked object(s)."
+        if copies_enabled and self.copy_unchanged > 0:
+            msg += f" ({self.copy_unchanged} copies already up to date)"
+        if self.deduplicated_count:
+            msg += f" ({self.deduplicated_count} copied from identical exports)"
+        if self.skipped_count:
+            msg += f" and skipped {self.skipped_count} unchanged"
+        if self.resumed_count:
+            msg += f" (resumed: {self.resumed_count} already exported by the interrupted run)"
+
+        # If any jobs failed, LODs were skipped or copies failed, change the final report to a warning
+        warnings = []
+        if self.failures:
+            warnings.append(f"{len(self.failures)} job(s) failed.")
+            if self.retried_count:
+                warnings.append(f"{self.retried_count - len(self.failures)} of {self.retried_count} "
+                                f"failed job(s) succeeded on retry.")
+        if self.skipped_lods:
+            warnings.append(f"Skipped LOD generation for {len(self.skipped_lods)} linked object(s).")
+        if self.copy_failures:
+            warnings.append(f"{len(self.copy_failures)} copies failed.")
+
+        if warnings:
+            msg += ". WARNING: " + " ".join(warnings)
             self.report({'WARNING'}, msg)
-            
-            # Print the exact list to the console so the user can check which ones
+
+            # Print the exact lists to the console so the user can check which ones
             print(f"\n--- BATCH EXPORT WARNING ---")
-            print(f"Skipped LOD generation for the following linked objects:")
-            for name in self.skipped_lods:
-                print(f"  - {name}")
+            if self.failures:
+                print(f"The following jobs failed:")
+                for name, error in self.failures:
+                    print(f"  - {name}: {error}")
+                if self.journal is not None:
+                    print(f"Resume the export to retry only the failed jobs.")
+            if self.skipped_lods:
+                print(f"Skipped LOD generation for the following linked objects:")
+                for name in self.skipped_lods:
+                    print(f"  - {name}")
+            if self.copy_failures:
+                print(f"Copying failed for the following files:")
+                for path, error in self.copy_failures:
+                    print(f"  - {path}: {error}")
             print(f"----------------------------\n")
         else:
             # Clean success
@@ -633,14 +2067,21 @@ class EXPORT_MESH_OT_batch(Operator):
     # full output filepath (with extension) as a string.
     # =================================================================
 
+    def _scope_options(self, file_format):
+        """The exporter options limiting the export to the job: its selection, or its collection."""
+        _operator, selection_option = COLLECTION_EXPORT_OPERATORS[file_format]
+        if self.export_collection:
+            return {selection_option: False, 'collection': self.export_collection}
+        return {selection_option: True}
+
     def _export_fbx(self, settings, fp_no_ext):
         full_path = str(fp_no_ext) + '.fbx'
-        options = utils.load_operator_preset('export_scene.fbx', settings.fbx_preset)
+        options = self._load_preset('export_scene.fbx', settings.fbx_preset)
         options.update({
             "filepath": full_path,
-            "use_selection": True,
             "use_mesh_modifiers": settings.apply_mods,
         })
+        options.update(self._scope_options('FBX'))
         bpy.ops.export_scene.fbx(**options)
         return full_path
 
@@ -648,51 +2089,53 @@ class EXPORT_MESH_OT_batch(Operator):
         # glTF exporter appends the extension itself when export_format is set,
         # so we pass the path without extension and let Blender handle it.
         full_path = str(fp_no_ext) + '.glb'
-        options = utils.load_operator_preset('export_scene.gltf', settings.gltf_preset)
+        options = self._load_preset('export_scene.gltf', settings.gltf_preset)
         options.update({
             "filepath": str(fp_no_ext),
             "export_format": 'GLB',
-            "use_selection": True,
             "export_apply": settings.apply_mods,
         })
+        options.update(self._scope_options('glTF'))
         bpy.ops.export_scene.gltf(**options)
         return full_path
 
     def _export_alembic(self, settings, fp_no_ext):
         full_path = str(fp_no_ext) + '.abc'
-        options = utils.load_operator_preset('wm.alembic_export', settings.abc_preset)
+        options = self._load_preset('wm.alembic_export', settings.abc_preset)
         options.update({
             "filepath": full_path,
-            "selected": True,
             "start": settings.frame_start,
             "end": settings.frame_end,
         })
+        options.update(self._scope_options('ABC'))
         # Use EXEC_REGION_WIN to force foreground execution.
         # alembic_export runs as a background job by default (via INVOKE), which
         # breaks batch export order. The 'as_background_job' kwarg is deprecated;
         # passing an explicit execution context is the recommended workaround.
         # See: docs.blender.org/api/current/bpy.ops.html#execution-context
-        bpy.ops.wm.alembic_export('EXEC_REGION_WIN', **options)
+        # Without a UI there's no region, and no background jobs either.
+        exec_context = 'EXEC_DEFAULT' if bpy.app.background else 'EXEC_REGION_WIN'
+        bpy.ops.wm.alembic_export(exec_context, **options)
         return full_path
 
     def _export_usd(self, settings, fp_no_ext):
         full_path = str(fp_no_ext) + settings.usd_format
-        options = utils.load_operator_preset('wm.usd_export', settings.usd_preset)
+        options = self._load_preset('wm.usd_export', settings.usd_preset)
         options.update({
             "filepath": full_path,
-            "selected_objects_only": True,
         })
+        options.update(self._scope_options('USD'))
         bpy.ops.wm.usd_export(**options)
         return full_path
 
     def _export_obj(self, settings, fp_no_ext):
         full_path = str(fp_no_ext) + '.obj'
-        options = utils.load_operator_preset('wm.obj_export', settings.obj_preset)
+        options = self._load_preset('wm.obj_export', settings.obj_preset)
         options.update({
             "filepath": full_path,
-            "export_selected_objects": True,
             "apply_modifiers": settings.apply_mods,
         })
+        options.update(self._scope_options('OBJ'))
         bpy.ops.wm.obj_export(**options)
         return full_path
 
@@ -701,8 +2144,8 @@ class EXPORT_MESH_OT_batch(Operator):
         bpy.ops.wm.ply_export(
             filepath=full_path,
             ascii_format=settings.ply_ascii,
-            export_selected_objects=True,
             apply_modifiers=settings.apply_mods,
+            **self._scope_options('PLY'),
         )
         return full_path
 
@@ -711,8 +2154,8 @@ class EXPORT_MESH_OT_batch(Operator):
         bpy.ops.wm.stl_export(
             filepath=full_path,
             ascii_format=settings.stl_ascii,
-            export_selected_objects=True,
             apply_modifiers=settings.apply_mods,
+            **self._scope_options('STL'),
         )
         return full_path
 
@@ -775,8 +2218,58 @@ class BATCH_EXPORT_OT_list_remove(Operator):
         return {'FINISHED'}
 
 
+class BATCH_EXPORT_OT_profile_add(Operator):
+    """Add an export profile, starting from the current export settings"""
+    bl_idname = "batch_export.profile_add"
+    bl_label = "Add Export Profile"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.batch_export
+        profile = settings.profiles.add()
+        for option in properties.PROFILE_OPTIONS:
+            setattr(profile, option, getattr(settings, option))
+        profile.name = f"{settings.file_format} {len(settings.profiles)}"
+        settings.profiles_index = len(settings.profiles) - 1
+        return {'FINISHED'}
+
+
+class BATCH_EXPORT_OT_profile_remove(Operator):
+    """Remove the active export profile"""
+    bl_idname = "batch_export.profile_remove"
+    bl_label = "Remove Export Profile"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        settings = context.scene.batch_export
+        return len(settings.profiles) > 0
+
+    def execute(self, context):
+        settings = context.scene.batch_export
+        idx = settings.profiles_index
+        if 0 <= idx < len(settings.profiles):
+            settings.profiles.remove(idx)
+            settings.profiles_index = max(0, idx - 1)
+        return {'FINISHED'}
+
+
+class BATCH_EXPORT_OT_clear_lod_cache(Operator):
+    """Delete the decimated LOD meshes kept between exports"""
+    bl_idname = "batch_export.clear_lod_cache"
+    bl_label = "Clear LOD Cache"
+
+    def execute(self, context):
+        count = lod.clear_cache()
+        self.report({'INFO'}, f"Deleted {count} cached LOD mesh(es).")
+        return {'FINISHED'}
+
+
 registry = [
     EXPORT_MESH_OT_batch,
     BATCH_EXPORT_OT_list_add,
     BATCH_EXPORT_OT_list_remove,
+    BATCH_EXPORT_OT_profile_add,
+    BATCH_EXPORT_OT_profile_remove,
+    BATCH_EXPORT_OT_clear_lod_cache,
 ]
@@ -1,6 +1,7 @@
 import bpy
 from bpy.types import Panel, UIList
 from . import get_icon_id
+from . import planning
 import os
 
 
@@ -11,6 +12,12 @@ class BATCH_EXPORT_UL_object_list(UIList):
         else:
             layout.label(text="(deleted)", icon='ERROR')
 
+class BATCH_EXPORT_UL_profile_list(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_property, index=0, flt_flag=0):
+        layout.prop(item, 'enabled', text="")
+        layout.prop(item, 'name', text="", emboss=False)
+        layout.label(text=item.file_format)
+
 # Method to get addon name - sometimes more reliable than __package__
 def get_addon_name_from_bl_info():
     # Try to get the addon name from bl_info in the __init__.py
@@ -42,6 +49,11 @@ def draw_settings(self, context):
         self.layout.operator('export_mesh.batch', icon_value=icon_id)
     else:
         self.layout.operator('export_mesh.batch', icon='EXPORT')
+    row = self.layout.row(align=True)
+    row.operator('export_mesh.batch', text="Plan", icon='PRESET').plan_only = True
+    sub = row.row(align=True)
+    sub.enabled = context.scene.name_full in planning.cached_plans
+    sub.operator('export_mesh.batch', text="Export Plan", icon='PLAY').use_plan = True
 
     # Options
     self.layout.separator()
@@ -49,10 +61,22 @@ def draw_settings(self, context):
     col.prop(settings, 'directory')
     if copies and settings.copy_on_export:
         col.prop(settings, 'copy_directory')
+        col.prop(settings, 'copy_use_hardlinks')
     if copies:
         col.prop(settings, 'copy_on_export')
     col.prop(settings, 'prefix')
     col.prop(settings, 'suffix')
+    col.prop(settings, 'incremental')
+    col.prop(settings, 'use_journal')
+    if settings.use_journal:
+        row = col.row()
+        row.separator()
+        row.prop(settings, 'resume_export')
+    col.prop(settings, 'continue_on_error')
+    if settings.continue_on_error:
+        row = col.row()
+        row.separator()
+        row.prop(settings, 'retry_failed', text="")
     self.layout.separator()
 
     # Export Settings
@@ -61,6 +85,11 @@ def draw_settings(self, context):
     col.prop(settings, 'file_format')
     col.prop(settings, 'mode')
     col.prop(settings, 'limit')
+    col.prop(settings, 'frame_sequence')
+    if settings.frame_sequence:
+        row = col.row(align=True)
+        row.prop(settings, 'frame_start')
+        row.prop(settings, 'frame_end')
     if settings.limit == 'LIST':
         list_row = self.layout.row()
         list_row.template_list(
@@ -79,33 +108,43 @@ def draw_settings(self, context):
     self.layout.separator()
 
     # Settings
-    col = self.layout.column()
-    col.label(text=settings.file_format + " Settings:")
-    if settings.file_format == 'ABC':
-        col.prop(settings, 'abc_preset_enum')
-        col.prop(settings, 'frame_start')
-        col.prop(settings, 'frame_end')
-    elif settings.file_format == 'USD':
-        col.prop(settings, 'usd_format')
-        col.prop(settings, 'usd_preset_enum')
-    elif settings.file_format == 'OBJ':
-        col.prop(settings, 'obj_preset_enum')
-        self.layout.prop(settings, 'apply_mods')
-    elif settings.file_format == 'PLY':
-        col.prop(settings, 'ply_ascii')
-        self.layout.prop(settings, 'apply_mods')
-    elif settings.file_format == 'STL':
-        col.prop(settings, 'stl_ascii')
-        self.layout.prop(settings, 'apply_mods')
-    elif settings.file_format == 'FBX':
-        col.prop(settings, 'fbx_preset_enum')
-        self.layout.prop(settings, 'apply_mods')
-    elif settings.file_format == 'glTF':
-        col.prop(settings, 'gltf_preset_enum')
-        self.layout.prop(settings, 'apply_mods')
+    if settings.use_profiles:
+        self.layout.label(text="Format settings are set per export profile.")
+    else:
+        col = self.layout.column()
+        col.label(text=settings.file_format + " Settings:")
+        draw_format_settings(self.layout, col, settings)
     self.layout.use_property_split = False
     self.layout.separator()
 
+    # Export Profiles (collapsible)
+    header, body = self.layout.panel("sdbe_profiles_panel", default_closed=True)
+    header.prop(settings, 'use_profiles')
+    if body is not None:
+        body.enabled = settings.use_profiles
+        list_row = body.row()
+        list_row.template_list(
+            "BATCH_EXPORT_UL_profile_list", "",
+            settings, "profiles",
+            settings, "profiles_index",
+            rows=3,
+        )
+        side = list_row.column(align=True)
+        side.operator("batch_export.profile_add", text="", icon='ADD')
+        side.operator("batch_export.profile_remove", text="", icon='REMOVE')
+        if 0 <= settings.profiles_index < len(settings.profiles):
+            profile = settings.profiles[settings.profiles_index]
+            col = body.column(align=True)
+            col.prop(profile, 'directory')
+            col.prop(profile, 'prefix')
+            col.prop(profile, 'suffix')
+            col = body.column()
+            col.prop(profile, 'file_format')
+            draw_format_settings(body, col, profile)
+            if profile.file_format == 'FBX':
+                draw_lod_settings(body, profile, settings)
+        self.layout.separator()
+
     # Object Types Filter
     self.layout.label(text="Object Types:")
     grid = self.layout.grid_flow(columns=3, align=True)
@@ -138,15 +177,76 @@ def draw_settings(self, context):
             col.prop(settings, 'scale', text="")
 
 
+    # Performance (collapsible)
+    header, body = self.layout.panel("sdbe_performance_panel", default_closed=True)
+    header.label(text="Performance:")
+    if body is not None:
+        col = body.column(align=True)
+        col.prop(settings, 'modal_export')
+        col.prop(settings, 'prepare_once')
+        col.prop(settings, 'use_sandbox')
+        col.prop(settings, 'cache_evaluated')
+        if settings.file_format in {'PLY', 'STL'} or settings.use_profiles:
+            col.prop(settings, 'dedupe_outputs')
+        if settings.file_format in {'PLY', 'STL', 'OBJ'} or settings.use_profiles:
+            col.prop(settings, 'use_direct_writer')
+        col.prop(settings, 'write_profile')
+        if settings.write_profile:
+            row = col.row()
+            row.separator()
+            row.prop(settings, 'profile_top_n')
+
     # LOD Creation
-    if settings.file_format == 'FBX':
-        col = self.layout.column(align=True, heading="Level of Detail:")
-        col.prop(settings, 'create_lod')
-        if settings.create_lod:
-            col.prop(settings, 'lod_count')
-            for count in range(settings.lod_count):
+    if settings.file_format == 'FBX' and not settings.use_profiles:
+        draw_lod_settings(self.layout, settings, settings)
+
+
+# Draws the format specific options of the settings or an export profile
+def draw_format_settings(layout, col, data):
+    if data.file_format == 'ABC':
+        col.prop(data, 'abc_preset_enum')
+        # Export profiles share the frame range of the settings
+        if hasattr(data, 'frame_start'):
+            col.prop(data, 'frame_start')
+            col.prop(data, 'frame_end')
+    elif data.file_format == 'USD':
+        col.prop(data, 'usd_format')
+        col.prop(data, 'usd_preset_enum')
+    elif data.file_format == 'OBJ':
+        col.prop(data, 'obj_preset_enum')
+        layout.prop(data, 'apply_mods')
+    elif data.file_format == 'PLY':
+        col.prop(data, 'ply_ascii')
+        layout.prop(data, 'apply_mods')
+    elif data.file_format == 'STL':
+        col.prop(data, 'stl_ascii')
+        layout.prop(data, 'apply_mods')
+    elif data.file_format == 'FBX':
+        col.prop(data, 'fbx_preset_enum')
+        layout.prop(data, 'apply_mods')
+    elif data.file_format == 'glTF':
+        col.prop(data, 'gltf_preset_enum')
+        layout.prop(data, 'apply_mods')
+
+
+# `settings` are the scene settings, which hold the LOD method and cache
+# for every profile
+def draw_lod_settings(layout, data, settings):
+    col = layout.column(align=True, heading="Level of Detail:")
+    col.prop(data, 'create_lod')
+    if data.create_lod:
+        col.prop(data, 'lod_count')
+        col.prop(settings, 'lod_method')
+        col.prop(settings, 'lod_cache')
+        col.prop(data, 'lod_mode')
+        if data.lod_mode == 'BUDGET':
+            for count in range(data.lod_count):
+                col.prop(data, f'lod{count+1}_budget')
+            col.prop(data, 'lod_min_reduction')
+        else:
+            for count in range(data.lod_count):
                 prop_name = f'lod{count+1}_ratio'
-                col.prop(settings, prop_name)
+                col.prop(data, prop_name)
 
 
 # Draws the button and popover dropdown button used in the
@@ -279,6 +379,7 @@ class POPOVER_PT_batch_export(Panel):
 
 registry = [
     BATCH_EXPORT_UL_object_list,
+    BATCH_EXPORT_UL_profile_list,
     POPOVER_PT_batch_export,
     VIEW3D_PT_batch_export,
 ]
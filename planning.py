@@ -0,0 +1,136 @@
+import bpy
+import json
+from pathlib import Path
+
+PLAN_NAME = ".sdbe_plan.json"
+
+# Rough output size per format: (bytes per file, per vertex, per triangle).
+# Only meant to give an idea of the total size before a large export.
+SIZE_ESTIMATES = {
+    'FBX': (12000, 40, 14),
+    'glTF': (1500, 32, 6),
+    'ABC': (4000, 40, 16),
+    'USD': (3000, 40, 16),
+    'OBJ': (200, 90, 40),
+    'PLY': (300, 32, 13),
+    'STL': (84, 0, 50),
+    'SVG': (1000, 0, 60),
+    'PDF': (2000, 0, 60),
+}
+
+# Scene name -> the last ExportPlan made for it, so it can be exported
+# without gathering and filtering the objects again.
+cached_plans = {}
+
+
+def object_stats(obj, depsgraph=None):
+    """
+    Returns (vertices, triangles) of an object. With a depsgraph the counts
+    are those of the evaluated mesh, i.e. after modifiers. Only lengths of
+    the mesh arrays are read; nothing is looped over in Python.
+    """
+    if obj.type != 'MESH':
+        return 0, 0
+    mesh = obj.evaluated_get(depsgraph).data if depsgraph is not None else obj.data
+    return len(mesh.vertices), len(mesh.loops) - 2 * len(mesh.polygons)
+
+
+def _path_key(path):
+    # Paths that only differ in case collide on Windows and macOS drives
+    return str(path).lower()
+
+
+def estimate_size(file_format, vertices, triangles, ascii_format=False):
+    per_file, per_vertex, per_triangle = SIZE_ESTIMATES.get(file_format, (0, 0, 0))
+    size = per_file + per_vertex * vertices + per_triangle * triangles
+    # ASCII variants are several times the size of binary ones
+    return size * 4 if ascii_format else size
+
+
+class ExportPlan:
+    """
+    The jobs a batch export would run, with their output paths, expected
+    size and any jobs that would overwrite each other's files.
+    """
+
+    def __init__(self, scene_name, digest, base_dir):
+        self.scene_name = scene_name
+        self.digest = digest
+        self.base_dir = Path(base_dir)
+        self.entries = []
+
+    def add(self, job, output_path, vertices, triangles, size):
+        self.entries.append({
+            'name': job['name'],
+            'objects': [obj.name for obj in job['objects']],
+            'directory': str(job['directory']),
+            'output': str(output_path),
+            'vertices': vertices,
+            'triangles': triangles,
+            'estimated_bytes': size,
+        })
+
+    def collisions(self):
+        """
+        Output paths written by more than one job: {path: [job names]}.
+        Paths are compared case-insensitively, as they would collide on
+        Windows and macOS drives.
+        """
+        by_path = {}
+        for entry in self.entries:
+            by_path.setdefault(_path_key(entry['output']), []).append(entry)
+        return {
+            entries[0]['output']: [e['name'] for e in entries]
+            for entries in by_path.values() if len(entries) > 1
+        }
+
+    def total_bytes(self):
+        return sum(entry['estimated_bytes'] for entry in self.entries)
+
+    def jobs(self):
+        """
+        Rebuilds the job dicts from the plan. Raises KeyError if an object
+        was deleted or renamed since the plan was made. With export profiles
+        a job has an entry per profile, but is only returned once.
+        """
+        jobs = []
+        seen = set()
+        for entry in self.entries:
+            key = (entry['name'], entry['directory'], tuple(entry['objects']))
+            if key in seen:
+                continue
+            seen.add(key)
+            objects = []
+            for name in entry['objects']:
+                obj = bpy.data.objects.get(name)
+                if obj is None:
+                    raise KeyError(name)
+                objects.append(obj)
+            jobs.append({'name': entry['name'], 'objects': objects, 'directory': Path(entry['directory'])})
+        return jobs
+
+    def print_summary(self):
+        collisions = self.collisions()
+        colliding = {_path_key(path) for path in collisions}
+        print(f"\n--- BATCH EXPORT PLAN: {len(self.entries)} file(s) ---")
+        for entry in self.entries:
+            flag = "  COLLISION" if _path_key(entry['output']) in colliding else ""
+            print(f"  {entry['output']}  ({len(entry['objects'])} objects, {entry['vertices']} verts, "
+                  f"{entry['triangles']} tris, ~{entry['estimated_bytes'] / 1024:.0f} KB){flag}")
+        if collisions:
+            print(f"\n{len(collisions)} output path(s) are written by more than one job:")
+            for path, names in collisions.items():
+                print(f"  {path}: {', '.join(names)}")
+        print(f"\nEstimated total size: {self.total_bytes() / 1e6:.1f} MB")
+        print("----------------------------\n")
+
+    def write(self):
+        path = self.base_dir / PLAN_NAME
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'scene': self.scene_name,
+                'jobs': self.entries,
+                'collisions': self.collisions(),
+                'estimated_bytes': self.total_bytes(),
+            }, f, indent=1)
+        return path
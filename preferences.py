@@ -1,6 +1,6 @@
 import bpy
 from bpy.types import AddonPreferences
-from bpy.props import EnumProperty, BoolProperty, StringProperty
+from bpy.props import EnumProperty, BoolProperty, StringProperty, IntProperty
 
 # Addon settings that are NOT specific to a .blend file
 class BatchExportPreferences(AddonPreferences):
@@ -28,10 +28,23 @@ class BatchExportPreferences(AddonPreferences):
         description="Make a copy of exported files in a secondary directory",
         default=False,
     )
+    worker_count: IntProperty(
+        name="Export Workers",
+        description="Number of background Blender processes that share the export jobs.\n1 exports everything in this Blender",
+        default=1, min=1, max=64,
+    )
+    mesh_cache_limit: IntProperty(
+        name="Mesh Cache Limit (MB)",
+        description="Most memory the evaluated mesh cache may use during an export.\nLeast recently used meshes are freed beyond this",
+        default=1024, min=0,
+    )
     def draw(self, context):
         self.layout.prop(self, "addon_location")
         self.layout.prop(self, "project_dir")
         self.layout.prop(self, "copy_on_export")
+        self.layout.prop(self, "worker_count")
+        self.layout.prop(self, "mesh_cache_limit")
+        self.layout.operator("batch_export.clear_lod_cache")
 
 registry = [
     BatchExportPreferences,
@@ -0,0 +1,143 @@
+import csv
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+PROFILE_NAME = ".sdbe_profile"
+
+# Phases in the order they happen during a job; used for the CSV columns.
+PHASES = (
+    'frame',
+    'fingerprint',
+    'visibility',
+    'apply_transform',
+    'transform',
+    'evaluate',
+    'lods',
+    'select',
+    'export',
+    'copy',
+)
+
+
+class ExportProfiler:
+    """
+    Collects per-phase timings for each export job. Phases are timed with
+    phase() around plain code, or timed() around a context manager, which
+    only counts the manager's own setup and teardown, not the nested body.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.rows = []
+        self.current = None
+        self._job_start = 0.0
+
+    def start_job(self, job, triangle_count):
+        self.current = {
+            'name': job['name'] if 'frame' not in job else f"{job['name']} (frame {job['frame']})",
+            'objects': len(job['objects']),
+            'triangles': triangle_count,
+            'output_bytes': 0,
+            'total': 0.0,
+            'phases': {},
+        }
+        self._job_start = time.perf_counter()
+
+    def end_job(self):
+        if self.current is None:
+            return
+        self.current['total'] = time.perf_counter() - self._job_start
+        self.rows.append(self.current)
+        self.current = None
+
+    def add_output(self, filepath):
+        """Counts another file written by the current job."""
+        if self.current is not None and filepath:
+            try:
+                self.current['output_bytes'] += os.path.getsize(filepath)
+            except OSError:
+                pass
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.current is not None:
+                phases = self.current['phases']
+                phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def timed(self, name, manager):
+        with self.phase(name):
+            value = manager.__enter__()
+        try:
+            yield value
+        except BaseException:
+            with self.phase(name):
+                if not manager.__exit__(*sys.exc_info()):
+                    raise
+        else:
+            with self.phase(name):
+                manager.__exit__(None, None, None)
+
+    def slowest(self, count):
+        return sorted(self.rows, key=lambda row: row['total'], reverse=True)[:count]
+
+    def write(self, directory):
+        """Writes the profile as JSON and CSV into `directory`. Returns the JSON path."""
+        base = Path(directory) / PROFILE_NAME
+        json_path = base.with_suffix('.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'phases': PHASES, 'jobs': self.rows}, f, indent=1)
+
+        with open(base.with_suffix('.csv'), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'objects', 'triangles', 'output_bytes', 'total'] + list(PHASES))
+            for row in self.rows:
+                writer.writerow(
+                    [row['name'], row['objects'], row['triangles'], row['output_bytes'], f"{row['total']:.6f}"]
+                    + [f"{row['phases'].get(phase, 0.0):.6f}" for phase in PHASES]
+                )
+        return json_path
+
+    def print_slowest(self, count):
+        rows = self.slowest(count)
+        if not rows:
+            return
+        print(f"\n--- BATCH EXPORT PROFILE: {len(rows)} slowest of {len(self.rows)} job(s) ---")
+        for row in rows:
+            phases = ", ".join(
+                f"{phase} {row['phases'][phase]:.3f}s" for phase in PHASES if row['phases'].get(phase)
+            )
+            print(f"  {row['total']:8.3f}s  {row['name']}  ({row['objects']} objects, "
+                  f"{row['triangles']} tris, {row['output_bytes']} bytes)  [{phases}]")
+        print("----------------------------\n")
+
+
+class NullProfiler:
+    """Stands in for ExportProfiler when profiling is off."""
+
+    enabled = False
+    rows = ()
+
+    def start_job(self, job, triangle_count):
+        pass
+
+    def end_job(self):
+        pass
+
+    def add_output(self, filepath):
+        pass
+
+    def phase(self, name):
+        return nullcontext()
+
+    def timed(self, name, manager):
+        return manager
@@ -46,6 +46,91 @@ def update_directory_relative(self, context):
         # Leave it alone (it will remain absolute or relative to .blend).
         pass
 
+def preset_enum(operator, preset_attr, description):
+    """An enum for choosing one of an operator's presets, stored by name in `preset_attr`."""
+    return EnumProperty(
+        name="Preset", options={'SKIP_SAVE'},
+        description=description,
+        items=lambda self, context: get_operator_presets(operator),
+        get=lambda self: get_preset_index(operator, getattr(self, preset_attr)),
+        set=lambda self, value: setattr(
+            self, preset_attr, preset_enum_items_refs[operator][value][0]),
+    )
+
+
+FILE_FORMAT_ITEMS = [
+    ("ABC", "Alembic (.abc)", "", 9),
+    ("USD", "Universal Scene Description (.usd/.usdc/.usda)", "", 2),
+    ("SVG", "Grease Pencil as SVG (.svg)", "", 10),
+    ("PDF", "Grease Pencil as PDF (.pdf)", "", 11),
+    ("OBJ", "Wavefront (.obj)", "", 7),
+    ("PLY", "Stanford (.ply)", "", 3),
+    ("STL", "STL (.stl)", "", 4),
+    ("FBX", "FBX (.fbx)", "", 5),
+    ("glTF", "glTF (.glb/.gltf)", "", 6),
+]
+
+USD_FORMAT_ITEMS = [
+    (".usd", "Plain (.usd)",
+     "Can be either binary or ASCII\nIn Blender this exports to binary", 1),
+    (".usdc", "Binary Crate (default) (.usdc)",
+     "Binary, fast, hard to edit", 2),
+    (".usda", "ASCII (.usda)", "ASCII Text, slow, easy to edit", 3),
+]
+
+ABC_PRESET_DESCRIPTION = "Use export settings from a preset.\n(Create in the export settings from the File > Export > Alembic (.abc))"
+USD_PRESET_DESCRIPTION = "Use export settings from a preset.\n(Create in the export settings from the File > Export > Universal Scene Description (.usd, .usdc, .usda))"
+OBJ_PRESET_DESCRIPTION = "Use export settings from a preset.\n(Create in the export settings from the File > Export > Wavefront (.obj))"
+FBX_PRESET_DESCRIPTION = "Use export settings from a preset.\n(Create in the export settings from the File > Export > FBX (.fbx))"
+GLTF_PRESET_DESCRIPTION = "Use export settings from a preset.\n(Create in the export settings from the File > Export > glTF (.glb/.gltf))"
+
+LOD_MODE_ITEMS = (
+    ('RATIO', "Ratios", "Decimate every object by the same factors"),
+    ('BUDGET', "Triangle Budgets", "Decimate each object down to a triangle count per LOD. "
+                                   "Objects with fewer triangles than a budget skip that LOD"),
+)
+
+RETRY_FAILED_ITEMS = (
+    ('NONE', "Don't Retry", "Only report the failed jobs"),
+    ('RETRY', "Retry", "Export the failed jobs again after the rest of the batch"),
+    ('RESET', "Retry with Fresh State", "Export the failed jobs again after the rest of the batch, "
+                                        "with the scene state restored and prepared again for only those jobs"),
+)
+
+LOD_MIN_REDUCTION_DESCRIPTION = (
+    "Skip LODs that would take off less than this share of the previous LOD's triangles,\n"
+    "as they cost export and draw time without saving much"
+)
+
+# Options an export profile sets in place of the scene's Batch Export settings.
+PROFILE_OPTIONS = (
+    'file_format',
+    'prefix',
+    'suffix',
+    'usd_format',
+    'ply_ascii',
+    'stl_ascii',
+    'abc_preset',
+    'usd_preset',
+    'obj_preset',
+    'fbx_preset',
+    'gltf_preset',
+    'apply_mods',
+    'create_lod',
+    'lod_count',
+    'lod_mode',
+    'lod1_ratio',
+    'lod2_ratio',
+    'lod3_ratio',
+    'lod4_ratio',
+    'lod1_budget',
+    'lod2_budget',
+    'lod3_budget',
+    'lod4_budget',
+    'lod_min_reduction',
+)
+
+
 class ExportObjectItem(PropertyGroup):
     object: PointerProperty(
         name="Object",
@@ -53,6 +138,103 @@ class ExportObjectItem(PropertyGroup):
     )
 
 
+# One output of a multi-target export: each job is exported once per
+# enabled profile, with the profile's format, naming and LOD options
+class ExportProfile(PropertyGroup):
+    name: StringProperty(name="Name", default="Profile")
+    enabled: BoolProperty(
+        name="Enabled", default=True,
+        description="Export this profile",
+    )
+    directory: StringProperty(
+        name="Sub-Directory",
+        description="Folder inside the export directory for this profile's files.\nLeave empty to export next to the other profiles",
+    )
+    prefix: StringProperty(
+        name="Prefix",
+        description=f"Text to put at the beginning of this profile's file names.\nSupports subdirectories with '{os.sep}' as separator.",
+    )
+    suffix: StringProperty(
+        name="Suffix",
+        description="Text to put at the end of this profile's file names",
+    )
+    file_format: EnumProperty(
+        name="Format",
+        description="Which file format to export to",
+        items=FILE_FORMAT_ITEMS,
+        default="glTF",
+    )
+    usd_format: EnumProperty(name="Format", items=USD_FORMAT_ITEMS, default=".usdc")
+    ply_ascii: BoolProperty(name="ASCII Format", default=False)
+    stl_ascii: BoolProperty(name="ASCII Format", default=False)
+
+    abc_preset: StringProperty(default='NO_PRESET')
+    abc_preset_enum: preset_enum('wm.alembic_export', 'abc_preset', ABC_PRESET_DESCRIPTION)
+    usd_preset: StringProperty(default='NO_PRESET')
+    usd_preset_enum: preset_enum('wm.usd_export', 'usd_preset', USD_PRESET_DESCRIPTION)
+    obj_preset: StringProperty(default='NO_PRESET')
+    obj_preset_enum: preset_enum('wm.obj_export', 'obj_preset', OBJ_PRESET_DESCRIPTION)
+    fbx_preset: StringProperty(default='NO_PRESET')
+    fbx_preset_enum: preset_enum('export_scene.fbx', 'fbx_preset', FBX_PRESET_DESCRIPTION)
+    gltf_preset: StringProperty(default='NO_PRESET')
+    gltf_preset_enum: preset_enum('export_scene.gltf', 'gltf_preset', GLTF_PRESET_DESCRIPTION)
+
+    apply_mods: BoolProperty(
+        name="Apply Modifiers",
+        description="Should the modifiers by applied onto the exported mesh?\nCan't export Shape Keys with this on",
+        default=True,
+    )
+    create_lod: BoolProperty(
+        name="Create LOD", default=False,
+        description="Export Levels of Details for game engines",
+    )
+    lod_count: IntProperty(
+        name="Number of LODs",
+        description="How many levels of detail to export",
+        default=4, min=1, max=4,
+    )
+    lod_mode: EnumProperty(
+        name="LOD Mode", items=LOD_MODE_ITEMS, default='RATIO',
+        description="How much each LOD is decimated",
+    )
+    lod1_ratio: FloatProperty(
+        name="LOD 1 Ratio", description="Decimate factor for LOD 1",
+        default=0.80, min=0.0, max=1.0, subtype="FACTOR"
+    )
+    lod2_ratio: FloatProperty(
+        name="LOD 2 Ratio", description="Decimate factor for LOD 2",
+        default=0.50, min=0.0, max=1.0, subtype="FACTOR"
+    )
+    lod3_ratio: FloatProperty(
+        name="LOD 3 Ratio", description="Decimate factor for LOD 3",
+        default=0.20, min=0.0, max=1.0, subtype="FACTOR"
+    )
+    lod4_ratio: FloatProperty(
+        name="LOD 4 Ratio", description="Decimate factor for LOD 4",
+        default=0.10, min=0.0, max=1.0, subtype="FACTOR"
+    )
+    lod1_budget: IntProperty(
+        name="LOD 1 Triangles", description="Triangle budget for LOD 1",
+        default=20000, min=1,
+    )
+    lod2_budget: IntProperty(
+        name="LOD 2 Triangles", description="Triangle budget for LOD 2",
+        default=5000, min=1,
+    )
+    lod3_budget: IntProperty(
+        name="LOD 3 Triangles", description="Triangle budget for LOD 3",
+        default=1500, min=1,
+    )
+    lod4_budget: IntProperty(
+        name="LOD 4 Triangles", description="Triangle budget for LOD 4",
+        default=500, min=1,
+    )
+    lod_min_reduction: FloatProperty(
+        name="Minimum Reduction", description=LOD_MIN_REDUCTION_DESCRIPTION,
+        default=0.25, min=0.0, max=0.95, subtype="FACTOR"
+    )
+
+
 # Groups together all the addon settings that are saved in each .blend file
 class BatchExportSettings(PropertyGroup):
 
@@ -75,6 +257,11 @@ class BatchExportSettings(PropertyGroup):
         subtype='DIR_PATH',
         #options={'PATH_SUPPORTS_BLEND_RELATIVE'},
     )
+    copy_use_hardlinks: BoolProperty(
+        name="Hardlink Copies",
+        description="When the copy directory is on the same drive, hardlink the exported files instead of copying them.\nA hardlink shares its contents with the exported file",
+        default=False,
+    )
     prefix: StringProperty(
         name="Prefix",
         description=f"Text to put at the beginning of all the exported file names.\nSupports subdirectories with '{os.sep}' as separator.",
@@ -83,22 +270,40 @@ class BatchExportSettings(PropertyGroup):
         name="Suffix",
         description="Text to put at the end of all the exported file names",
     )
+    incremental: BoolProperty(
+        name="Incremental",
+        description="Only export files whose objects or settings changed since the last export.\nA manifest of exported files is kept in the export directory",
+        default=False,
+    )
+    use_journal: BoolProperty(
+        name="Checkpoint Journal",
+        description="Write each exported file to a journal (.sdbe_journal.jsonl) as soon as it's written,\n"
+                    "so an export interrupted by a crash can be resumed. The journal is deleted when the export completes",
+        default=False,
+    )
+    resume_export: BoolProperty(
+        name="Resume",
+        description="Skip the jobs the interrupted export already wrote, if their files are unchanged",
+        default=False,
+    )
+    continue_on_error: BoolProperty(
+        name="Continue on Error",
+        description="Carry on with the rest of the batch when a job fails, and list the failed jobs at the end.\n"
+                    "Otherwise the export stops at the first error",
+        default=False,
+    )
+    retry_failed: EnumProperty(
+        name="Retry Failed",
+        description="What to do with the jobs that failed, once the rest of the batch is exported",
+        items=RETRY_FAILED_ITEMS,
+        default='RETRY',
+    )
 
     # Export Settings:
     file_format: EnumProperty(
         name="Format",
         description="Which file format to export to",
-        items=[
-            ("ABC", "Alembic (.abc)", "", 9),
-            ("USD", "Universal Scene Description (.usd/.usdc/.usda)", "", 2),
-            ("SVG", "Grease Pencil as SVG (.svg)", "", 10),
-            ("PDF", "Grease Pencil as PDF (.pdf)", "", 11),
-            ("OBJ", "Wavefront (.obj)", "", 7),
-            ("PLY", "Stanford (.ply)", "", 3),
-            ("STL", "STL (.stl)", "", 4),
-            ("FBX", "FBX (.fbx)", "", 5),
-            ("glTF", "glTF (.glb/.gltf)", "", 6),
-        ],
+        items=FILE_FORMAT_ITEMS,
         default="glTF",
     )
     mode: EnumProperty(
@@ -143,82 +348,49 @@ class BatchExportSettings(PropertyGroup):
     # Format specific options:
     usd_format: EnumProperty(
         name="Format",
-        items=[
-            (".usd", "Plain (.usd)",
-             "Can be either binary or ASCII\nIn Blender this exports to binary", 1),
-            (".usdc", "Binary Crate (default) (.usdc)",
-             "Binary, fast, hard to edit", 2),
-            (".usda", "ASCII (.usda)", "ASCII Text, slow, easy to edit", 3),
-        ],
+        items=USD_FORMAT_ITEMS,
         default=".usdc",
     )
     ply_ascii: BoolProperty(name="ASCII Format", default=False)
     stl_ascii: BoolProperty(name="ASCII Format", default=False)
 
+    # Export Profiles:
+    use_profiles: BoolProperty(
+        name="Export Profiles",
+        description="Export every job once per enabled profile, each with its own format, naming and LOD options.\nThe scene is prepared once per job for all profiles",
+        default=False,
+    )
+    profiles: CollectionProperty(type=ExportProfile)
+    profiles_index: IntProperty(name="Active Profile Index", default=0)
+
     # Presets: A string property for saving your option (without new presets changing your choice), and enum property for choosing
     abc_preset: StringProperty(default='NO_PRESET')
-    abc_preset_enum: EnumProperty(
-        name="Preset", options={'SKIP_SAVE'},
-        description="Use export settings from a preset.\n(Create in the export settings from the File > Export > Alembic (.abc))",
-        items=lambda self, context: get_operator_presets('wm.alembic_export'),
-        get=lambda self: get_preset_index(
-            'wm.alembic_export', self.abc_preset),
-        set=lambda self, value: setattr(
-            self, 'abc_preset', preset_enum_items_refs['wm.alembic_export'][value][0]),
-    )
+    abc_preset_enum: preset_enum('wm.alembic_export', 'abc_preset', ABC_PRESET_DESCRIPTION)
     dae_preset: StringProperty(default='NO_PRESET')
-    dae_preset_enum: EnumProperty(
-        name="Preset", options={'SKIP_SAVE'},
-        description="Use export settings from a preset.\n(Create in the export settings from the File > Export > Collada (.dae))",
-        items=lambda self, context: get_operator_presets('wm.collada_export'),
-        get=lambda self: get_preset_index(
-            'wm.collada_export', self.dae_preset),
-        set=lambda self, value: setattr(
-            self, 'dae_preset', preset_enum_items_refs['wm.collada_export'][value][0]),
+    dae_preset_enum: preset_enum(
+        'wm.collada_export', 'dae_preset',
+        "Use export settings from a preset.\n(Create in the export settings from the File > Export > Collada (.dae))",
     )
     usd_preset: StringProperty(default='NO_PRESET')
-    usd_preset_enum: EnumProperty(
-        name="Preset", options={'SKIP_SAVE'},
-        description="Use export settings from a preset.\n(Create in the export settings from the File > Export > Universal Scene Description (.usd, .usdc, .usda))",
-        items=lambda self, context: get_operator_presets('wm.usd_export'),
-        get=lambda self: get_preset_index('wm.usd_export', self.usd_preset),
-        set=lambda self, value: setattr(
-            self, 'usd_preset', preset_enum_items_refs['wm.usd_export'][value][0]),
-    )
+    usd_preset_enum: preset_enum('wm.usd_export', 'usd_preset', USD_PRESET_DESCRIPTION)
     obj_preset: StringProperty(default='NO_PRESET')
-    obj_preset_enum: EnumProperty(
-        name="Preset", options={'SKIP_SAVE'},
-        description="Use export settings from a preset.\n(Create in the export settings from the File > Export > Wavefront (.obj))",
-        items=lambda self, context: get_operator_presets('wm.obj_export'),
-        get=lambda self: get_preset_index('wm.obj_export', self.obj_preset),
-        set=lambda self, value: setattr(
-            self, 'obj_preset', preset_enum_items_refs['wm.obj_export'][value][0]),
-    )
+    obj_preset_enum: preset_enum('wm.obj_export', 'obj_preset', OBJ_PRESET_DESCRIPTION)
     fbx_preset: StringProperty(default='NO_PRESET')
-    fbx_preset_enum: EnumProperty(
-        name="Preset", options={'SKIP_SAVE'},
-        description="Use export settings from a preset.\n(Create in the export settings from the File > Export > FBX (.fbx))",
-        items=lambda self, context: get_operator_presets('export_scene.fbx'),
-        get=lambda self: get_preset_index('export_scene.fbx', self.fbx_preset),
-        set=lambda self, value: setattr(
-            self, 'fbx_preset', preset_enum_items_refs['export_scene.fbx'][value][0]),
-    )
+    fbx_preset_enum: preset_enum('export_scene.fbx', 'fbx_preset', FBX_PRESET_DESCRIPTION)
     gltf_preset: StringProperty(default='NO_PRESET')
-    gltf_preset_enum: EnumProperty(
-        name="Preset", options={'SKIP_SAVE'},
-        description="Use export settings from a preset.\n(Create in the export settings from the File > Export > glTF (.glb/.gltf))",
-        items=lambda self, context: get_operator_presets('export_scene.gltf'),
-        get=lambda self: get_preset_index(
-            'export_scene.gltf', self.gltf_preset),
-        set=lambda self, value: setattr(
-            self, 'gltf_preset', preset_enum_items_refs['export_scene.gltf'][value][0]),
-    )
+    gltf_preset_enum: preset_enum('export_scene.gltf', 'gltf_preset', GLTF_PRESET_DESCRIPTION)
 
     apply_mods: BoolProperty(
         name="Apply Modifiers",
         description="Should the modifiers by applied onto the exported mesh?\nCan't export Shape Keys with this on",
         default=True,
     )
+    frame_sequence: BoolProperty(
+        name="Frame Sequence",
+        description="Export every frame from Frame Start to Frame End into its own file, numbered by frame.\n"
+                    "Each frame is set and evaluated once, then all objects are exported for it",
+        default=False,
+    )
     frame_start: IntProperty(
         name="Frame Start",
         description="First frame to export",
@@ -275,6 +447,54 @@ class BatchExportSettings(PropertyGroup):
         description="When applying a negative scale, flip mesh normals so faces stay outward-facing",
     )
 
+    # Performance:
+    modal_export: BoolProperty(
+        name="Show Progress",
+        description="Export in small steps with a progress bar and time estimate in the header, so Blender stays responsive.\nPress Esc to cancel",
+        default=False,
+    )
+    prepare_once: BoolProperty(
+        name="Prepare Scene Once",
+        description="Unhide objects and bake transforms for all jobs at the start of the export, instead of for every job.\nFaster for many small jobs",
+        default=False,
+    )
+    use_sandbox: BoolProperty(
+        name="Sandbox Scene",
+        description="Export each job from a temporary scene holding only its objects, instead of changing selection and visibility in this scene.\nThe temporary scene is deleted after the export",
+        default=False,
+    )
+    cache_evaluated: BoolProperty(
+        name="Cache Evaluated Meshes",
+        description="Evaluate each object's modifiers once per export and reuse the result for every format, profile and LOD.\nUses more memory, up to the limit set in Preferences",
+        default=False,
+    )
+    dedupe_outputs: EnumProperty(
+        name="Reuse Identical Exports",
+        description="Export jobs that would give identical files only once (e.g. linked duplicates moved to the same place with Set Location).\nOnly for PLY and STL, which don't store object names",
+        items=[
+            ('OFF', "Off", "Export every job", 1),
+            ('COPY', "Copy", "Copy the first identical file", 2),
+            ('HARDLINK', "Hardlink", "Hardlink the first identical file. The files share their contents, so editing one changes all of them", 3),
+        ],
+        default='OFF',
+    )
+    use_direct_writer: BoolProperty(
+        name="Direct STL/PLY/OBJ Writer",
+        description="Write STL, PLY and OBJ files straight from the mesh data instead of through Blender's exporters, without selecting anything. Much faster for many small files.\n"
+                    "Objects the writer doesn't handle (curves, instancers, Geometry Nodes, color attributes, OBJ materials or presets) still use the exporter",
+        default=False,
+    )
+    write_profile: BoolProperty(
+        name="Write Profile",
+        description="Time each phase of every export job, and write the timings as JSON and CSV\n(.sdbe_profile) into the export directory",
+        default=False,
+    )
+    profile_top_n: IntProperty(
+        name="Slowest Jobs",
+        description="How many of the slowest jobs to list in the console",
+        default=10, min=0,
+    )
+
     # LOD Creation:
     create_lod: BoolProperty(
         name="Create LOD", default=False,
@@ -285,6 +505,27 @@ class BatchExportSettings(PropertyGroup):
         description="How many levels of detail to export",
         default=4, min=1, max=4,
     )
+    lod_cache: BoolProperty(
+        name="Cache LODs",
+        description="Keep decimated LOD meshes on disk and reuse them while the mesh and ratios stay the same.\nEach LOD is decimated from the previous one",
+        default=False,
+    )
+    lod_method: EnumProperty(
+        name="LOD Method",
+        description="How the LOD meshes are decimated",
+        items=(
+            ('DECIMATE', "Decimate Modifier", "Decimate each LOD with Blender's Decimate modifier during the export"),
+            ('NUMPY', "Background Simplifier", "Simplify the LODs with NumPy on background threads, ahead of the jobs being exported.\n"
+                                               "Skinned meshes still use the Decimate modifier"),
+        ),
+        default='DECIMATE',
+    )
+    lod_mode: EnumProperty(
+        name="LOD Mode",
+        description="How much each LOD is decimated",
+        items=LOD_MODE_ITEMS,
+        default='RATIO',
+    )
     lod1_ratio: FloatProperty(
         name="LOD 1 Ratio",
         description="Decimate factor for LOD 1",
@@ -305,8 +546,34 @@ class BatchExportSettings(PropertyGroup):
         description="Decimate factor for LOD 4",
         default=0.10, min=0.0, max=1.0, subtype="FACTOR"
     )
+    lod1_budget: IntProperty(
+        name="LOD 1 Triangles",
+        description="Triangle budget for LOD 1",
+        default=20000, min=1,
+    )
+    lod2_budget: IntProperty(
+        name="LOD 2 Triangles",
+        description="Triangle budget for LOD 2",
+        default=5000, min=1,
+    )
+    lod3_budget: IntProperty(
+        name="LOD 3 Triangles",
+        description="Triangle budget for LOD 3",
+        default=1500, min=1,
+    )
+    lod4_budget: IntProperty(
+        name="LOD 4 Triangles",
+        description="Triangle budget for LOD 4",
+        default=500, min=1,
+    )
+    lod_min_reduction: FloatProperty(
+        name="Minimum Reduction",
+        description=LOD_MIN_REDUCTION_DESCRIPTION,
+        default=0.25, min=0.0, max=0.95, subtype="FACTOR"
+    )
 
 registry = [
     ExportObjectItem,
+    ExportProfile,
     BatchExportSettings,
 ]
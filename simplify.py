@@ -0,0 +1,241 @@
+import numpy as np
+
+# Collapses that would turn a face's normal by more than this (as a cosine)
+# are not made, so the simplified surface doesn't fold over itself.
+MIN_NORMAL_COS = 0.2
+
+# Each pass collapses a set of edges that don't touch each other's faces,
+# picked in up to SELECTION_ROUNDS rounds. A pass takes off roughly a
+# quarter of the faces.
+MAX_PASSES = 64
+SELECTION_ROUNDS = 4
+
+# Order of the 10 unique entries of a symmetric 4x4 quadric, as index
+# pairs into the plane (a, b, c, d).
+_QUADRIC_TERMS = ((0, 0), (0, 1), (0, 2), (0, 3), (1, 1), (1, 2), (1, 3), (2, 2), (2, 3), (3, 3))
+
+
+def _face_normals(co, tris):
+    """Unnormalized face normals; their length is twice the face area."""
+    v0 = co[tris[:, 0]]
+    return np.cross(co[tris[:, 1]] - v0, co[tris[:, 2]] - v0)
+
+
+def _vertex_quadrics(co, tris):
+    """
+    The area weighted error quadric of each vertex: the sum of the squared
+    distance to the planes of its faces, as the 10 unique terms per vertex.
+    """
+    normals = _face_normals(co, tris)
+    lengths = np.linalg.norm(normals, axis=1)
+    unit = normals / np.where(lengths > 0, lengths, 1)[:, None]
+    planes = np.column_stack([unit, -(unit * co[tris[:, 0]]).sum(axis=1)])
+    weights = np.repeat(lengths * 0.5, 3)
+    corners = tris.ravel()
+    quadrics = np.empty((len(co), len(_QUADRIC_TERMS)))
+    for k, (i, j) in enumerate(_QUADRIC_TERMS):
+        terms = np.repeat(planes[:, i] * planes[:, j], 3)
+        quadrics[:, k] = np.bincount(corners, weights=terms * weights, minlength=len(co))
+    return quadrics
+
+
+def _quadric_error(quadrics, co):
+    """The error of each quadric at the matching position in `co`."""
+    x, y, z = co[:, 0], co[:, 1], co[:, 2]
+    monomials = (x * x, 2 * x * y, 2 * x * z, 2 * x, y * y, 2 * y * z, 2 * y, z * z, 2 * z, 1.0)
+    error = np.zeros(len(co))
+    for k, monomial in enumerate(monomials):
+        error += quadrics[:, k] * monomial
+    return error
+
+
+def _seam_safe(tris, wedges, edge_keys, count, a, b):
+    """
+    Which of the collapses of `a` onto `b` keep the corner attributes
+    intact: every wedge (set of corners sharing attributes, e.g. a UV
+    island side) at `a` must also be on a face of the edge a-b, so each
+    corner moved onto `b` can take the attributes of a corner of `b` on
+    its side. Vertices on a seam can then only move along the seam.
+    `edge_keys` are the sorted undirected edge keys of _collapse_pass(),
+    made with the vertex count `count`.
+    """
+    span = int(wedges.max()) + 1
+    if span == 1:
+        return np.ones(len(a), dtype=bool)
+
+    def edge_sides(start, end):
+        # The edge's index in edge_keys, and which of its ends `start` is
+        low, high = np.minimum(start, end), np.maximum(start, end)
+        return np.searchsorted(edge_keys, low.astype(np.int64) * count + high) * 2 + (start > end)
+
+    # Distinct wedges around each vertex
+    vertex_wedges = np.unique(tris.ravel().astype(np.int64) * span + wedges.ravel())
+    wedge_count = np.bincount(vertex_wedges // span, minlength=count)
+
+    # Distinct wedges of each end of an edge on the edge's faces
+    starts, ends = tris.ravel(), tris[:, [1, 2, 0]].ravel()
+    sides = np.concatenate([edge_sides(starts, ends), edge_sides(ends, starts)])
+    side_wedges = np.concatenate([wedges.ravel(), wedges[:, [1, 2, 0]].ravel()])
+    side_keys = np.unique(np.unique(sides * span + side_wedges) // span, return_counts=True)
+    side_count = np.zeros(len(edge_keys) * 2, dtype=np.int64)
+    side_count[side_keys[0]] = side_keys[1]
+
+    return side_count[edge_sides(a, b)] == wedge_count[a]
+
+
+def _collapse_pass(co, tris, quadrics, excess, wedges):
+    """
+    Picks a set of half-edge collapses (a vertex moved onto a neighbour)
+    that can all be made at once, cheapest first, removing about `excess`
+    faces at most. Returns the vertex remapping, or None if nothing can be
+    collapsed. The kept vertices' quadrics are updated in place.
+    """
+    count = len(co)
+    pairs = np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]])
+    pairs.sort(axis=1)
+    keys, uses = np.unique(pairs[:, 0].astype(np.int64) * count + pairs[:, 1], return_counts=True)
+    edges = np.column_stack([keys // count, keys % count])
+
+    # Vertices on open borders or non-manifold edges stay where they are
+    locked = np.zeros(count, dtype=bool)
+    locked[edges[uses != 2].ravel()] = True
+
+    # Candidate collapses in both directions, a onto b
+    a = np.concatenate([edges[:, 0], edges[:, 1]])
+    b = np.concatenate([edges[:, 1], edges[:, 0]])
+    movable = ~locked[a]
+    a, b = a[movable], b[movable]
+    movable = _seam_safe(tris, wedges, keys, count, a, b)
+    a, b = a[movable], b[movable]
+    if not len(a):
+        return None
+    cost = _quadric_error(quadrics[a], co[b]) + _quadric_error(quadrics, co)[b]
+
+    # The cheapest collapse of each vertex
+    order = np.lexsort((cost, a))
+    first = np.r_[True, a[order][1:] != a[order][:-1]]
+    best = order[first]
+    vertex_cost = np.full(count, np.inf)
+    vertex_cost[a[best]] = cost[best]
+    target = np.full(count, -1, dtype=np.int64)
+    target[a[best]] = b[best]
+
+    # Collapses that would flip a remaining face are left out
+    normals = _face_normals(co, tris)
+    for k in range(3):
+        moved = tris[:, k]
+        onto = target[moved]
+        check = (onto >= 0) & ~(tris == onto[:, None]).any(axis=1)
+        if not check.any():
+            continue
+        new_tris = tris[check].copy()
+        new_tris[:, k] = onto[check]
+        new_normals = _face_normals(co, new_tris)
+        old_normals = normals[check]
+        dots = (new_normals * old_normals).sum(axis=1)
+        limit = MIN_NORMAL_COS * np.linalg.norm(new_normals, axis=1) * np.linalg.norm(old_normals, axis=1)
+        vertex_cost[moved[check][dots <= limit]] = np.inf
+
+    # Collapse vertices cheaper than all their available neighbours, then
+    # take those neighbours out: no two collapsing vertices share a face,
+    # so they can all be made at once
+    rank = np.empty(count, dtype=np.int64)
+    rank[np.argsort(vertex_cost, kind='stable')] = np.arange(count)
+    start, end = edges[:, 0], edges[:, 1]
+    available = np.isfinite(vertex_cost)
+    picked = np.zeros(count, dtype=bool)
+    for _round in range(SELECTION_ROUNDS):
+        available_rank = np.where(available, rank, count)
+        neighbour_rank = np.full(count, count)
+        np.minimum.at(neighbour_rank, start, available_rank[end])
+        np.minimum.at(neighbour_rank, end, available_rank[start])
+        pick = available & (available_rank < neighbour_rank)
+        if not pick.any():
+            break
+        picked |= pick
+        available &= ~pick
+        available[end[pick[start]]] = False
+        available[start[pick[end]]] = False
+    chosen = np.flatnonzero(picked)
+    if not len(chosen):
+        return None
+
+    # An inner collapse removes two faces; don't go far past the target
+    chosen = chosen[np.argsort(vertex_cost[chosen], kind='stable')][:max(1, (excess + 1) // 2)]
+    np.add.at(quadrics, target[chosen], quadrics[chosen])
+    remap = np.arange(count)
+    remap[chosen] = target[chosen]
+    return remap
+
+
+def _moved_corners(tris, new_tris, corners, keep, wedges):
+    """
+    Gives each corner of a collapsed vertex `a` on a kept face the input
+    corner of its new vertex `b` from a removed face of the edge a-b, with
+    the same wedge at `a`, so its attributes (UVs) are those at `b` on the
+    same side of any seam. Returns the updated corners.
+    """
+    moved = tris != new_tris
+    wedge_span = int(wedges.max()) + 1
+
+    # The corners of `b` in the removed faces, by the wedge of `a` there
+    face, k = np.nonzero(moved & ~keep[:, None])
+    has_b = tris[face] == new_tris[face, k][:, None]
+    found = has_b.any(axis=1)
+    face, k = face[found], k[found]
+    b_corners = corners[face, has_b[found].argmax(axis=1)]
+    keys = tris[face, k] * wedge_span + wedges[face, k]
+    order = np.argsort(keys, kind='stable')
+    keys, b_corners = keys[order], b_corners[order]
+
+    face, k = np.nonzero(moved & keep[:, None])
+    if not len(face) or not len(keys):
+        return corners
+    wanted = tris[face, k] * wedge_span + wedges[face, k]
+    pos = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+    match = keys[pos] == wanted
+    corners = corners.copy()
+    corners[face[match], k[match]] = b_corners[pos[match]]
+    return corners
+
+
+def simplify(co, tris, ratio, wedges=None):
+    """
+    Reduces a triangle mesh to about `ratio` of its faces by quadric error
+    edge collapses, in vectorized passes. Vertices keep their positions.
+
+    Takes vertex positions (n, 3) and triangles (f, 3), and optionally a
+    wedge id per triangle corner (f, 3): corners of a vertex with the same
+    id share attributes (e.g. the same UV), different ids mark a seam.
+    Seam vertices only collapse along their seam, and a corner moved onto
+    another vertex takes that vertex's corner on the same side of the seam.
+
+    Returns the new positions, the new triangles, for each new triangle
+    the indices of its corners in the flattened input triangles (for
+    carrying over UVs and other corner attributes), and the input triangle
+    each new triangle comes from (for materials and other face attributes).
+    """
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+    tris = np.asarray(tris, dtype=np.int64).reshape(-1, 3)
+    if wedges is None:
+        wedges = np.zeros(tris.size, dtype=np.int64)
+    wedges = np.asarray(wedges, dtype=np.int64).ravel()
+    corners = np.arange(tris.size).reshape(-1, 3)
+    faces = np.arange(len(tris))
+    target = max(1, int(round(len(tris) * ratio)))
+    quadrics = _vertex_quadrics(co, tris)
+
+    for _pass in range(MAX_PASSES):
+        if len(tris) <= target:
+            break
+        remap = _collapse_pass(co, tris, quadrics, len(tris) - target, wedges[corners])
+        if remap is None:
+            break
+        new_tris = remap[tris]
+        keep = (new_tris[:, 0] != new_tris[:, 1]) & (new_tris[:, 1] != new_tris[:, 2]) & (new_tris[:, 2] != new_tris[:, 0])
+        corners = _moved_corners(tris, new_tris, corners, keep, wedges[corners])
+        tris, corners, faces = new_tris[keep], corners[keep], faces[keep]
+
+    # Drop the vertices no triangle uses any more
+    used, tris = np.unique(tris, return_inverse=True)
+    return co[used], tris.reshape(-1, 3), corners, faces
@@ -0,0 +1,48 @@
+"""
+The tests cover the modules that work outside Blender. They're imported
+as the `sdbe` package without running its __init__, which registers the
+add-on's UI with Blender.
+"""
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if 'sdbe' not in sys.modules:
+    package = types.ModuleType('sdbe')
+    package.__path__ = [str(ROOT)]
+    sys.modules['sdbe'] = package
+
+
+class _Types(types.ModuleType):
+    """bpy.types stand-in: every type is an empty class."""
+
+    def __getattr__(self, name):
+        cls = type(name, (), {})
+        setattr(self, name, cls)
+        return cls
+
+
+class _Matrix:
+    def __init__(self, rows=()):
+        self.rows = [tuple(row) for row in rows]
+
+
+# Outside Blender, bare stand-ins for bpy, mathutils and addon_utils are
+# enough to import the modules; the code under test doesn't call into them.
+try:
+    import bpy  # noqa: F401
+except ImportError:
+    bpy = types.ModuleType('bpy')
+    bpy.types = _Types('bpy.types')
+    bpy.app = types.SimpleNamespace(version_string="0.0.0")
+    sys.modules['bpy'] = bpy
+    sys.modules['bpy.types'] = bpy.types
+
+    mathutils = types.ModuleType('mathutils')
+    mathutils.Matrix = _Matrix
+    mathutils.Vector = tuple
+    sys.modules['mathutils'] = mathutils
+
+    sys.modules['addon_utils'] = types.ModuleType('addon_utils')
@@ -0,0 +1,28 @@
+import json
+
+from sdbe import cli
+
+
+def test_clean_run_succeeds():
+    assert cli.exit_code({'FINISHED'}, {'status': 'FINISHED', 'failures': []}) == cli.EXIT_OK
+
+
+def test_failed_jobs_give_partial_exit_code():
+    result = {'status': 'PARTIAL', 'failures': [["Cube", "Export failed"]]}
+    assert cli.exit_code({'FINISHED'}, result) == cli.EXIT_PARTIAL
+
+
+def test_cancelled_run_fails():
+    assert cli.exit_code({'CANCELLED'}, {}) == cli.EXIT_FAILED
+    assert cli.exit_code({'CANCELLED'}, {'failures': [["Cube", "Export failed"]]}) == cli.EXIT_FAILED
+
+
+def test_missing_result_counts_as_clean(tmp_path):
+    assert cli.read_result(tmp_path / "missing.json") == {}
+    assert cli.exit_code({'FINISHED'}, cli.read_result(tmp_path / "missing.json")) == cli.EXIT_OK
+
+
+def test_read_result(tmp_path):
+    path = tmp_path / "result.json"
+    path.write_text(json.dumps({'status': 'PARTIAL', 'failures': [["Cube", "boom"]]}))
+    assert cli.exit_code({'FINISHED'}, cli.read_result(path)) == cli.EXIT_PARTIAL
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from sdbe import copying
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "export" / "Cube.fbx"
+    path.parent.mkdir()
+    path.write_bytes(b"x" * 5000)
+    return path
+
+
+def test_copy_and_unchanged(source, tmp_path):
+    dst = tmp_path / "copies" / "sub" / "Cube.fbx"
+    assert copying.copy_file(source, dst) == copying.COPIED
+    assert dst.read_bytes() == source.read_bytes()
+    assert copying.copy_file(source, dst) == copying.UNCHANGED
+
+
+def test_changed_content_is_copied_again(source, tmp_path):
+    dst = tmp_path / "Cube.fbx"
+    copying.copy_file(source, dst)
+    # Same size, different content
+    source.write_bytes(b"y" * 5000)
+    assert copying.copy_file(source, dst) == copying.COPIED
+    assert dst.read_bytes() == b"y" * 5000
+
+
+def test_hardlink(source, tmp_path):
+    dst = tmp_path / "Cube.fbx"
+    assert copying.copy_file(source, dst, use_hardlinks=True) == copying.COPIED
+    assert os.path.samefile(source, dst)
+
+
+def test_hardlink_falls_back_to_copy(source, tmp_path, monkeypatch):
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+    monkeypatch.setattr(copying.os, 'link', no_link)
+    dst = tmp_path / "Cube.fbx"
+    assert copying.copy_file(source, dst, use_hardlinks=True) == copying.COPIED
+    assert not os.path.samefile(source, dst)
+    assert dst.read_bytes() == source.read_bytes()
+
+
+def test_plain_copy_fallback(source, tmp_path, monkeypatch):
+    # Neither a reflink nor copy_file_range works on this destination
+    monkeypatch.setattr(copying, '_reflink', lambda src, dst: False)
+    monkeypatch.setattr(copying, '_copy_range', lambda src, dst: False)
+    dst = tmp_path / "Cube.fbx"
+    assert copying.copy_file(source, dst) == copying.COPIED
+    assert dst.read_bytes() == source.read_bytes()
+
+
+def test_failed_copy_leaves_nothing_behind(source, tmp_path, monkeypatch):
+    def fail(src, dst):
+        with open(dst, 'wb') as f:
+            f.write(b"half")
+        raise OSError("disk full")
+    monkeypatch.setattr(copying, '_reflink', lambda src, dst: False)
+    monkeypatch.setattr(copying, '_copy_range', lambda src, dst: False)
+    monkeypatch.setattr(copying.shutil, 'copyfile', fail)
+    dst = tmp_path / "Cube.fbx"
+    with pytest.raises(OSError):
+        copying.copy_file(source, dst)
+    assert list(tmp_path.iterdir()) == [source.parent]
+
+
+def test_other_writers_temp_file_is_left_alone(source, tmp_path):
+    dst = tmp_path / "Cube.fbx"
+    other = tmp_path / "Cube.fbx.1.2.sdbe_tmp"
+    other.write_bytes(b"partial")
+    assert copying.copy_file(source, dst) == copying.COPIED
+    assert other.read_bytes() == b"partial"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Cube.fbx", other.name, "export"]
+
+
+def test_queue_reports_failures(source, tmp_path, capsys):
+    queue = copying.CopyQueue()
+    queue.submit(source, tmp_path / "a" / "Cube.fbx")
+    queue.submit(source, tmp_path / "b" / "Cube.fbx")
+    queue.submit(tmp_path / "missing.fbx", tmp_path / "c" / "missing.fbx")
+    copied, unchanged, failures = queue.wait()
+    assert (copied, unchanged) == (2, 0)
+    assert [dst for dst, _error in failures] == [str(tmp_path / "c" / "missing.fbx")]
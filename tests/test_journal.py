@@ -0,0 +1,95 @@
+import json
+import os
+
+from sdbe import manifest
+
+
+def write_file(path, content=b"data"):
+    path.write_bytes(content)
+    return path
+
+
+def journal_lines(directory):
+    return (directory / manifest.JOURNAL_NAME).read_text(encoding='utf-8').splitlines()
+
+
+def test_record_and_resume(tmp_path):
+    exported = write_file(tmp_path / "Cube.fbx")
+    journal = manifest.ExportJournal.open(tmp_path)
+    journal.record(exported, "fp1")
+    journal.close()
+
+    resumed = manifest.ExportJournal.open(tmp_path, resume=True)
+    assert resumed.is_done(exported, "fp1")
+    assert not resumed.is_done(exported, "fp2")
+    assert not resumed.is_done(tmp_path / "Other.fbx", "fp1")
+    resumed.close()
+
+
+def test_changed_file_is_not_done(tmp_path):
+    exported = write_file(tmp_path / "Cube.fbx")
+    journal = manifest.ExportJournal.open(tmp_path)
+    journal.record(exported, "fp1")
+    journal.close()
+
+    write_file(exported, b"different size")
+    resumed = manifest.ExportJournal.open(tmp_path, resume=True)
+    assert not resumed.is_done(exported, "fp1")
+    resumed.close()
+
+
+def test_new_run_discards_entries(tmp_path):
+    exported = write_file(tmp_path / "Cube.fbx")
+    journal = manifest.ExportJournal.open(tmp_path)
+    journal.record(exported, "fp1")
+    journal.close()
+
+    fresh = manifest.ExportJournal.open(tmp_path)
+    fresh.close()
+    assert journal_lines(tmp_path) == []
+    resumed = manifest.ExportJournal.open(tmp_path, resume=True)
+    assert not resumed.is_done(exported, "fp1")
+    resumed.close()
+
+
+def test_worker_appends_without_truncating(tmp_path):
+    first = write_file(tmp_path / "A.fbx")
+    second = write_file(tmp_path / "B.fbx")
+    parent = manifest.ExportJournal.open(tmp_path)
+    parent.record(first, "a")
+    worker = manifest.ExportJournal.open(tmp_path, truncate=False)
+    worker.record(second, "b")
+    worker.close()
+    parent.close()
+    assert [json.loads(line)['path'] for line in journal_lines(tmp_path)] == ["A.fbx", "B.fbx"]
+
+
+def test_truncated_last_line(tmp_path):
+    first = write_file(tmp_path / "A.fbx")
+    second = write_file(tmp_path / "B.fbx")
+    journal = manifest.ExportJournal.open(tmp_path)
+    journal.record(first, "a")
+    journal.close()
+    # A crash while writing the next line
+    with open(tmp_path / manifest.JOURNAL_NAME, 'a', encoding='utf-8') as f:
+        f.write('{"path": "B.fbx", "finger')
+
+    resumed = manifest.ExportJournal.open(tmp_path, resume=True)
+    assert resumed.is_done(first, "a")
+    assert not resumed.is_done(second, "b")
+    # Entries written after the resume aren't lost to the cut short line
+    resumed.record(second, "b")
+    resumed.close()
+
+    again = manifest.ExportJournal.open(tmp_path, resume=True)
+    assert again.is_done(first, "a")
+    assert again.is_done(second, "b")
+    again.close()
+
+
+def test_remove(tmp_path):
+    journal = manifest.ExportJournal.open(tmp_path)
+    journal.remove()
+    assert not os.path.exists(tmp_path / manifest.JOURNAL_NAME)
+    # Closing again is harmless
+    journal.close()
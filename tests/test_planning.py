@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from sdbe import planning
+
+
+def make_plan(outputs):
+    plan = planning.ExportPlan("Scene", "digest", "/tmp/export")
+    for name, output in outputs:
+        job = {'name': name, 'objects': [], 'directory': Path(output).parent}
+        plan.add(job, output, 10, 20, 300)
+    return plan
+
+
+def test_no_collisions():
+    plan = make_plan([("A", "/tmp/export/A.fbx"), ("B", "/tmp/export/B.fbx")])
+    assert plan.collisions() == {}
+
+
+def test_exact_collision():
+    plan = make_plan([("A", "/tmp/export/A.fbx"), ("A", "/tmp/export/A.fbx"), ("B", "/tmp/export/B.fbx")])
+    assert plan.collisions() == {"/tmp/export/A.fbx": ["A", "A"]}
+
+
+def test_case_collision():
+    plan = make_plan([("Cube", "/tmp/export/Cube.fbx"), ("cube", "/tmp/export/cube.fbx")])
+    assert plan.collisions() == {"/tmp/export/Cube.fbx": ["Cube", "cube"]}
+
+
+def test_summary_flags_every_colliding_entry(capsys):
+    plan = make_plan([
+        ("Cube", "/tmp/export/Cube.fbx"),
+        ("cube", "/tmp/export/cube.fbx"),
+        ("Sphere", "/tmp/export/Sphere.fbx"),
+    ])
+    plan.print_summary()
+    lines = capsys.readouterr().out.splitlines()
+    flagged = [line for line in lines if line.endswith("COLLISION")]
+    assert len(flagged) == 2
+    assert not any("Sphere.fbx" in line for line in flagged)
+
+
+def test_estimates():
+    assert planning.estimate_size('STL', 100, 10) == 84 + 50 * 10
+    assert planning.estimate_size('STL', 100, 10, ascii_format=True) == (84 + 50 * 10) * 4
+    plan = make_plan([("A", "/tmp/export/A.fbx"), ("B", "/tmp/export/B.fbx")])
+    assert plan.total_bytes() == 600
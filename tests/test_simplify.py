@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from sdbe import simplify
+
+
+def torus(rings=60, sides=40):
+    """A closed torus with UVs, split at the u = 0 and v = 0 seams."""
+    i, j = np.meshgrid(np.arange(rings), np.arange(sides), indexing='ij')
+    u, v = i / rings * 2 * np.pi, j / sides * 2 * np.pi
+    co = np.stack([(2 + 0.7 * np.cos(v)) * np.cos(u), (2 + 0.7 * np.cos(v)) * np.sin(u), 0.7 * np.sin(v)], -1)
+    co = co.reshape(-1, 3)
+
+    a, b = i.ravel(), j.ravel()
+    quad = [(a, b), (a + 1, b), (a + 1, b + 1), (a, b + 1)]
+    tris, uvs = [], []
+    for corners in ((0, 1, 2), (0, 2, 3)):
+        tris.append(np.stack([(quad[k][0] % rings) * sides + quad[k][1] % sides for k in corners], -1))
+        uvs.append(np.stack([np.stack([quad[k][0] / rings, quad[k][1] / sides], -1) for k in corners], 1))
+    tris = np.concatenate(tris)
+    uvs = np.concatenate(uvs).reshape(-1, 2)
+    wedges = np.unique(uvs, axis=0, return_inverse=True)[1].ravel()
+    return co, tris, uvs, wedges
+
+
+def edge_uses(tris):
+    edges = np.sort(np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]]), axis=1)
+    return np.unique(edges, axis=0, return_counts=True)[1]
+
+
+def source_vertices(co, new_co):
+    """The input vertex of each output vertex (positions aren't changed)."""
+    lookup = {tuple(p): index for index, p in enumerate(co)}
+    return np.array([lookup[tuple(p)] for p in new_co])
+
+
+@pytest.mark.parametrize('ratio', [0.5, 0.1])
+def test_reaches_target_and_stays_manifold(ratio):
+    co, tris, _uvs, wedges = torus()
+    new_co, new_tris, corners, faces = simplify.simplify(co, tris, ratio, wedges)
+    assert len(new_tris) <= len(tris) * ratio * 1.1
+    assert (edge_uses(new_tris) == 2).all()
+    assert corners.shape == new_tris.shape
+    assert faces.shape == (len(new_tris),)
+    assert faces.max() < len(tris)
+
+
+def test_corners_follow_their_vertex():
+    # A corner moved onto another vertex must take a corner of that vertex,
+    # or its UV would be stretched back to where the old vertex was
+    co, tris, _uvs, wedges = torus()
+    new_co, new_tris, corners, _faces = simplify.simplify(co, tris, 0.2, wedges)
+    vertices = source_vertices(co, new_co)
+    assert (vertices[new_tris].ravel() == tris.ravel()[corners.ravel()]).all()
+
+
+def test_seams_keep_their_uvs():
+    co, tris, uvs, wedges = torus()
+    new_co, new_tris, corners, _faces = simplify.simplify(co, tris, 0.2, wedges)
+    # Away from the seams every face's UVs are close together; a face
+    # taking a UV from the other side of a seam would span the whole map
+    new_uvs = uvs[corners.ravel()].reshape(-1, 3, 2)
+    spans = new_uvs.max(axis=1) - new_uvs.min(axis=1)
+    assert spans.max() < 0.5
+
+
+def test_without_wedges():
+    co, tris, _uvs, _wedges = torus()
+    new_co, new_tris, corners, _faces = simplify.simplify(co, tris, 0.25)
+    assert len(new_tris) <= len(tris) * 0.25 * 1.1
+    vertices = source_vertices(co, new_co)
+    assert (vertices[new_tris].ravel() == tris.ravel()[corners.ravel()]).all()
+
+
+def test_open_borders_stay():
+    # A flat grid: its border vertices are locked
+    n = 20
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    co = np.stack([i.ravel(), j.ravel(), np.zeros(n * n)], -1).astype(float)
+    a = (i[:-1, :-1] * n + j[:-1, :-1]).ravel()
+    tris = np.concatenate([np.stack([a, a + n, a + n + 1], -1), np.stack([a, a + n + 1, a + 1], -1)])
+    new_co, _new_tris, _corners, _faces = simplify.simplify(co, tris, 0.1)
+    border = (co[:, 0] == 0) | (co[:, 0] == n - 1) | (co[:, 1] == 0) | (co[:, 1] == n - 1)
+    kept = {tuple(p) for p in new_co}
+    assert all(tuple(p) in kept for p in co[border])
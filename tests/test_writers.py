@@ -0,0 +1,40 @@
+import struct
+
+import numpy as np
+
+from sdbe import writers
+
+
+def test_unique_rows_in_first_appearance_order():
+    rows = np.array([[3, 1], [0, 0], [3, 1], [2, 2], [0, 0]])
+    unique, index = writers._unique_rows(rows)
+    assert unique.tolist() == [[3, 1], [0, 0], [2, 2]]
+    assert index.tolist() == [0, 1, 0, 2, 1]
+    assert (unique[index] == rows).all()
+
+
+def test_reversed_loops():
+    loop_start = np.array([0, 3, 7])
+    loop_total = np.array([3, 4, 3])
+    order = writers._reversed_loops(loop_start, loop_total)
+    assert order.tolist() == [2, 1, 0, 6, 5, 4, 3, 9, 8, 7]
+
+
+def test_ply_face_list():
+    loop_vertices = np.array([0, 1, 2, 2, 3, 4, 5])
+    loop_totals = np.array([3, 4])
+    faces, offsets = writers._ply_face_list(loop_vertices, loop_totals)
+    assert faces.tolist() == [3, 0, 1, 2, 4, 2, 3, 4, 5]
+    assert offsets.tolist() == [0, 4]
+
+
+def test_ply_face_bytes():
+    loop_vertices = np.array([0, 1, 2, 2, 3, 4, 70000])
+    loop_totals = np.array([3, 4])
+    expected = struct.pack('<B3I', 3, 0, 1, 2) + struct.pack('<B4I', 4, 2, 3, 4, 70000)
+    assert writers._ply_face_bytes(loop_vertices, loop_totals).tobytes() == expected
+
+
+def test_ply_face_bytes_empty():
+    empty = np.empty(0, dtype=np.int64)
+    assert writers._ply_face_bytes(empty, empty).tobytes() == b""
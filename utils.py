@@ -1,5 +1,7 @@
 import bpy
+import ast
 import os
+from collections import deque
 
 # A Dictionary of operator_name: [list of preset EnumProperty item tuples].
 # Blender's doc warns that not keeping reference to enum props array can
@@ -7,11 +9,28 @@ import os
 # Also useful for the get_preset_index function.
 preset_enum_items_refs = {}
 
+# Preset directory listings: operator -> (((directory, mtime), ...), presets).
+# Enum item callbacks run on every redraw, so directories are only listed
+# again when one of them was modified (a preset was added or removed).
+preset_listing_cache = {}
+
 # Returns a list of tuples used for an EnumProperty's items (identifier, name, description)
 # identifier, and name are the file name of the preset without the file extension (.py)
 def get_operator_presets(operator):
-    presets = [('NO_PRESET', "(no preset)", "", 0)]
+    dir_state = []
     for d in bpy.utils.script_paths(subdir="presets/operator/" + operator):
+        try:
+            dir_state.append((d, os.stat(d).st_mtime_ns))
+        except OSError:
+            continue
+    dir_state = tuple(dir_state)
+
+    cached = preset_listing_cache.get(operator)
+    if cached and cached[0] == dir_state:
+        return cached[1]
+
+    presets = [('NO_PRESET', "(no preset)", "", 0)]
+    for d, _mtime in dir_state:
         for f in os.listdir(d):
             if not f.endswith(".py"):
                 continue
@@ -20,36 +39,96 @@ def get_operator_presets(operator):
     # Blender's doc warns that not keeping reference to enum props array can
     # cause crashs and weird issues:
     preset_enum_items_refs[operator] = presets
+    preset_listing_cache[operator] = (dir_state, presets)
     return presets
 
+# Parsed presets: (operator, preset) -> (filepath, mtime, options dict).
+# Entries are reused for as long as the preset file's mtime is unchanged.
+preset_cache = {}
+
+# Returns the path of an operator's preset file, or None if it doesn't exist.
+def find_operator_preset(operator, preset):
+    for d in bpy.utils.script_paths(subdir="presets/operator/" + operator):
+        fp = os.path.join(d, preset + ".py")
+        if os.path.isfile(fp):
+            return fp
+    return None
+
+# Reads the options out of a preset file. The values are parsed as python
+# literals, so a preset can't run arbitrary code.
+def parse_operator_preset(filepath):
+    options = {}
+    with open(filepath, 'r') as file:
+        for line in file:
+            # This assumes formatting of these files remains exactly the same
+            if not line.startswith("op."):
+                continue
+            key, sep, value = line.removeprefix("op.").partition(" = ")
+            if not sep:
+                continue
+            try:
+                options[key] = ast.literal_eval(value.strip())
+            except (ValueError, SyntaxError):
+                print(f"Ignoring preset option '{key}' in {filepath}: not a literal value")
+    return options
+
 # Returns a dictionary of options from an operator's preset.
 # When calling an operator's method, you can use ** before a dictionary
 # in the method's arguments to set the arguments from that dictionary's
 # key: value pairs. Example:
 # bpy.ops.category.operator(**options)
 def load_operator_preset(operator, preset):
-    options = {}
     if preset == 'NO_PRESET':
-        return options
+        return {}
 
-    for d in bpy.utils.script_paths(subdir="presets/operator/" + operator):
-        fp = "".join([d, "/", preset, ".py"])
-        if os.path.isfile(fp):  # Found the preset file
-            print("Using preset " + fp)
-            file = open(fp, 'r')
-            for line in file.readlines():
-                # This assumes formatting of these files remains exactly the same
-                if line.startswith("op."):
-                    line = line.removeprefix("op.")
-                    split = line.split(" = ")
-                    key = split[0]
-                    value = split[1]
-                    options[key] = eval(value)
-            file.close()
-            return options
-    # If it didn't find the preset, use empty options
-    # (the preset option should look blank if the file doesn't exist anyway)
-    return options
+    cached = preset_cache.get((operator, preset))
+    if cached:
+        fp, mtime, options = cached
+        try:
+            if os.stat(fp).st_mtime_ns == mtime:
+                return dict(options)
+        except OSError:
+            pass
+
+    fp = find_operator_preset(operator, preset)
+    if fp is None:
+        # If it didn't find the preset, use empty options
+        # (the preset option should look blank if the file doesn't exist anyway)
+        preset_cache.pop((operator, preset), None)
+        return {}
+
+    mtime = os.stat(fp).st_mtime_ns
+    options = parse_operator_preset(fp)
+    print("Using preset " + fp)
+    preset_cache[(operator, preset)] = (fp, mtime, options)
+    return dict(options)
+
+# Returns the number of triangles an object's mesh has once triangulated.
+# An n-sided polygon makes n - 2 triangles, so this is just the number of
+# face corners minus two per polygon, without looping over the faces.
+def triangle_count(obj):
+    if obj.type != 'MESH' or obj.data is None:
+        return 0
+    return mesh_triangle_count(obj.data)
+
+def mesh_triangle_count(mesh):
+    return len(mesh.loops) - 2 * len(mesh.polygons)
+
+# Returns whether an operator (e.g. 'export_scene.fbx') has a property.
+# Used to check for options newer Blender versions added to the exporters.
+# Exporters are registered by add-ons, so the answer is only cached once found.
+operator_property_cache = {}
+
+def operator_has_property(operator, prop):
+    key = (operator, prop)
+    if key not in operator_property_cache:
+        module, name = operator.split('.')
+        try:
+            props = getattr(getattr(bpy.ops, module), name).get_rna_type().properties
+        except (AttributeError, KeyError):
+            return False
+        operator_property_cache[key] = prop in props
+    return operator_property_cache[key]
 
 # Finds the index of a preset with preset_name and returns it
 # Useful for transferring the value of a saved preset (in a StringProperty)
@@ -60,88 +139,75 @@ def get_preset_index(operator, preset_name):
             return p
     return 0
 
-def find_parent_collection(target_coll):
+
+class SceneGraph:
     """
-    Finds the immediate parent collection of a given collection within the scene.
-    
-    Args:
-        target_coll (bpy.types.Collection): The collection whose parent is to be found.
-        
-    Returns:
-        bpy.types.Collection or None: The parent collection, or None if no parent
-        is found (e.g., orphaned, or already the scene collection).
+    A snapshot of a scene's collection tree and object parenting, built in
+    a single pass. Job generation reads everything from here instead of
+    searching bpy.data.collections for every hierarchy step.
     """
-    # Check if target is a direct child of the scene collection
-    scene_collection = bpy.context.scene.collection
-    if target_coll in scene_collection.children.values():
-        return scene_collection
-    
-    # Check all other collections
-    for coll in bpy.data.collections:
-        if coll != target_coll and target_coll in coll.children.values():
-            return coll
-            
-    return None
 
+    def __init__(self, scene):
+        self.scene_collection = scene.collection
 
-def get_collection_hierarchy(start_coll_name, top_level_coll_name="Scene Collection"):
-    """
-    Traces the hierarchy path from a start collection up to a specified top-level collection.
-    
-    Args:
-        start_coll_name (str): The name of the collection to start from.
-        top_level_coll_name (str, optional): The name of the target top-level collection.
-            Defaults to "Scene Collection".
-            
-    Returns:
-        str or None: Path string showing the collection hierarchy, or None if path not found.
-    """
-    # Get the starting collection
-    start_coll = bpy.data.collections.get(start_coll_name)
-    if not start_coll:
-        print(f"Error: Start collection '{start_coll_name}' not found.")
-        return None
-    
-    # Get the top-level collection
-    top_level_coll = None
-    if top_level_coll_name == "Scene Collection":
-        if bpy.context and bpy.context.scene:
-            top_level_coll = bpy.context.scene.collection
+        # Child collection -> parent collection. Breadth first, so a
+        # collection linked directly under the scene collection gets it as parent.
+        self.collection_parents = {}
+        queue = deque([scene.collection])
+        while queue:
+            coll = queue.popleft()
+            for child in coll.children:
+                if child not in self.collection_parents:
+                    self.collection_parents[child] = coll
+                    queue.append(child)
+
+        # Object -> the first collection it's linked to, ordered the way
+        # users_collection lists them: as in bpy.data.collections, with the
+        # scene collection last
+        order = {coll: index for index, coll in enumerate(bpy.data.collections)}
+        self.primary_collections = {}
+        for coll in sorted(self.collection_parents, key=lambda coll: order.get(coll, len(order))):
+            for obj in coll.objects:
+                self.primary_collections.setdefault(obj, coll)
+        for obj in scene.collection.objects:
+            self.primary_collections.setdefault(obj, scene.collection)
+
+        # Parent object -> direct children
+        self.object_children = {}
+        for obj in scene.objects:
+            if obj.parent is not None:
+                self.object_children.setdefault(obj.parent, []).append(obj)
+
+        self._hierarchy_paths = {}
+
+    def primary_collection(self, obj):
+        """The first collection of the scene an object is linked to, or None."""
+        return self.primary_collections.get(obj)
+
+    def hierarchy_path(self, coll):
+        """
+        Path of collection names from below the scene collection down to
+        `coll`, e.g. 'Props/Kitchen/Cups'. Collections that aren't part of
+        the scene's tree just give their own name.
+        """
+        if coll in self._hierarchy_paths:
+            return self._hierarchy_paths[coll]
+
+        parent = self.collection_parents.get(coll)
+        if parent is None or parent == self.scene_collection:
+            path = coll.name
         else:
-            print("Error: Cannot access Scene Collection. No active scene context.")
-            return None
-    else:
-        top_level_coll = bpy.data.collections.get(top_level_coll_name)
-        if not top_level_coll:
-            print(f"Error: Top-level collection '{top_level_coll_name}' not found.")
-            return None
-    
-    print(f"Checking hierarchy for collection: '{start_coll.name}' up to '{top_level_coll_name}'")
-    
-    # Special case: start collection is the target top-level collection
-    if start_coll == top_level_coll:
-        print(f"'{start_coll.name}' is the specified top-level collection.")
-        return start_coll.name
-    
-    # Trace the path up the hierarchy
-    path = [start_coll.name]
-    current_coll = start_coll
-    
-    while current_coll != top_level_coll:
-        parent_coll = find_parent_collection(current_coll)
-        
-        if not parent_coll:
-            print(f"No parent found for '{current_coll.name}'. Hierarchy is incomplete.")
-            return None
-        
-        if parent_coll == top_level_coll:
-            hierarchy_path = os.path.join(*reversed(path))
-            print(f"Hierarchy path found: {hierarchy_path}")
-            return hierarchy_path
-        
-        path.append(parent_coll.name)
-            
-        current_coll = parent_coll
-    
-    # This should not be reached if logic is correct
-    return None
\ No newline at end of file
+            path = os.path.join(self.hierarchy_path(parent), coll.name)
+        self._hierarchy_paths[coll] = path
+        return path
+
+    def descendants(self, obj, object_set):
+        """All objects parented below `obj` (at any depth) that are in `object_set`."""
+        found = []
+        stack = list(reversed(self.object_children.get(obj, [])))
+        while stack:
+            child = stack.pop()
+            if child in object_set:
+                found.append(child)
+            stack.extend(reversed(self.object_children.get(child, [])))
+        return found
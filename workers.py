@@ -0,0 +1,96 @@
+import bpy
+import json
+import os
+import subprocess
+import time
+
+# Python run by each worker. The add-on is normally enabled from the user's
+# preferences, but make sure of it in case preferences weren't saved.
+WORKER_EXPR = """\
+import bpy, addon_utils
+if {package!r} not in bpy.context.preferences.addons:
+    addon_utils.enable({package!r}, default_set=False)
+bpy.ops.export_mesh.batch(**{kwargs!r})
+"""
+
+
+def save_snapshot(directory):
+    """
+    Saves a copy of the current .blend for the workers to load.
+    The open file, its path and its dirty state are left untouched.
+    """
+    snapshot = os.path.join(directory, "snapshot.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True, check_existing=False)
+    return snapshot
+
+
+def worker_command(snapshot, package, kwargs):
+    """Returns the command line for a headless Blender running one shard."""
+    return [
+        bpy.app.binary_path,
+        "--background", snapshot,
+        "--python-exit-code", "1",
+        "--python-expr", WORKER_EXPR.format(package=package, kwargs=kwargs),
+    ]
+
+
+def run_workers(snapshot, package, shard_kwargs, directory):
+    """
+    Starts one background Blender per entry in `shard_kwargs` (keyword
+    arguments for the batch export operator) and waits for all of them.
+    Returns one result dict per shard, in order. A shard that crashed or
+    didn't write a result gets a result with an 'error' entry.
+    """
+    workers = []
+    for i, kwargs in enumerate(shard_kwargs):
+        kwargs = dict(kwargs, result_path=os.path.join(directory, f"result_{i}.json"))
+        log_path = os.path.join(directory, f"worker_{i}.log")
+        log = open(log_path, 'w', encoding='utf-8')
+        proc = subprocess.Popen(
+            worker_command(snapshot, package, kwargs),
+            stdout=log, stderr=subprocess.STDOUT,
+        )
+        workers.append((proc, log, log_path, kwargs['result_path']))
+    print(f"Started {len(workers)} export workers")
+
+    results = [None] * len(workers)
+    pending = set(range(len(workers)))
+    while pending:
+        for i in list(pending):
+            proc, log, log_path, result_path = workers[i]
+            if proc.poll() is None:
+                continue
+            pending.discard(i)
+            log.close()
+            results[i] = _read_result(proc.returncode, log_path, result_path)
+            print(f"Export worker {i + 1}/{len(workers)} finished (exit code {proc.returncode})")
+        if pending:
+            time.sleep(0.1)
+    return results
+
+
+def _read_result(returncode, log_path, result_path):
+    result = None
+    try:
+        with open(result_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if result is None or returncode != 0:
+        result = result or {}
+        result.setdefault('error', f"Worker exited with code {returncode} without a result")
+        # Show the end of the worker's output so the failure can be diagnosed
+        try:
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                tail = f.readlines()[-20:]
+            print(f"--- Export worker log ({log_path}) ---")
+            print("".join(tail))
+        except OSError:
+            pass
+    return result
+
+
+def write_result(result_path, result):
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=1)
@@ -0,0 +1,359 @@
+import bpy
+import struct
+from contextlib import contextmanager
+
+import numpy as np
+from mathutils import Matrix
+
+# Formats the built-in writers can write
+WRITTEN_FORMATS = {'STL', 'PLY', 'OBJ'}
+
+# Object types the exporters skip, so the writers can skip them too
+NON_GEOMETRY_TYPES = {'EMPTY', 'LIGHT', 'LIGHT_PROBE', 'CAMERA', 'SPEAKER', 'ARMATURE'}
+
+# The OBJ exporter's default axes: -Z forward, Y up
+OBJ_AXIS_CONVERSION = Matrix((
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, -1.0, 0.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+))
+
+# Rows per formatted chunk when writing text formats
+TEXT_CHUNK_ROWS = 65536
+
+STL_RECORD = np.dtype([('normal', '<f4', 3), ('vertices', '<f4', (3, 3)), ('attributes', '<u2')])
+
+
+def supports(obj, file_format):
+    """
+    True if the writer for `file_format` gives the same result as Blender's
+    exporter for this object. Anything the writers don't handle (curves,
+    instancers, geometry nodes that could make instances, color and custom
+    attributes, OBJ materials) goes through the exporter instead.
+    """
+    if obj.type in NON_GEOMETRY_TYPES:
+        return True
+    if obj.type != 'MESH' or obj.data is None:
+        return False
+    if obj.is_instancer or obj.particle_systems:
+        return False
+    if any(mod.type == 'NODES' and mod.show_viewport for mod in obj.modifiers):
+        return False
+    mesh = obj.data
+    if file_format == 'PLY':
+        if mesh.color_attributes:
+            return False
+        if any(attr.domain == 'POINT' and not attr.is_internal and attr.name != 'position' for attr in mesh.attributes):
+            return False
+    elif file_format == 'OBJ':
+        if any(slot.material for slot in obj.material_slots):
+            return False
+    return True
+
+
+def _get(collection, attr, dtype, width=1):
+    arr = np.empty(len(collection) * width, dtype=dtype)
+    if len(arr):
+        collection.foreach_get(attr, arr)
+    return arr
+
+
+@contextmanager
+def _object_meshes(objects, depsgraph, apply_modifiers):
+    """
+    Yields (object, mesh, world matrix) for the geometry objects, with the
+    modifiers applied or not. The temporary meshes are freed afterwards.
+    """
+    meshes = []
+    try:
+        for obj in objects:
+            if obj.type != 'MESH':
+                continue
+            obj_eval = obj.evaluated_get(depsgraph)
+            source = obj_eval if apply_modifiers else obj
+            mesh = source.to_mesh()
+            meshes.append((source, obj, mesh, obj_eval.matrix_world.copy()))
+        yield [(obj, mesh, matrix) for _source, obj, mesh, matrix in meshes]
+    finally:
+        for source, _obj, _mesh, _matrix in meshes:
+            source.to_mesh_clear()
+
+
+def _transform(co, matrix):
+    """Applies a 4x4 matrix to (n, 3) positions."""
+    m = np.array(matrix, dtype=np.float64)
+    return co @ m[:3, :3].T + m[:3, 3]
+
+
+def _mirrored(matrix):
+    return matrix.to_3x3().determinant() < 0
+
+
+def _unique_rows(rows):
+    """Unique rows in order of first appearance, and the index of each input row's unique row."""
+    _unique, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return rows[first[order]], rank[inverse.ravel()]
+
+
+def _reversed_loops(loop_start, loop_total):
+    """The loop order with every polygon's loops reversed (for mirrored objects)."""
+    offset = np.arange(loop_total.sum()) - np.repeat(loop_start, loop_total)
+    return np.repeat(loop_start + loop_total - 1, loop_total) - offset
+
+
+def _format_rows(f, line, values, columns):
+    """Writes `values` as text, `columns` per line formatted with `line`, in chunks."""
+    values = values.reshape(-1, columns)
+    for start in range(0, len(values), TEXT_CHUNK_ROWS):
+        chunk = values[start:start + TEXT_CHUNK_ROWS]
+        f.write((line * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+# ---------------------------------------------------------------------------
+# STL
+# ---------------------------------------------------------------------------
+
+def _triangles(objects, depsgraph, apply_modifiers):
+    """All triangles of the objects in world space, as a (t, 3, 3) array."""
+    parts = []
+    with _object_meshes(objects, depsgraph, apply_modifiers) as meshes:
+        for _obj, mesh, matrix in meshes:
+            mesh.calc_loop_triangles()
+            co = _transform(_get(mesh.vertices, 'co', np.float32, 3).reshape(-1, 3), matrix)
+            tris = _get(mesh.loop_triangles, 'vertices', np.int32, 3).reshape(-1, 3)
+            if _mirrored(matrix):
+                tris = tris[:, ::-1]
+            parts.append(co[tris])
+    if not parts:
+        return np.empty((0, 3, 3))
+    return np.concatenate(parts)
+
+
+def _triangle_normals(triangles):
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    return normals / np.where(lengths > 0, lengths, 1)[:, None]
+
+
+def write_stl(filepath, objects, depsgraph, apply_modifiers=True, ascii_format=False):
+    """Writes the objects' triangles as one binary or ASCII STL file."""
+    triangles = _triangles(objects, depsgraph, apply_modifiers)
+    normals = _triangle_normals(triangles)
+
+    if ascii_format:
+        facet = (
+            "facet normal %.9g %.9g %.9g\n"
+            " outer loop\n"
+            "  vertex %.9g %.9g %.9g\n"
+            "  vertex %.9g %.9g %.9g\n"
+            "  vertex %.9g %.9g %.9g\n"
+            " endloop\n"
+            "endfacet\n"
+        )
+        values = np.concatenate([normals, triangles.reshape(-1, 9)], axis=1).astype(np.float32)
+        with open(filepath, 'w', encoding='ascii', newline='\n') as f:
+            f.write("solid \n")
+            _format_rows(f, facet, values, 12)
+            f.write("endsolid \n")
+        return
+
+    records = np.zeros(len(triangles), dtype=STL_RECORD)
+    records['normal'] = normals
+    records['vertices'] = triangles
+    with open(filepath, 'wb') as f:
+        f.write(bytes(80) + struct.pack('<I', len(records)) + records.tobytes())
+
+
+# ---------------------------------------------------------------------------
+# PLY
+# ---------------------------------------------------------------------------
+
+def _ply_data(objects, depsgraph, apply_modifiers):
+    """
+    Vertices (positions and, if any object has UVs, their active UVs) and
+    polygons of the objects. As in Blender's exporter, vertices are split
+    where their UVs differ.
+    """
+    positions, uvs, loop_vertices, loop_totals = [], [], [], []
+    has_uv = False
+    offset = 0
+    with _object_meshes(objects, depsgraph, apply_modifiers) as meshes:
+        for _obj, mesh, matrix in meshes:
+            co = _transform(_get(mesh.vertices, 'co', np.float32, 3).reshape(-1, 3), matrix)
+            vertex_index = _get(mesh.loops, 'vertex_index', np.int32)
+            loop_start = _get(mesh.polygons, 'loop_start', np.int32)
+            loop_total = _get(mesh.polygons, 'loop_total', np.int32)
+            if _mirrored(matrix):
+                vertex_index = vertex_index[_reversed_loops(loop_start, loop_total)]
+
+            uv_layer = mesh.uv_layers.active
+            if uv_layer is not None:
+                has_uv = True
+                uv = _get(uv_layer.uv, 'vector', np.float32, 2).reshape(-1, 2)
+                if _mirrored(matrix):
+                    uv = uv[_reversed_loops(loop_start, loop_total)]
+            else:
+                uv = np.zeros((len(vertex_index), 2), dtype=np.float32)
+            # Loose vertices are kept, with a zero UV
+            loose = np.setdiff1d(np.arange(len(co)), vertex_index)
+            keys = np.column_stack([
+                np.concatenate([vertex_index, loose]).astype(np.float64),
+                np.concatenate([uv, np.zeros((len(loose), 2), dtype=np.float32)]),
+            ])
+            # Sorted by vertex, as the exporter writes them
+            unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            positions.append(co[unique[:, 0].astype(np.int64)])
+            uvs.append(unique[:, 1:])
+            loop_vertices.append(inverse[:len(vertex_index)] + offset)
+            loop_totals.append(loop_total)
+            offset += len(unique)
+
+    if not positions:
+        return np.empty((0, 3)), None, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return (
+        np.concatenate(positions),
+        np.concatenate(uvs) if has_uv else None,
+        np.concatenate(loop_vertices),
+        np.concatenate(loop_totals),
+    )
+
+
+def _ply_face_list(loop_vertices, loop_totals):
+    """
+    The PLY face list as one array, each face its vertex count followed by
+    its vertex indices, and the position of each face in it.
+    """
+    face_offsets = np.cumsum(loop_totals) - loop_totals + np.arange(len(loop_totals))
+    is_count = np.zeros(len(loop_vertices) + len(loop_totals), dtype=bool)
+    is_count[face_offsets] = True
+    faces = np.empty(len(is_count), dtype=np.int64)
+    faces[is_count] = loop_totals
+    faces[~is_count] = loop_vertices
+    return faces, face_offsets
+
+
+def _ply_face_bytes(loop_vertices, loop_totals):
+    """The binary PLY face list: a uchar count and uint indices per face."""
+    faces, face_offsets = _ply_face_list(loop_vertices, loop_totals)
+    is_count = np.zeros(len(faces), dtype=bool)
+    is_count[face_offsets] = True
+    # Counts are single bytes, indices four: build the face list byte by byte
+    sizes = np.where(is_count, 1, 4)
+    starts = np.cumsum(sizes) - sizes
+    face_bytes = np.empty(int(sizes.sum()), dtype=np.uint8)
+    face_bytes[starts[is_count]] = loop_totals.astype(np.uint8)
+    index_bytes = loop_vertices.astype('<u4').view(np.uint8).reshape(-1, 4)
+    face_bytes[starts[~is_count][:, None] + np.arange(4)] = index_bytes
+    return face_bytes
+
+
+def write_ply(filepath, objects, depsgraph, apply_modifiers=True, ascii_format=False):
+    """Writes the objects as one binary or ASCII PLY file, with UVs if they have any."""
+    positions, uvs, loop_vertices, loop_totals = _ply_data(objects, depsgraph, apply_modifiers)
+
+    header = [
+        "ply",
+        "format ascii 1.0" if ascii_format else "format binary_little_endian 1.0",
+        f"comment Created in Blender version {bpy.app.version_string}",
+        f"element vertex {len(positions)}",
+        "property float x",
+        "property float y",
+        "property float z",
+    ]
+    if uvs is not None:
+        header += ["property float s", "property float t"]
+    header += [
+        f"element face {len(loop_totals)}",
+        "property list uchar uint vertex_indices",
+        "end_header",
+    ]
+    vertices = positions if uvs is None else np.concatenate([positions, uvs], axis=1)
+    vertices = vertices.astype(np.float32)
+
+    if ascii_format:
+        faces, face_offsets = _ply_face_list(loop_vertices, loop_totals)
+        with open(filepath, 'w', encoding='ascii', newline='\n') as f:
+            f.write("\n".join(header) + "\n")
+            columns = vertices.shape[1]
+            _format_rows(f, " ".join(["%.9g"] * columns) + "\n", vertices, columns)
+            counts = loop_totals.tolist()
+            for start in range(0, len(counts), TEXT_CHUNK_ROWS):
+                chunk = counts[start:start + TEXT_CHUNK_ROWS]
+                line = "".join(" ".join(["%d"] * (n + 1)) + "\n" for n in chunk)
+                begin = face_offsets[start]
+                end = face_offsets[start + len(chunk)] if start + len(chunk) < len(counts) else len(faces)
+                f.write(line % tuple(faces[begin:end].tolist()))
+        return
+
+    face_bytes = _ply_face_bytes(loop_vertices, loop_totals)
+    with open(filepath, 'wb') as f:
+        f.write(("\n".join(header) + "\n").encode('ascii') + vertices.astype('<f4').tobytes() + face_bytes.tobytes())
+
+
+# ---------------------------------------------------------------------------
+# OBJ
+# ---------------------------------------------------------------------------
+
+def write_obj(filepath, objects, depsgraph, apply_modifiers=True):
+    """
+    Writes the objects as an OBJ file with the exporter's default options
+    (Y up, UVs, normals, no materials), one object at a time.
+    """
+    offsets = np.zeros(3, dtype=np.int64)  # v, vt, vn written so far
+    with open(filepath, 'w', encoding='utf-8', newline='\n') as f, \
+            _object_meshes(objects, depsgraph, apply_modifiers) as meshes:
+        f.write(f"# Blender {bpy.app.version_string}\n# www.blender.org\n")
+        for obj, mesh, matrix in meshes:
+            matrix = OBJ_AXIS_CONVERSION @ matrix
+            co = _transform(_get(mesh.vertices, 'co', np.float32, 3).reshape(-1, 3), matrix)
+            vertex_index = _get(mesh.loops, 'vertex_index', np.int32)
+            loop_start = _get(mesh.polygons, 'loop_start', np.int32)
+            loop_total = _get(mesh.polygons, 'loop_total', np.int32)
+            use_smooth = _get(mesh.polygons, 'use_smooth', bool)
+            loop_order = _reversed_loops(loop_start, loop_total) if _mirrored(matrix) else slice(None)
+
+            normals = _get(mesh.corner_normals, 'vector', np.float32, 3).reshape(-1, 3)
+            normals = normals @ np.array(matrix.to_3x3().inverted_safe().transposed(), dtype=np.float64).T
+            lengths = np.linalg.norm(normals, axis=1)
+            normals /= np.where(lengths > 0, lengths, 1)[:, None]
+            normals, normal_index = _unique_rows(np.round(normals[loop_order], 4))
+
+            columns = [vertex_index[loop_order] + offsets[0] + 1]
+            f.write(f"o {obj.name}\n")
+            _format_rows(f, "v %.6f %.6f %.6f\n", co, 3)
+            uv_layer = mesh.uv_layers.active
+            if uv_layer is not None:
+                uv = _get(uv_layer.uv, 'vector', np.float32, 2).reshape(-1, 2)[loop_order]
+                uv, uv_index = _unique_rows(np.round(uv.astype(np.float64), 6))
+                _format_rows(f, "vt %.6f %.6f\n", uv, 2)
+                columns.append(uv_index + offsets[1] + 1)
+                offsets[1] += len(uv)
+            _format_rows(f, "vn %.4f %.4f %.4f\n", normals, 3)
+            columns.append(normal_index + offsets[2] + 1)
+            corner = "%d/%d/%d" if len(columns) == 3 else "%d//%d"
+            corners = np.column_stack(columns)
+
+            # Smooth groups are written where the shading changes, as the exporter does
+            counts = loop_total.tolist()
+            smooth = use_smooth.tolist()
+            values = corners.ravel().tolist()
+            last_smooth = None
+            position = 0
+            for start in range(0, len(counts), TEXT_CHUNK_ROWS):
+                lines = []
+                for n, is_smooth in zip(counts[start:start + TEXT_CHUNK_ROWS], smooth[start:start + TEXT_CHUNK_ROWS]):
+                    if is_smooth != last_smooth:
+                        lines.append("s 1\n" if is_smooth else "s 0\n")
+                        last_smooth = is_smooth
+                    lines.append("f " + " ".join([corner] * n) + "\n")
+                end = position + len(columns) * sum(counts[start:start + TEXT_CHUNK_ROWS])
+                f.write("".join(lines) % tuple(values[position:end]))
+                position = end
+
+            offsets[0] += len(co)
+            offsets[2] += len(normals)